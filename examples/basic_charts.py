@@ -22,8 +22,9 @@ def create_sample_ohlcv(n: int = 252) -> pl.DataFrame:
     prices = 100 * np.exp(np.cumsum(returns))
 
     # Generate OHLC from close prices
-    opens = np.roll(prices, 1)
+    opens = np.empty_like(prices)
     opens[0] = prices[0]
+    opens[1:] = prices[:-1]
     highs = np.maximum(prices, opens) * (1 + np.abs(np.random.randn(n)) * 0.01)
     lows = np.minimum(prices, opens) * (1 - np.abs(np.random.randn(n)) * 0.01)
 
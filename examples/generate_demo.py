@@ -22,8 +22,9 @@ def create_ohlcv_data(n: int = 252, seed: int = 42) -> pl.DataFrame:
     returns = np.random.randn(n) * 0.02 + 0.0003
     prices = 100 * np.exp(np.cumsum(returns))
 
-    opens = np.roll(prices, 1)
+    opens = np.empty_like(prices)
     opens[0] = prices[0]
+    opens[1:] = prices[:-1]
     highs = np.maximum(prices, opens) * (1 + np.abs(np.random.randn(n)) * 0.01)
     lows = np.minimum(prices, opens) * (1 - np.abs(np.random.randn(n)) * 0.01)
     volumes = np.random.randint(100000, 1000000, n) * (1 + np.abs(returns) * 50)
@@ -537,6 +538,18 @@ def main():
                     ...config.options
                 }});
 
+                function toRows(columns) {{
+                    const keys = Object.keys(columns);
+                    const n = keys.length ? columns[keys[0]].length : 0;
+                    const rows = new Array(n);
+                    for (let i = 0; i < n; i++) {{
+                        const row = {{}};
+                        for (let k = 0; k < keys.length; k++) row[keys[k]] = columns[keys[k]][i];
+                        rows[i] = row;
+                    }}
+                    return rows;
+                }}
+
                 const seriesMap = {{}};
                 config.series.forEach(seriesConfig => {{
                     let series;
@@ -556,7 +569,7 @@ def main():
                         default:
                             return;
                     }}
-                    series.setData(seriesConfig.data);
+                    series.setData(toRows(seriesConfig.data));
                     seriesMap[seriesConfig.id] = series;
                 }});
 
@@ -43,6 +43,11 @@ setup(
         "numpy>=1.21.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.8.0",
+            "numba>=0.57.0",
+            "xxhash>=3.0.0",
+        ],
         "jupyter": [
             "ipywidgets>=8.0.0",
             "jupyterlab>=4.0.0",
@@ -57,6 +62,9 @@ setup(
         "all": [
             "ipywidgets>=8.0.0",
             "jupyterlab>=4.0.0",
+            "orjson>=3.8.0",
+            "numba>=0.57.0",
+            "xxhash>=3.0.0",
         ],
     },
     include_package_data=True,
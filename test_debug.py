@@ -18,20 +18,42 @@ n = 100
 returns = np.random.randn(n) * 0.02
 prices = 100 * np.exp(np.cumsum(returns))
 
-opens = np.roll(prices, 1)
+opens = np.empty_like(prices)
 opens[0] = prices[0]
-highs = np.maximum(prices, opens) * (1 + np.abs(np.random.randn(n)) * 0.01)
-lows = np.minimum(prices, opens) * (1 - np.abs(np.random.randn(n)) * 0.01)
+opens[1:] = prices[:-1]
+# Scale in place so each column needs one buffer plus the max/min
+highs = np.random.randn(n)
+np.abs(highs, out=highs)
+highs *= 0.01
+highs += 1.0
+highs *= np.maximum(prices, opens)
+lows = np.random.randn(n)
+np.abs(lows, out=lows)
+lows *= -0.01
+lows += 1.0
+lows *= np.minimum(prices, opens)
 volumes = np.random.randint(100000, 1000000, n)
 
-df = pl.DataFrame({
-    'time': list(range(n)),
-    'open': opens,
-    'high': highs,
-    'low': lows,
-    'close': prices,
-    'volume': volumes,
-})
+# 1-D NumPy columns with an explicit schema are adopted by Polars without
+# building intermediate Python lists
+df = pl.DataFrame(
+    {
+        'time': np.arange(n, dtype=np.int64),
+        'open': opens,
+        'high': highs,
+        'low': lows,
+        'close': prices,
+        'volume': volumes.astype(np.int64),
+    },
+    schema={
+        'time': pl.Int64,
+        'open': pl.Float64,
+        'high': pl.Float64,
+        'low': pl.Float64,
+        'close': pl.Float64,
+        'volume': pl.Int64,
+    },
+)
 
 print("\nDataFrame head:")
 print(df.head())
@@ -39,52 +61,65 @@ print(df.head())
 print("\nDataFrame dtypes:")
 print(df.dtypes)
 
+# Check price columns for NaN/Inf in one vectorized Polars pass
+price_cols = ['open', 'high', 'low', 'close']
+non_finite = df.select([
+    (pl.col(c).is_nan() | pl.col(c).is_infinite()).any().alias(c)
+    for c in price_cols
+]).row(0, named=True)
+bad_cols = [c for c, flag in non_finite.items() if flag]
+if bad_cols:
+    print(f"\nWARNING: NaN/Inf values in {bad_cols}")
+else:
+    print("\nNo NaN/Inf values in price columns")
+
 # Create chart
 chart = wrc.Chart(width=900, height=500, title='Test Chart')
 chart.add_candlestick(df)
 chart.add_volume(df)
 
-# Get the JSON config and check for issues
-config_json = chart.to_json()
-config = json.loads(config_json)
+# Inspect the live config; only serialize when the JSON itself is needed
+config = chart.config_dict()
 
 print("\n--- Chart Config Debug ---")
 print(f"Number of series: {len(config['series'])}")
 
 for i, series in enumerate(config['series']):
-    print(f"\nSeries {i} ({series['type']}):")
-    print(f"  Data length: {len(series['data'])}")
-    if series['data']:
-        print(f"  First item: {series['data'][0]}")
-        print(f"  Last item: {series['data'][-1]}")
-
-        # Check for any None/NaN values
-        for j, item in enumerate(series['data'][:5]):
-            for k, v in item.items():
-                if v is None:
-                    print(f"    WARNING: None value at index {j}, key '{k}'")
-                elif isinstance(v, float) and (np.isnan(v) or np.isinf(v)):
-                    print(f"    WARNING: NaN/Inf value at index {j}, key '{k}': {v}")
-
-# Try to serialize to JSON again to catch numpy type issues
+    columns = series.data
+    n_rows = len(next(iter(columns.values()), []))
+    print(f"\nSeries {i} ({series.type}):")
+    print(f"  Columns: {list(columns)}")
+    print(f"  Data length: {n_rows}")
+    if n_rows:
+        print(f"  First item: { {k: v[0] for k, v in columns.items()} }")
+        print(f"  Last item: { {k: v[-1] for k, v in columns.items()} }")
+
+        # Non-finite values are NaN here and serialized as null
+        for k, values in columns.items():
+            if isinstance(values, np.ndarray) and values.dtype.kind == 'f':
+                n_missing = int(np.isnan(values).sum())
+                if n_missing:
+                    print(f"    WARNING: {n_missing} null values in key '{k}'")
+
+# Serialize once to catch numpy type issues
 print("\n--- JSON Serialization Test ---")
 try:
-    json_str = json.dumps(config)
+    json_str = chart.to_json()
     print(f"JSON serialization successful! Length: {len(json_str)} chars")
 except TypeError as e:
     print(f"JSON serialization FAILED: {e}")
 
     # Find the problematic values
     for i, series in enumerate(config['series']):
-        for j, item in enumerate(series['data'][:5]):
-            for k, v in item.items():
+        for k, values in series.data.items():
+            for j, v in enumerate(values[:5]):
                 try:
                     json.dumps(v)
                 except TypeError:
                     print(f"  Problematic value at series {i}, index {j}, key '{k}': {v} (type: {type(v)})")
 
 # Save HTML for inspection
-html = chart._generate_html()
+html = chart.to_html()
 with open('test_chart.html', 'w') as f:
     f.write(f"""
 <!DOCTYPE html>
@@ -102,6 +137,7 @@ print("\nSaved test_chart.html for browser inspection")
 # Also print the raw data that goes into the chart
 print("\n--- Raw JS Data Sample (first 3 items) ---")
 for i, series in enumerate(config['series']):
-    print(f"\nSeries {i} ({series['type']}) first 3 items:")
-    for item in series['data'][:3]:
-        print(f"  {item}")
+    print(f"\nSeries {i} ({series.type}) first 3 items:")
+    columns = series.data
+    for j in range(min(3, len(next(iter(columns.values()), [])))):
+        print(f"  { {k: v[j] for k, v in columns.items()} }")
@@ -74,6 +74,16 @@ class TestThemes:
         with pytest.raises(ValueError, match="Unknown theme"):
             Chart(daily_ohlc, theme="invalid")
 
+    def test_themes_are_immutable(self):
+        """Built-in themes cannot be modified in place."""
+        import dataclasses
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            wrc.DARK.colors.background = "#123456"
+        custom = dataclasses.replace(wrc.DARK, name="custom")
+        assert custom.name == "custom"
+        assert custom.colors is wrc.DARK.colors
+
 
 class TestSeriesMethods:
     """Test series addition methods."""
@@ -116,6 +126,27 @@ class TestSeriesMethods:
         chart.add_volume(daily_ohlc)
         assert len(chart._backend._series) == 2
 
+    def test_add_volume_direction_flag(self, daily_ohlc):
+        """Volume bars carry a 0/1 up flag plus the two colors."""
+        chart = Chart().add_volume(daily_ohlc)
+        series = json.loads(chart.to_json())["series"][0]
+        expected = (daily_ohlc["close"] >= daily_ohlc["open"]).cast(pl.UInt8).to_list()
+        assert series["data"]["up"] == expected
+        assert "color" not in series["data"]
+        colors = chart.theme.colors
+        assert series["options"]["upColor"] == colors.volume_up
+        assert series["options"]["downColor"] == colors.volume_down
+
+    def test_add_volume_lazy(self, daily_ohlc):
+        """Lazy volume is collected on serialization with the same result."""
+        eager = Chart().add_candlestick(daily_ohlc).add_volume(daily_ohlc)
+        chart = Chart().add_candlestick(daily_ohlc).add_volume(daily_ohlc, lazy=True)
+        volume = chart._backend._series[1]
+        assert volume.is_lazy
+        eager._backend.config.chart_id = chart._backend.config.chart_id
+        assert chart.to_json() == eager.to_json()
+        assert not volume.is_lazy
+
     def test_method_chaining(self, daily_ohlc):
         """Methods support chaining."""
         chart = (
@@ -127,6 +158,19 @@ class TestSeriesMethods:
         assert len(chart._backend._series) == 2
         assert len(chart._backend._price_lines) == 1
 
+    def test_series_values_zero_copy(self, line_data):
+        """Null-free value columns are emitted as views of Polars memory."""
+        chart = Chart(line_data)
+        values = chart._backend._series[0].to_js_data()["value"]
+        assert not values.flags.owndata
+        assert not values.flags.writeable
+
+    def test_series_values_with_nulls(self):
+        """Columns with nulls fall back to a copy with NaN for null."""
+        df = pl.DataFrame({"time": [1, 2, 3], "value": [1.0, None, 3.0]})
+        values = Chart(df)._backend._series[0].to_js_data()["value"]
+        assert np.isnan(values[1])
+
 
 class TestOutput:
     """Test output methods."""
@@ -145,6 +189,152 @@ class TestOutput:
         data = json.loads(json_str)
         assert "series" in data
 
+    def test_to_json_columnar_series_data(self, daily_ohlc):
+        """Series data is emitted as one array per column."""
+        chart = Chart(daily_ohlc)
+        data = json.loads(chart.to_json())["series"][0]["data"]
+        assert set(data) == {"time", "open", "high", "low", "close"}
+        assert all(len(col) == len(daily_ohlc) for col in data.values())
+        assert data["close"][0] == pytest.approx(daily_ohlc["close"][0])
+
+    def test_datetime_time_sent_as_epoch_seconds(self):
+        """Datetime columns of any unit become integer epoch seconds."""
+        from datetime import datetime
+
+        times = pl.Series([datetime(2024, 1, 1, 9, 30), datetime(2024, 1, 2)])
+        for unit in ("ns", "us", "ms"):
+            df = pl.DataFrame({"time": times.cast(pl.Datetime(unit)), "value": [1.0, 2.0]})
+            data = json.loads(Chart(df).to_json())["series"][0]["data"]
+            assert data["time"] == [1704101400, 1704153600]
+
+    def test_streamlit_html_gzips_config(self, daily_ohlc):
+        """Streamlit output inlines the same config gzipped and base64-encoded."""
+        import base64
+        import gzip
+        import re
+
+        backend = Chart(daily_ohlc)._backend
+        html = backend._streamlit_html()
+        b64 = re.search(r'const config = await gunzipJSON\("([^"]+)"\);', html).group(1)
+        inflated = gzip.decompress(base64.b64decode(b64)).decode()
+        assert inflated == backend._serialize(arrow=True)
+        assert len(html) < len(backend.to_html())
+
+    def test_shared_time_sent_once(self, daily_ohlc, line_data):
+        """Series built from the same frame reference one time array."""
+        chart = Chart(daily_ohlc)
+        chart.add_volume(daily_ohlc)
+        chart.add_line(line_data)
+        data = json.loads(chart.to_json())
+        volume, line, candles = data["series"]
+        assert volume["time_ref"] == candles["time_ref"] == "t0"
+        assert "time" not in volume["data"] and "time" not in candles["data"]
+        assert len(data["sharedTime"]["t0"]) == len(daily_ohlc)
+        assert line["time_ref"] is None and "time" in line["data"]
+
+    def test_shared_time_follows_set_data(self, line_data):
+        """Replacing a series' data recomputes its cached time hash."""
+        chart = Chart(line_data)
+        chart.add_area(line_data)
+        assert json.loads(chart.to_json())["series"][1]["time_ref"] == "t0"
+        chart._backend._series[1].set_data(line_data.with_columns(pl.col("time") + 1))
+        assert json.loads(chart.to_json())["sharedTime"] == {}
+
+    def test_candlestick_series_emitted_last(self, daily_ohlc):
+        """Candlesticks render on top; other series keep their order."""
+        chart = Chart(daily_ohlc)
+        chart.add_volume(daily_ohlc)
+        chart.add_line(daily_ohlc, value_col="close")
+        types = [s["type"] for s in json.loads(chart.to_json())["series"]]
+        assert types == ["Histogram", "Line", "Candlestick"]
+
+    def test_candle_changes_precomputed(self, daily_ohlc, line_data):
+        """The legend's per-bar change comes with the main candlestick."""
+        chart = Chart(daily_ohlc)
+        pre = json.loads(chart.to_json())["precomputed"]
+        open_, close = daily_ohlc["open"].to_numpy(), daily_ohlc["close"].to_numpy()
+        expected = np.rint((close - open_) / open_ * 10000)
+        np.testing.assert_array_equal(pre["changePcts"], expected)
+        assert pre["signs"] == (close >= open_).astype(int).tolist()
+        assert json.loads(Chart(line_data).to_json())["precomputed"] is None
+
+    def test_downsample_merges_candles_and_volume(self, daily_ohlc):
+        """With downsample=True, dense bars are merged per pixel column."""
+        chart = Chart(daily_ohlc, width=100, downsample=True)
+        chart.add_volume(daily_ohlc)
+        data = json.loads(chart.to_json())
+        volume, candles = data["series"]
+        assert len(data["sharedTime"]["t0"]) == 50
+        assert len(candles["data"]["high"]) == 50
+        assert max(candles["data"]["high"]) == pytest.approx(daily_ohlc["high"].max())
+        assert sum(volume["data"]["value"]) == pytest.approx(daily_ohlc["volume"].sum())
+
+        chart.width = 800
+        assert len(json.loads(chart.to_json())["series"][1]["data"]["high"]) == 252
+
+    def test_interactive_legend_and_pinch_can_be_disabled(self, daily_ohlc):
+        """Turning off the legend hides the crosshair; pinch is opt-out."""
+        data = json.loads(Chart(daily_ohlc).to_json())
+        assert data["legend"] is True
+        assert "handleScale" not in data["options"]
+
+        chart = Chart(daily_ohlc, interactive_legend=False, pinch_zoom=False)
+        data = json.loads(chart.to_json())
+        assert data["legend"] is False
+        assert data["options"]["crosshair"]["mode"] == 2
+        assert data["options"]["handleScale"] == {"pinch": False}
+
+    def test_config_dict_matches_json(self, daily_ohlc, line_data, forecast_paths):
+        """config_dict holds the same content as the serialized JSON."""
+        from wrchart.core.serialization import dumps
+
+        forecast_paths["historical"] = np.array([100, 101, 102, 103, 104])
+        for data in (daily_ohlc, [line_data, line_data.clone()]):
+            chart = Chart(data)
+            assert json.loads(dumps(chart.config_dict())) == json.loads(chart.to_json())
+        assert "paths" in Chart(forecast_paths).config_dict()
+
+    def test_webgl_to_json(self, tick_data):
+        """WebGL backend to_json includes LOD levels and point count."""
+        chart = Chart(tick_data)
+        data = json.loads(chart.to_json())
+        assert data["total_points"] == len(tick_data)
+        assert len(data["lod"]) > 0
+
+    def test_webgl_to_html_base64_lod(self, tick_data):
+        """WebGL HTML carries LOD levels as base64 float32 buffers."""
+        import base64
+        import re
+
+        chart = Chart(tick_data)
+        html = chart.to_html()
+        match = re.search(r"const lodArrays = (\[.*?\]);", html)
+        encoded = json.loads(match.group(1))
+        lod = chart._backend._lod_data
+        assert len(encoded) == len(lod)
+        decoded = np.frombuffer(base64.b64decode(encoded[-1]), dtype="<f4")
+        np.testing.assert_array_equal(decoded, lod[-1].astype(np.float32))
+
+    def test_webgl_uint16_vertices(self, tick_data):
+        """WebGL vertices can be quantized to 16-bit normalized integers."""
+        import base64
+        import re
+
+        chart = Chart(backend="webgl")
+        chart.add_line(tick_data, dtype="uint16")
+        html = chart.to_html()
+        assert "new Uint16Array" in html
+        encoded = json.loads(re.search(r"const lodArrays = (\[.*?\]);", html).group(1))
+        decoded = np.frombuffer(base64.b64decode(encoded[0]), dtype="<u2")
+        np.testing.assert_allclose(
+            decoded / 65535.0, chart._backend._lod_data[0], atol=1 / 65535.0
+        )
+
+    def test_webgl_invalid_dtype_raises(self, tick_data):
+        """Unknown WebGL vertex dtypes are rejected."""
+        with pytest.raises(ValueError, match="Unknown dtype"):
+            Chart(backend="webgl").add_line(tick_data, dtype="int8")
+
     def test_repr_html(self, daily_ohlc):
         """_repr_html_ works for Jupyter."""
         chart = Chart(daily_ohlc)
@@ -152,6 +342,224 @@ class TestOutput:
         assert "<script>" in html
 
 
+class TestJsonCache:
+    """Test reuse of the serialized payload."""
+
+    def test_repeated_to_json_is_cached(self, daily_ohlc):
+        """Unchanged charts return the cached JSON string."""
+        chart = Chart(daily_ohlc)
+        assert chart.to_json() is chart.to_json()
+
+    def test_add_invalidates_cache(self, daily_ohlc):
+        """Adding to the chart produces a fresh payload."""
+        chart = Chart(daily_ohlc)
+        before = chart.to_json()
+        chart.add_horizontal_line(100)
+        after = chart.to_json()
+        assert after != before
+        assert len(json.loads(after)["priceLines"]) == 1
+
+    def test_set_data_invalidates_cache(self, daily_ohlc):
+        """Replacing series data produces a fresh payload."""
+        chart = Chart(daily_ohlc)
+        before = chart.to_json()
+        chart._backend._series[0].set_data(daily_ohlc.head(10))
+        assert len(json.loads(chart.to_json())["series"][0]["data"]["time"]) == 10
+        assert chart.to_json() != before
+
+    def test_absent_optional_column(self, line_data):
+        """An optional column missing from the frame is skipped, not hashed."""
+        chart = Chart().add_histogram(line_data, color_col="color")
+        series = json.loads(chart.to_json())["series"][0]
+        assert "color" not in series["data"]
+
+    def test_view_properties_invalidate_cache(self, daily_ohlc):
+        """Changing width, height, theme or title re-renders the payload."""
+        chart = Chart(daily_ohlc)
+        chart.to_json()
+        chart.width = 1024
+        chart.height = 300
+        chart.title = "Updated"
+        data = json.loads(chart.to_json())
+        assert (data["width"], data["height"], data["title"]) == (1024, 300, "Updated")
+        chart.theme = "dark"
+        assert chart.theme.name == "dark"
+        assert json.loads(chart.to_json())["options"] != data["options"]
+
+    def test_view_change_keeps_series_json(self, daily_ohlc, monkeypatch):
+        """Size, title and markers do not re-serialize series data."""
+        chart = Chart(daily_ohlc)
+        before = json.loads(chart.to_json())
+        calls = []
+        series = chart._backend._series[0]
+        monkeypatch.setattr(series, "to_js_data", lambda: calls.append(1))
+        chart.width = 640
+        chart.title = "Resized"
+        chart.add_marker(time=daily_ohlc["time"][0], text="buy")
+        after = json.loads(chart.to_json())
+        assert calls == []
+        assert after["series"] == before["series"]
+        assert (after["width"], after["title"], len(after["markers"])) == (640, "Resized", 1)
+
+    def test_rebuilt_chart_reuses_series_json(self, daily_ohlc, monkeypatch):
+        """A new chart over unchanged data reuses the series JSON."""
+        before = json.loads(Chart(daily_ohlc).to_json())["series"]
+        chart = Chart(daily_ohlc)
+        calls = []
+        series = chart._backend._series[0]
+        monkeypatch.setattr(series, "to_js_data", lambda: calls.append(1))
+        assert json.loads(chart.to_json())["series"] == before
+        assert calls == []
+
+        changed = Chart(daily_ohlc.with_columns(pl.col("close") + 1))
+        assert json.loads(changed.to_json())["series"] != before
+
+    def test_marker_invalidates_cache(self, daily_ohlc):
+        """Adding a marker produces a fresh payload."""
+        chart = Chart(daily_ohlc)
+        chart.to_json()
+        chart.add_marker(time=daily_ohlc["time"][0], text="buy")
+        assert len(json.loads(chart.to_json())["markers"]) == 1
+
+
+class TestArrowTransport:
+    """Test Arrow IPC transport of series data."""
+
+    def test_to_arrow_ipc_roundtrip(self, daily_ohlc):
+        """Arrow IPC streams carry the same columns as the JSON payload."""
+        chart = Chart(daily_ohlc, precision="f64")
+        streams = chart.to_arrow_ipc()
+        assert list(streams) == ["series_0"]
+        table = pl.read_ipc_stream(streams["series_0"])
+        assert table.columns == ["time", "open", "high", "low", "close"]
+        assert table["time"].dtype == pl.Float64
+        np.testing.assert_array_equal(table["close"].to_numpy(), daily_ohlc["close"])
+
+    def test_float32_precision(self, daily_ohlc):
+        """Value columns are narrowed to float32 by default, time is not."""
+        table = pl.read_ipc_stream(Chart(daily_ohlc).to_arrow_ipc()["series_0"])
+        assert table["close"].dtype == pl.Float32
+        assert table["time"].dtype == pl.Float64
+        np.testing.assert_allclose(
+            table["close"].to_numpy(), daily_ohlc["close"], rtol=1e-6
+        )
+        data = json.loads(Chart(daily_ohlc).to_json())["series"][0]["data"]
+        assert np.float32(data["close"][0]) == np.float32(daily_ohlc["close"][0])
+
+    def test_invalid_precision_raises(self, daily_ohlc):
+        """Unknown precision values are rejected."""
+        with pytest.raises(ValueError, match="precision"):
+            Chart(daily_ohlc, precision="f16")
+
+    def test_large_series_embedded_as_arrow(self, line_data):
+        """Series above the row threshold are embedded as Arrow in HTML."""
+        import re
+
+        def embedded_series(html):
+            config = re.search(r"const config = (.*);\n", html).group(1)
+            return json.loads(config)["series"][0]
+
+        assert embedded_series(Chart(line_data).to_html())["arrow"] is None
+        chart = Chart(line_data)
+        chart._backend.ARROW_MIN_ROWS = 100
+        series = embedded_series(chart.to_html())
+        assert series["data"] == {}
+        assert series["arrow"]
+        # to_json keeps plain arrays
+        series = json.loads(chart.to_json())["series"][0]
+        assert series["arrow"] is None
+        assert len(series["data"]["value"]) == len(line_data)
+
+    def test_arrow_url_configurable(self, line_data, monkeypatch):
+        """Pages import Arrow from ARROW_URL and report a failed load."""
+        from wrchart.core.backends import lightweight
+
+        monkeypatch.setattr(lightweight, "ARROW_URL", "/app/static/arrow.mjs")
+        chart = Chart(line_data)
+        chart._backend.ARROW_MIN_ROWS = 100
+        html = chart.to_html()
+        assert "await import('/app/static/arrow.mjs')" in html
+        assert "jsdelivr" not in html
+        assert "showError('Could not load Apache Arrow" in html
+
+    def test_streamed_html_serves_arrow(self, line_data):
+        """Streamed HTML fetches large series from a local server."""
+        import re
+        import urllib.request
+
+        chart = Chart(line_data)
+        chart._backend.ARROW_MIN_ROWS = 100
+        html = chart._backend.to_html_streamed(ttl=30)
+        config = json.loads(re.search(r"const config = (.*);\n", html).group(1))
+        series = config["series"][0]
+        assert series["data"] == {} and series["arrow"] is None
+        assert series["arrow_url"].startswith("http://127.0.0.1:")
+        with urllib.request.urlopen(series["arrow_url"], timeout=5) as response:
+            table = pl.read_ipc_stream(response.read())
+        assert len(table) == len(line_data)
+
+    def test_streamed_show_in_script_waits_for_browser(self, line_data, monkeypatch):
+        """Outside IPython, show(stream=True) returns once the data is fetched."""
+        import re
+        import threading
+        import time
+        import urllib.request
+        import webbrowser
+
+        from wrchart.core.backends import base
+
+        fetched = []
+        requested = []
+        threads = []
+
+        def fake_browser(url):
+            def fetch():
+                time.sleep(0.2)
+                with open(url[len("file://"):]) as f:
+                    arrow_url = re.search(r'"arrow_url":"([^"]+)"', f.read()).group(1)
+                requested.append(time.monotonic())
+                with urllib.request.urlopen(arrow_url, timeout=5) as response:
+                    fetched.append(len(pl.read_ipc_stream(response.read())))
+
+            threads.append(threading.Thread(target=fetch, daemon=True))
+            threads[0].start()
+
+        monkeypatch.setattr(base, "_in_ipython", lambda: False)
+        monkeypatch.setattr(webbrowser, "open", fake_browser)
+        chart = Chart(line_data)
+        chart._backend.ARROW_MIN_ROWS = 100
+        chart.show(stream=True, ttl=10)
+        returned = time.monotonic()
+        threads[0].join(timeout=5)
+        # show() must not return before the page has asked for the data
+        assert requested and requested[0] < returned
+        assert fetched == [len(line_data)]
+
+    def test_streamed_show_in_notebook_serves_reloads(self, line_data, monkeypatch):
+        """In a notebook the data stays available after the first fetch."""
+        import re
+        import urllib.request
+
+        display = pytest.importorskip("IPython.display")
+        from wrchart.core.backends import base
+
+        shown = []
+        monkeypatch.setattr(base, "_in_ipython", lambda: True)
+        monkeypatch.setattr(display, "display", lambda obj: shown.append(obj.data))
+        chart = Chart(line_data)
+        chart._backend.ARROW_MIN_ROWS = 100
+        chart.show(stream=True, ttl=10)
+        arrow_url = re.search(r'"arrow_url":"([^"]+)"', shown[0]).group(1)
+        for _ in range(2):
+            with urllib.request.urlopen(arrow_url, timeout=5) as response:
+                assert len(pl.read_ipc_stream(response.read())) == len(line_data)
+
+    def test_streamed_html_unsupported_backend(self, forecast_paths):
+        """Backends without Arrow transport refuse to stream."""
+        with pytest.raises(NotImplementedError):
+            Chart(forecast_paths)._backend.to_html_streamed()
+
+
 class TestQuickPlotFunctions:
     """Test quick-plot convenience functions."""
 
@@ -194,3 +602,23 @@ class TestDeprecationWarning:
         with pytest.warns(DeprecationWarning, match="WebGLChart is deprecated"):
             chart = wrc.WebGLChart()
             chart.add_line(line_data)
+
+
+class TestPackageExports:
+    """Test the lazily loaded top-level exports."""
+
+    def test_all_exports_resolve(self):
+        """Every name in __all__ is reachable from the package."""
+        for name in wrc.__all__:
+            assert hasattr(wrc, name), name
+
+    def test_lazy_export_is_same_object(self):
+        """Lazy exports resolve to the defining module's object."""
+        from wrchart.transforms.renko import to_renko
+
+        assert wrc.to_renko is to_renko
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError, match="does_not_exist"):
+            _ = wrc.does_not_exist
@@ -0,0 +1,122 @@
+"""Tests for chart payload serialization, sanitization and fingerprints."""
+
+import json
+
+import numpy as np
+import polars as pl
+import pytest
+
+from wrchart._sanitize import sanitize
+from wrchart.core import serialization
+from wrchart.core.fingerprint import frame_fingerprint
+from wrchart.core.serialization import dumps
+
+
+class TestDumps:
+    """Tests for the JSON encoder."""
+
+    def test_numpy_array(self):
+        """NumPy arrays serialize as JSON arrays."""
+        result = json.loads(dumps({"a": np.array([1.0, 2.5])}))
+        assert result == {"a": [1.0, 2.5]}
+
+    def test_numpy_scalars(self):
+        """NumPy scalars serialize as plain numbers."""
+        result = json.loads(dumps({"i": np.int64(3), "f": np.float32(1.5)}))
+        assert result == {"i": 3, "f": 1.5}
+
+    def test_non_finite_array_values_are_null(self):
+        """NaN and Inf inside arrays become null."""
+        out = dumps({"a": np.array([1.0, np.nan, np.inf, -np.inf])})
+        assert json.loads(out) == {"a": [1.0, None, None, None]}
+
+    def test_stdlib_fallback(self, monkeypatch):
+        """Without orjson the stdlib encoder handles NumPy values."""
+        monkeypatch.setattr(serialization, "orjson", None)
+        out = dumps({"a": np.array([1.0, np.nan]), "i": np.int64(2)})
+        assert json.loads(out) == {"a": [1.0, None], "i": 2}
+
+    def test_stdlib_fallback_float32(self, monkeypatch, daily_ohlc):
+        """Without orjson float32 values keep their short float32 repr."""
+        from wrchart import Chart
+
+        monkeypatch.setattr(serialization, "orjson", None)
+        values = np.array([100.13, np.nan, 0.1], dtype=np.float32)
+        out = dumps({"a": values, "s": np.float32(100.13)})
+        assert out == '{"a": [100.13, null, 0.1], "s": 100.13}'
+
+        ohlc = daily_ohlc.with_columns(pl.col("open", "high", "low", "close").round(2))
+        f32 = Chart(ohlc, precision="f32").to_json()
+        f64 = Chart(ohlc, precision="f64").to_json()
+        assert len(f32) <= len(f64)
+
+    def test_dataclass(self, monkeypatch):
+        """Dataclasses serialize as objects with or without orjson."""
+        from wrchart.core.series import SeriesConfig
+
+        data = {"value": np.array([1.0, np.nan])}
+        config = SeriesConfig("s1", "Line", data, {}, None, None, None)
+        expected = {
+            "id": "s1",
+            "type": "Line",
+            "data": {"value": [1.0, None]},
+            "options": {},
+            "arrow": None,
+            "arrow_url": None,
+            "time_ref": None,
+        }
+        assert json.loads(dumps(config)) == expected
+        monkeypatch.setattr(serialization, "orjson", None)
+        assert json.loads(dumps(config)) == expected
+
+    def test_unsupported_type_raises(self):
+        """Unknown objects raise TypeError."""
+        with pytest.raises(TypeError):
+            dumps({"a": object()})
+
+
+class TestSanitize:
+    """Tests for non-finite value handling."""
+
+    def test_inf_becomes_nan(self):
+        """Infinities are folded into NaN."""
+        out = sanitize(np.array([1.0, np.inf, -np.inf, np.nan]))
+        assert out[0] == 1.0
+        assert np.isnan(out[1:]).all()
+
+    def test_read_only_input_is_copied(self):
+        """Read-only arrays are copied rather than modified."""
+        a = np.array([np.inf, 2.0])
+        a.flags.writeable = False
+        out = sanitize(a)
+        assert out is not a
+        assert np.isinf(a[0])
+
+    def test_finite_input_returned_as_is(self):
+        """Arrays without infinities are passed through without copying."""
+        a = np.array([1.0, np.nan])
+        assert sanitize(a) is a
+
+
+class TestFingerprint:
+    """Tests for data content fingerprints."""
+
+    def test_equal_data_equal_fingerprint(self, daily_ohlc):
+        """Identical content hashes the same, even across copies."""
+        assert frame_fingerprint(daily_ohlc) == frame_fingerprint(daily_ohlc.clone())
+
+    def test_changed_data_changes_fingerprint(self, daily_ohlc):
+        """Changing a single value changes the fingerprint."""
+        changed = daily_ohlc.with_columns(
+            pl.when(pl.int_range(pl.len()) == 5)
+            .then(pl.col("close") + 1)
+            .otherwise(pl.col("close"))
+            .alias("close")
+        )
+        assert frame_fingerprint(daily_ohlc) != frame_fingerprint(changed)
+
+    def test_string_columns(self):
+        """Non-numeric columns can be fingerprinted."""
+        a = pl.DataFrame({"time": ["2024-01-01", "2024-01-02"]})
+        b = pl.DataFrame({"time": ["2024-01-01", "2024-01-03"]})
+        assert frame_fingerprint(a) != frame_fingerprint(b)
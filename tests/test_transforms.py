@@ -6,12 +6,15 @@ import pytest
 
 from wrchart.transforms import (
     lttb_downsample,
+    minmax_lttb_downsample,
+    ohlc_downsample,
     to_heikin_ashi,
     to_renko,
     to_kagi,
     to_point_and_figure,
     to_line_break,
     to_range_bars,
+    to_range_bars_multi,
 )
 
 
@@ -63,6 +66,47 @@ class TestLTTB:
         assert result["time"][-1] == sample_line_data["time"][-1]
 
 
+class TestMinMaxLTTB:
+    """Tests for MinMax-LTTB downsampling."""
+
+    def test_minmax_lttb_reduces_points(self, sample_line_data):
+        """MinMax-LTTB should reduce to the target point count."""
+        result = minmax_lttb_downsample(sample_line_data, target_points=50)
+        assert len(result) == 50
+
+    def test_minmax_lttb_preserves_endpoints(self, sample_line_data):
+        """MinMax-LTTB should always keep first and last points."""
+        result = minmax_lttb_downsample(sample_line_data, target_points=20)
+        assert result["time"][0] == sample_line_data["time"][0]
+        assert result["time"][-1] == sample_line_data["time"][-1]
+
+    def test_minmax_lttb_sorted(self, sample_line_data):
+        """Selected points stay in time order."""
+        result = minmax_lttb_downsample(sample_line_data, target_points=20)
+        assert result["time"].is_sorted()
+
+
+class TestOHLCDownsample:
+    """Tests for OHLC bar merging."""
+
+    def test_ohlc_downsample_merges_runs(self, sample_ohlc):
+        """Each output bar spans a run of input bars."""
+        data = sample_ohlc.with_columns(volume=pl.lit(1.0))
+        result = ohlc_downsample(data, target_bars=10, volume_col="volume")
+        assert len(result) == 10
+        assert result.columns == data.columns
+        first = data.head(10)
+        assert result["open"][0] == first["open"][0]
+        assert result["high"][0] == first["high"].max()
+        assert result["low"][0] == first["low"].min()
+        assert result["close"][0] == first["close"][-1]
+        assert result["volume"].sum() == len(data)
+
+    def test_ohlc_downsample_preserves_small_data(self, sample_ohlc):
+        """Data at or below the target is returned unchanged."""
+        assert ohlc_downsample(sample_ohlc, target_bars=100) is sample_ohlc
+
+
 class TestHeikinAshi:
     """Tests for Heikin-Ashi transform."""
 
@@ -101,6 +145,26 @@ class TestRenko:
             brick_range = abs(result["close"][i] - result["open"][i])
             assert abs(brick_range - brick_size) < 0.01
 
+    def test_renko_atr_brick_size(self, sample_ohlc):
+        """use_atr sizes bricks by the latest Wilder ATR."""
+        from wrchart.transforms.renko import _calculate_atr_brick_size
+
+        period = 14
+        high = sample_ohlc["high"].to_numpy()
+        low = sample_ohlc["low"].to_numpy()
+        prev_close = sample_ohlc["close"].shift(1).to_numpy()
+        tr = np.fmax(high - low, np.fmax(abs(high - prev_close), abs(low - prev_close)))
+        atr = tr[0]
+        for value in tr[1:]:
+            atr += (value - atr) / period
+
+        size = _calculate_atr_brick_size(sample_ohlc, "high", "low", "close", period)
+        assert size == pytest.approx(atr)
+
+        result = to_renko(sample_ohlc, brick_size=0, use_atr=True)
+        assert len(result) > 0
+        assert (result["close"] - result["open"]).abs().to_numpy() == pytest.approx(size)
+
 
 class TestKagi:
     """Tests for Kagi transform."""
@@ -162,3 +226,63 @@ class TestRangeBars:
             for i in range(len(result) - 1):
                 bar_range = result["high"][i] - result["low"][i]
                 assert bar_range <= range_size + 0.1
+
+    def test_empty_input_keeps_dtypes(self, sample_ohlc):
+        """Empty input gives an empty frame with the usual column dtypes."""
+        empty = sample_ohlc.clear()
+        for result in (to_range_bars(empty, 1.0), to_renko(empty, 1.0)):
+            assert len(result) == 0
+            assert result.schema["time"] == empty.schema["time"]
+            assert result.schema["close"] == pl.Float64
+
+    def test_range_bars_multi_matches_per_symbol(self, sample_ohlc):
+        """Each symbol's bars match to_range_bars on that symbol alone."""
+        other = sample_ohlc.with_columns(
+            pl.col("high") * 1.5, pl.col("low") * 1.5
+        )
+        # Interleave the symbols row by row
+        df = pl.concat(
+            [
+                sample_ohlc.with_columns(pl.lit("B").alias("symbol")),
+                other.with_columns(pl.lit("A").alias("symbol")),
+            ]
+        ).sort("time", maintain_order=True)
+
+        result = to_range_bars_multi(df, range_size=1.0)
+        assert result["symbol"].unique(maintain_order=True).to_list() == ["B", "A"]
+        for symbol, source in (("B", sample_ohlc), ("A", other)):
+            expected = to_range_bars(source, range_size=1.0)
+            got = result.filter(pl.col("symbol") == symbol).drop("symbol")
+            assert got.equals(expected)
+
+
+class TestKernels:
+    """Tests for the compiled transform kernels."""
+
+    def test_time_dtype_preserved(self, sample_ohlc):
+        """Transforms keep the dtype of the input time column."""
+        df = sample_ohlc.with_columns(
+            pl.from_epoch(pl.col("time"), time_unit="d").cast(pl.Datetime("ns"))
+        )
+        for result in (
+            to_renko(df, brick_size=0.5),
+            to_range_bars(df, range_size=1.0),
+            to_kagi(df, reversal_amount=0.5),
+            to_line_break(df),
+            to_point_and_figure(df, box_size=0.5),
+        ):
+            assert result["time"].dtype == pl.Datetime("ns")
+
+    def test_compiled_matches_python(self, sample_ohlc):
+        """Compiled kernels give the same result as the plain Python loop."""
+        from wrchart._jit import HAS_NUMBA
+        from wrchart.transforms import _numba_kernels as k
+
+        if not HAS_NUMBA:
+            pytest.skip("numba not installed")
+
+        closes = sample_ohlc["close"].to_numpy()
+        for compiled, python in zip(
+            k.line_break_kernel(closes, 3), k.line_break_kernel.py_func(closes, 3)
+        ):
+            np.testing.assert_array_equal(compiled, python)
@@ -18,6 +18,7 @@ Quick Start:
     >>> wrc.line(df).show()
 """
 
+import importlib
 import warnings
 
 # Unified Chart API
@@ -56,66 +57,6 @@ from wrchart.core.series import (
     ScatterSeries,
 )
 
-# Transforms
-from wrchart.transforms.heikin_ashi import to_heikin_ashi
-from wrchart.transforms.renko import to_renko
-from wrchart.transforms.kagi import to_kagi
-from wrchart.transforms.pnf import to_point_and_figure
-from wrchart.transforms.line_break import to_line_break
-from wrchart.transforms.range_bar import to_range_bars
-from wrchart.transforms.decimation import lttb_downsample, adaptive_downsample
-
-# Forecast visualization
-from wrchart.forecast import (
-    ForecastChart,
-    VIRIDIS,
-    PLASMA,
-    INFERNO,
-    HOT,
-    density_to_color,
-    compute_path_density,
-    compute_path_colors_by_density,
-)
-
-# Multi-panel layouts
-from wrchart.multipanel import (
-    MultiPanelChart,
-    Panel,
-    LinePanel,
-    BarPanel,
-    HeatmapPanel,
-    GaugePanel,
-    AreaPanel,
-)
-
-# Financial chart helpers
-from wrchart.financial import (
-    returns_distribution,
-    price_with_indicator,
-    indicator_panels,
-    equity_curve,
-    drawdown_chart,
-    rolling_sharpe,
-)
-
-# Drawing tools
-from wrchart.drawing.tools import (
-    BaseDrawing,
-    HorizontalLine,
-    VerticalLine,
-    TrendLine,
-    Ray,
-    Rectangle,
-    Arrow,
-    Text,
-    PriceRange,
-    FibonacciRetracement,
-    FibonacciExtension,
-    export_drawings,
-    import_drawings,
-)
-
-
 # -------------------------------------------------------------------------
 # Deprecation Wrappers
 # -------------------------------------------------------------------------
@@ -140,23 +81,90 @@ class WebGLChart(Chart):
 
 
 # -------------------------------------------------------------------------
-# Live streaming (optional - requires websockets)
+# Lazily imported exports (PEP 562)
 # -------------------------------------------------------------------------
 
-try:
-    from wrchart.live import (
-        LiveChart,
-        LiveTable,
-        LiveDashboard,
-        LiveServer,
-    )
-    _HAS_LIVE = True
-except ImportError:
-    _HAS_LIVE = False
-    LiveChart = None
-    LiveTable = None
-    LiveDashboard = None
-    LiveServer = None
+# Transforms, forecast, multi-panel, financial helpers, drawing tools and
+# live streaming are only imported on first access, so `import wrchart`
+# stays fast for code that only needs Chart.
+_LAZY_EXPORTS = {
+    # Transforms
+    "to_heikin_ashi": "wrchart.transforms.heikin_ashi",
+    "to_renko": "wrchart.transforms.renko",
+    "to_kagi": "wrchart.transforms.kagi",
+    "to_point_and_figure": "wrchart.transforms.pnf",
+    "to_line_break": "wrchart.transforms.line_break",
+    "to_range_bars": "wrchart.transforms.range_bar",
+    "to_range_bars_multi": "wrchart.transforms.range_bar",
+    "lttb_downsample": "wrchart.transforms.decimation",
+    "minmax_lttb_downsample": "wrchart.transforms.decimation",
+    "adaptive_downsample": "wrchart.transforms.decimation",
+    "ohlc_downsample": "wrchart.transforms.decimation",
+    # Forecast visualization
+    "ForecastChart": "wrchart.forecast",
+    "VIRIDIS": "wrchart.forecast",
+    "PLASMA": "wrchart.forecast",
+    "INFERNO": "wrchart.forecast",
+    "HOT": "wrchart.forecast",
+    "density_to_color": "wrchart.forecast",
+    "compute_path_density": "wrchart.forecast",
+    "compute_path_colors_by_density": "wrchart.forecast",
+    # Multi-panel layouts
+    "MultiPanelChart": "wrchart.multipanel",
+    "Panel": "wrchart.multipanel",
+    "LinePanel": "wrchart.multipanel",
+    "BarPanel": "wrchart.multipanel",
+    "HeatmapPanel": "wrchart.multipanel",
+    "GaugePanel": "wrchart.multipanel",
+    "AreaPanel": "wrchart.multipanel",
+    # Financial chart helpers
+    "returns_distribution": "wrchart.financial",
+    "price_with_indicator": "wrchart.financial",
+    "indicator_panels": "wrchart.financial",
+    "equity_curve": "wrchart.financial",
+    "drawdown_chart": "wrchart.financial",
+    "rolling_sharpe": "wrchart.financial",
+    # Drawing tools
+    "BaseDrawing": "wrchart.drawing.tools",
+    "HorizontalLine": "wrchart.drawing.tools",
+    "VerticalLine": "wrchart.drawing.tools",
+    "TrendLine": "wrchart.drawing.tools",
+    "Ray": "wrchart.drawing.tools",
+    "Rectangle": "wrchart.drawing.tools",
+    "Arrow": "wrchart.drawing.tools",
+    "Text": "wrchart.drawing.tools",
+    "PriceRange": "wrchart.drawing.tools",
+    "FibonacciRetracement": "wrchart.drawing.tools",
+    "FibonacciExtension": "wrchart.drawing.tools",
+    "export_drawings": "wrchart.drawing.tools",
+    "import_drawings": "wrchart.drawing.tools",
+}
+
+# Live streaming (optional - requires websockets); None when unavailable
+_LIVE_EXPORTS = ("LiveChart", "LiveTable", "LiveDashboard", "LiveServer")
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    elif name in _LIVE_EXPORTS or name == "_HAS_LIVE":
+        try:
+            live = importlib.import_module("wrchart.live")
+        except ImportError:
+            live = None
+        for live_name in _LIVE_EXPORTS:
+            globals()[live_name] = getattr(live, live_name, None)
+        globals()["_HAS_LIVE"] = live is not None
+        return globals()[name]
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | set(_LIVE_EXPORTS))
 
 
 __version__ = "0.2.0"
@@ -195,8 +203,11 @@ __all__ = [
     "to_point_and_figure",
     "to_line_break",
     "to_range_bars",
+    "to_range_bars_multi",
     "lttb_downsample",
+    "minmax_lttb_downsample",
     "adaptive_downsample",
+    "ohlc_downsample",
     # Forecast
     "ForecastChart",
     "VIRIDIS",
@@ -0,0 +1,89 @@
+"""
+Optional Numba JIT support.
+
+``njit`` mirrors ``numba.njit`` but defers importing Numba and compiling
+until a kernel is first called, so ``import wrchart`` does not pay for
+the Numba import. When numba is not installed, kernels run as plain
+Python and ``prange`` is ``range``.
+"""
+
+from typing import Any, Callable, Dict, Optional
+import importlib.util
+
+try:
+    HAS_NUMBA = importlib.util.find_spec("numba") is not None
+except ValueError:  # pragma: no cover - numba blocked in sys.modules
+    HAS_NUMBA = False
+
+
+def prange(*args: int) -> range:
+    """Stand-in for numba.prange when called from plain Python."""
+    return range(*args)
+
+
+class LazyJit:
+    """
+    Kernel wrapper that compiles with Numba on first call.
+
+    Attributes:
+        py_func: The original Python function
+    """
+
+    def __init__(self, func: Callable, options: Dict[str, Any]):
+        self.py_func = func
+        self._options = options
+        self._dispatcher: Optional[Callable] = None
+        self.__name__ = func.__name__
+        self.__qualname__ = func.__qualname__
+        self.__doc__ = func.__doc__
+        self.__module__ = func.__module__
+
+    def compile(self) -> Callable:
+        """Compile the kernel (once) and return the callable to use."""
+        if self._dispatcher is None:
+            self._dispatcher = self._build()
+        return self._dispatcher
+
+    def _build(self) -> Callable:
+        func = self.py_func
+        if not HAS_NUMBA:
+            return func
+
+        import numba
+
+        # Kernels that call other kernels must see real Numba dispatchers,
+        # and prange must be Numba's so parallel loops are recognised.
+        namespace = func.__globals__
+        for name in func.__code__.co_names:
+            value = namespace.get(name)
+            if isinstance(value, LazyJit):
+                namespace[name] = value.compile()
+            elif value is prange:
+                namespace[name] = numba.prange
+
+        dispatcher = numba.njit(**self._options)(func)
+        # Later lookups through the module skip this wrapper entirely
+        if namespace.get(self.__name__) is self:
+            namespace[self.__name__] = dispatcher
+        return dispatcher
+
+    def __call__(self, *args: Any) -> Any:
+        return self.compile()(*args)
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """
+    Lazily compiled drop-in for numba.njit.
+
+    Supports both ``@njit`` and ``@njit(cache=True, ...)``.
+    """
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return LazyJit(args[0], {})
+
+    def decorator(func: Callable) -> LazyJit:
+        return LazyJit(func, kwargs)
+
+    return decorator
+
+
+__all__ = ["njit", "prange", "HAS_NUMBA", "LazyJit"]
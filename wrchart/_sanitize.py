@@ -0,0 +1,35 @@
+"""
+Non-finite value handling for series arrays.
+
+JSON has no representation for NaN or Infinity, so chart payloads must
+carry them as null. NaN already means "missing" throughout wrchart; these
+helpers fold +/-Inf into NaN so every encoder only has to deal with a
+single missing-value marker.
+"""
+
+import numpy as np
+
+
+def sanitize(a: np.ndarray) -> np.ndarray:
+    """
+    Return a float array with +/-Inf replaced by NaN.
+
+    The input is returned unchanged when it holds no infinities, and is
+    only copied when it is read-only (e.g. a zero-copy view of Polars
+    memory).
+
+    Args:
+        a: 1-D NumPy array
+
+    Returns:
+        Array safe to serialize with NaN as the only missing marker
+    """
+    if a.dtype.kind != "f" or a.ndim != 1:
+        return a
+    inf = np.isinf(a)
+    if not inf.any():
+        return a
+    if not a.flags.writeable:
+        a = a.copy()
+    a[inf] = np.nan
+    return a
@@ -8,13 +8,23 @@ across different technologies (Lightweight Charts, WebGL, Canvas, etc.).
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import polars as pl
 
+from wrchart.core.data_server import DataServer
 from wrchart.core.themes import Theme, WayyTheme
 
 
+def _in_ipython() -> bool:
+    """Return True when running inside an IPython kernel or shell."""
+    try:
+        from IPython import get_ipython
+    except ImportError:
+        return False
+    return get_ipython() is not None
+
+
 class BackendType(Enum):
     """Types of rendering backends."""
 
@@ -33,6 +43,10 @@ class RenderConfig:
     theme: Theme = field(default_factory=lambda: WayyTheme)
     title: Optional[str] = None
     chart_id: str = ""
+    precision: str = "f32"  # "f32" sends float value columns as float32
+    downsample: bool = False  # merge OHLC bars beyond ~2 per pixel column
+    interactive_legend: bool = True  # crosshair and hover legend
+    pinch_zoom: bool = True  # touch pinch scales the time axis
 
 
 class Backend(ABC):
@@ -125,6 +139,7 @@ class Backend(ABC):
             "text": text,
             "size": size,
         })
+        self.invalidate_view()
         return self
 
     def add_horizontal_line(
@@ -158,6 +173,7 @@ class Backend(ABC):
             "title": label,
             "axisLabelVisible": label_visible,
         })
+        self.invalidate_view()
         return self
 
     def add_drawing(self, drawing: Any) -> "Backend":
@@ -171,8 +187,28 @@ class Backend(ABC):
             Self for chaining
         """
         self._drawings.append(drawing)
+        self.invalidate()
         return self
 
+    def invalidate(self) -> None:  # noqa: B027
+        """
+        Drop any cached output after the chart was changed.
+
+        Called by every mutating method. Intentionally a no-op here:
+        backends without a cache have nothing to drop, and those that
+        cache their serialized payload override it.
+        """
+
+    def invalidate_view(self) -> None:
+        """
+        Drop cached output after a chart-level change.
+
+        Called for changes that leave the series untouched (size, title,
+        theme, markers, price lines), so backends can keep their
+        serialized series data. Defaults to invalidate().
+        """
+        self.invalidate()
+
     @abstractmethod
     def to_html(self) -> str:
         """
@@ -183,6 +219,43 @@ class Backend(ABC):
         """
         pass
 
+    @abstractmethod
+    def _build_config(self) -> Dict[str, Any]:
+        """
+        Build the chart configuration as Python objects.
+
+        Returns:
+            Configuration dict that to_json() serializes
+        """
+        pass
+
+    def config_dict(self) -> Dict[str, Any]:
+        """
+        Get the chart configuration without serializing it.
+
+        Holds the same content as to_json() but skips the JSON encode and
+        parse round-trip; prefer it for inspection and debugging, and call
+        to_json() only when the serialized form is needed.
+
+        Returns:
+            Configuration dict
+        """
+        return self._build_config()
+
+    def to_arrow_ipc(self) -> Dict[str, bytes]:
+        """
+        Serialize series data as Arrow IPC streams.
+
+        Returns:
+            Mapping of series id to Arrow IPC stream bytes
+
+        Raises:
+            NotImplementedError: If the backend has no Arrow transport
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support Arrow IPC output"
+        )
+
     @abstractmethod
     def to_json(self) -> str:
         """
@@ -193,12 +266,56 @@ class Backend(ABC):
         """
         pass
 
-    def show(self) -> None:
-        """Display the chart in Jupyter or browser."""
-        try:
+    def to_html_streamed(self, ttl: float = 600.0) -> str:
+        """
+        Generate HTML that fetches its data from a local HTTP server.
+
+        Args:
+            ttl: Seconds to keep serving the data
+
+        Returns:
+            HTML string
+
+        Raises:
+            NotImplementedError: If the backend cannot stream its data
+        """
+        return self._streamed_html(ttl)[0]
+
+    def _streamed_html(
+        self, ttl: float, stop_when_served: bool = True
+    ) -> Tuple[str, DataServer]:
+        """
+        Streamed HTML together with the server holding its data.
+
+        Raises:
+            NotImplementedError: If the backend cannot stream its data
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support streamed output"
+        )
+
+    def show(self, stream: bool = False, ttl: float = 600.0) -> None:
+        """
+        Display the chart in Jupyter or browser.
+
+        Args:
+            stream: Serve large series from a short-lived local HTTP
+                server on 127.0.0.1 instead of embedding them in the page.
+                The browser must run on the same machine as Python.
+            ttl: Seconds to keep serving streamed data
+        """
+        notebook = _in_ipython()
+        server = None
+        if stream:
+            # A notebook output can be re-rendered, so serve until ttl
+            html, server = self._streamed_html(ttl, stop_when_served=not notebook)
+        else:
+            html = self.to_html()
+
+        if notebook:
             from IPython.display import display, HTML
-            display(HTML(self.to_html()))
-        except ImportError:
+            display(HTML(html))
+        else:
             import tempfile
             import webbrowser
 
@@ -207,7 +324,7 @@ class Backend(ABC):
             <html>
             <head><title>{self.config.title or 'Chart'}</title></head>
             <body style="margin: 0; padding: 20px; background: {self.config.theme.colors.background};">
-                {self.to_html()}
+                {html}
             </body>
             </html>
             """
@@ -218,6 +335,11 @@ class Backend(ABC):
                 f.write(html_content)
                 webbrowser.open(f"file://{f.name}")
 
+            if server is not None:
+                # The server runs on daemon threads, which would die with
+                # the script before the browser gets to fetch the data
+                server.wait()
+
     def streamlit(self, height: Optional[int] = None) -> None:
         """
         Display the chart in Streamlit.
@@ -228,7 +350,11 @@ class Backend(ABC):
         import streamlit.components.v1 as components
 
         render_height = height or (self.config.height + 80)
-        components.html(self.to_html(), height=render_height, scrolling=False)
+        components.html(self._streamlit_html(), height=render_height, scrolling=False)
+
+    def _streamlit_html(self) -> str:
+        """HTML for streamlit(); backends may send a compressed payload."""
+        return self.to_html()
 
     @staticmethod
     def select_backend(
@@ -5,12 +5,13 @@ Renders hundreds of paths with density-based coloring using HTML5 Canvas.
 """
 
 from typing import Any, Dict, List, Optional, Union
-import json
 
 import numpy as np
 import polars as pl
 
 from wrchart.core.backends.base import Backend, BackendType, RenderConfig
+from wrchart.core.serialization import dumps
+from wrchart.core.themes import FONT_LINKS
 
 
 class CanvasBackend(Backend):
@@ -161,10 +162,15 @@ class CanvasBackend(Backend):
 
         return "rgb(128,128,128)"
 
-    def to_json(self) -> str:
-        """Generate JSON configuration."""
+    def _build_config(self) -> Dict[str, Any]:
+        """
+        Build the forecast configuration serialized by to_json().
+
+        Returns:
+            Configuration dict (empty until paths and history are set)
+        """
         if self._paths is None or self._historical is None:
-            return json.dumps({})
+            return {}
 
         n_paths, n_steps = self._paths.shape
         n_hist = len(self._historical)
@@ -201,14 +207,18 @@ class CanvasBackend(Backend):
         if self._weighted_forecast is not None:
             weighted = [last_price] + self._weighted_forecast.tolist()
 
-        return json.dumps({
+        return {
             "historical": {"x": list(range(n_hist)), "y": self._historical.tolist()},
             "paths": paths_data,
             "forecast_x": list(range(n_hist - 1, n_hist + n_steps)),
             "percentiles": percentiles,
             "weighted_forecast": weighted,
             "colorscale": self._get_colorscale_stops(),
-        })
+        }
+
+    def to_json(self) -> str:
+        """Generate JSON configuration."""
+        return dumps(self._build_config())
 
     def to_html(self) -> str:
         """Generate HTML for canvas rendering."""
@@ -223,8 +233,8 @@ class CanvasBackend(Backend):
         hist_color = "white" if is_dark else "black"
 
         return f"""
+        {FONT_LINKS}
         <style>
-            @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&display=swap');
             #forecast-container-{chart_id} {{
                 font-family: 'Space Grotesk', -apple-system, BlinkMacSystemFont, sans-serif;
                 background: {bg_color};
@@ -5,12 +5,18 @@ Uses TradingView's Lightweight Charts library (v4.2.1) for rendering
 interactive candlestick, line, area, and histogram charts.
 """
 
-from typing import Any, Dict, List, Optional
-import json
+from collections import OrderedDict
+from functools import cache
+from string import Template
+from typing import Any, Dict, List, Optional, Tuple
+import threading
 
 import polars as pl
 
 from wrchart.core.backends.base import Backend, BackendType, RenderConfig
+from wrchart.core.data_server import DataServer
+from wrchart.core.serialization import GUNZIP_JS, dumps, gzip_b64
+from wrchart.core.themes import FONT_LINKS, Theme
 from wrchart.core.series import (
     BaseSeries,
     CandlestickSeries,
@@ -21,9 +27,106 @@ from wrchart.core.series import (
     AreaOptions,
     HistogramSeries,
     HistogramOptions,
+    SeriesConfig,
+    collect_series,
 )
 
 
+# Where pages load the library from. Point this at a self-hosted copy
+# (for example a file served by Streamlit's static file serving, under
+# /app/static/) to take the CDN out of the page load.
+LIGHTWEIGHT_CHARTS_URL = (
+    "https://unpkg.com/lightweight-charts@4.2.1/dist/lightweight-charts.standalone.production.js"
+)
+
+# ES module used to decode Arrow-encoded and streamed series. Like
+# LIGHTWEIGHT_CHARTS_URL, set it to a self-hosted copy where jsdelivr is
+# unreachable (offline use, a strict CSP, a corporate proxy).
+ARROW_URL = "https://cdn.jsdelivr.net/npm/apache-arrow@17.0.0/+esm"
+
+
+@cache
+def _theme_substitutions(theme: Theme) -> Dict[str, str]:
+    """Theme colors used by the HTML template, built once per theme."""
+    colors = theme.colors
+    return {
+        "text_primary": colors.text_primary,
+        "text_secondary": colors.text_secondary,
+        "background": colors.background,
+        "candle_up": colors.candle_up,
+        "candle_down": colors.candle_down,
+    }
+
+
+def _share_time(
+    series: List[BaseSeries], configs: List[SeriesConfig]
+) -> Dict[str, Any]:
+    """
+    Send time columns shared by several series only once.
+
+    Series whose time columns have the same content (for example a
+    candlestick and the volume bars built from the same frame) drop
+    "time" from their data and point at one entry of the returned
+    mapping through time_ref instead. Arrow-encoded series keep their
+    own time column.
+
+    Args:
+        series: Series in payload order
+        configs: Their SeriesConfigs, updated in place
+
+    Returns:
+        Mapping of time_ref to the shared time array
+    """
+    groups: Dict[int, List[SeriesConfig]] = {}
+    for s, config in zip(series, configs):
+        if config.arrow is None and "time" in config.data:
+            key = s.time_fingerprint()
+            groups.setdefault(key, []).append(config)
+
+    shared: Dict[str, Any] = {}
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+        ref = f"t{len(shared)}"
+        shared[ref] = group[0].data["time"]
+        for config in group:
+            del config.data["time"]
+            config.time_ref = ref
+    return shared
+
+
+class _LRUCache:
+    """Small thread-safe LRU mapping shared by all chart instances."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: OrderedDict[Any, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Optional[str]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: str) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+# Series JSON by content, so charts rebuilt from unchanged data (every
+# Streamlit rerun builds a new Chart) skip serialization entirely
+_shared_series_json = _LRUCache(maxsize=4)
+
+
 class LightweightChartsBackend(Backend):
     """
     Backend using TradingView's Lightweight Charts library.
@@ -34,9 +137,17 @@ class LightweightChartsBackend(Backend):
     - Full feature set (crosshair, legend, zoom, pan)
     """
 
+    # Series with at least this many rows are embedded in the HTML as
+    # Arrow IPC; smaller ones stay as JSON arrays
+    ARROW_MIN_ROWS = 2000
+
     def __init__(self, config: Optional[RenderConfig] = None):
         super().__init__(config)
         self._series: List[BaseSeries] = []
+        # Serialized payload per transport (arrow=False/True), and the
+        # series part of it, which survives chart-level changes
+        self._json_cache: Dict[bool, Tuple[Tuple[int, ...], str]] = {}
+        self._series_cache: Dict[bool, Tuple[Tuple[Any, ...], str]] = {}
 
     @property
     def backend_type(self) -> BackendType:
@@ -92,6 +203,7 @@ class LightweightChartsBackend(Backend):
 
         series._id = f"series_{len(self._series)}"
         self._series.append(series)
+        self.invalidate()
         return self
 
     def add_volume(
@@ -103,245 +215,752 @@ class LightweightChartsBackend(Backend):
         close_col: str = "close",
         up_color: Optional[str] = None,
         down_color: Optional[str] = None,
+        lazy: bool = False,
     ) -> "LightweightChartsBackend":
-        """Add a volume histogram with up/down coloring."""
+        """
+        Add a volume histogram with up/down coloring.
+
+        With lazy=True the volume columns are kept as a LazyFrame and only
+        collected when the chart is serialized, together with any other
+        lazy series. Bar direction is sent as a 0/1 flag rather than a
+        per-bar color string.
+        """
         up_c = up_color or self.config.theme.colors.volume_up
         down_c = down_color or self.config.theme.colors.volume_down
 
-        volume_data = data.select([
+        volume_data = data.lazy().select([
             pl.col(time_col).alias("time"),
             pl.col(volume_col).alias("value"),
-            pl.when(pl.col(close_col) >= pl.col(open_col))
-            .then(pl.lit(up_c))
-            .otherwise(pl.lit(down_c))
-            .alias("color"),
+            # A 1-byte flag; the browser resolves it to up_c/down_c
+            (pl.col(close_col) >= pl.col(open_col)).cast(pl.UInt8).alias("up"),
         ])
+        if not lazy:
+            volume_data = volume_data.collect()
 
         series = HistogramSeries(
             data=volume_data,
             time_col="time",
             value_col="value",
-            color_col="color",
+            up_col="up",
             options=HistogramOptions(
                 price_scale_id="volume",
                 price_line_visible=False,
                 last_value_visible=False,
+                up_color=up_c,
+                down_color=down_c,
             ),
         )
         series._id = f"series_{len(self._series)}"
         self._series.append(series)
+        self.invalidate()
         return self
 
-    def to_json(self) -> str:
-        """Generate JSON configuration for the chart."""
-        # Sort series so candlestick comes last (renders on top)
-        sorted_series = sorted(
-            self._series,
-            key=lambda s: 1 if s.series_type() == "Candlestick" else 0
-        )
+    def _build_config(
+        self, arrow: bool = False, server: Optional[DataServer] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the chart configuration shared by to_json() and to_html().
+
+        Args:
+            arrow: Embed series with at least ARROW_MIN_ROWS rows as
+                base64 Arrow IPC streams instead of JSON arrays
+            server: Register those series on this server instead, so the
+                page fetches them rather than carrying them inline
 
-        config = {
-            "id": self.config.chart_id,
-            "width": self.config.width,
-            "height": self.config.height,
-            "title": self.config.title,
-            "options": self.config.theme.to_lightweight_charts_options(),
-            "series": [
-                {
-                    "id": s._id,
-                    "type": s.series_type(),
-                    "data": s.to_js_data(),
-                    "options": s.to_js_options(self.config.theme),
-                }
-                for s in sorted_series
-            ],
+        Returns:
+            Configuration dict ready to be serialized once
+        """
+        return {**self._view_config(), **self._series_config(arrow, server)}
+
+    def _view_config(self) -> Dict[str, Any]:
+        """Chart-level part of the configuration; cheap to rebuild."""
+        config = self.config
+        options = config.theme.to_lightweight_charts_options()
+        if not config.interactive_legend:
+            options["crosshair"]["mode"] = 2  # Hidden
+        if not config.pinch_zoom:
+            options["handleScale"] = {"pinch": False}
+        return {
+            "id": config.chart_id,
+            "width": config.width,
+            "height": config.height,
+            "title": config.title,
+            "legend": config.interactive_legend,
+            "options": options,
             "markers": self._markers,
             "priceLines": self._price_lines,
         }
-        return json.dumps(config)
+
+    def _series_config(
+        self, arrow: bool = False, server: Optional[DataServer] = None
+    ) -> Dict[str, Any]:
+        """Series part of the configuration; holds all the data."""
+        collect_series(self._series)
+        series = self._series
+        target = self._target_bars()
+        if target is not None:
+            series = [
+                s.downsampled(target)
+                if s.data is not None and len(s.data) > 4 * target
+                else s
+                for s in series
+            ]
+
+        # Candlesticks go last (render on top); one stable partition pass
+        overlays: List[BaseSeries] = []
+        candles: List[BaseSeries] = []
+        for s in series:
+            (candles if s.series_type() == "Candlestick" else overlays).append(s)
+        sorted_series = overlays + candles
+
+        config = self.config
+        theme = config.theme
+        precision = config.precision
+        min_rows = self.ARROW_MIN_ROWS
+        configs: List[SeriesConfig] = []
+        append = configs.append
+        for s in sorted_series:
+            data = s.data
+            large = data is not None and len(data) >= min_rows
+            url = None
+            if large and server is not None:
+                url = server.add(
+                    f"chart/{config.chart_id}/{s._id}.arrow",
+                    s.to_arrow_ipc(precision),
+                )
+            append(
+                s.to_config(
+                    theme, arrow=arrow and large, arrow_url=url, precision=precision
+                )
+            )
+
+        # The legend reads the main (last) candlestick's change per bar
+        return {
+            "series": configs,
+            "sharedTime": _share_time(sorted_series, configs),
+            "precomputed": candles[-1].change_stats() if candles else None,
+        }
+
+    def _target_bars(self) -> Optional[int]:
+        """Bars to merge large series down to, if downsampling is enabled."""
+        if not self.config.downsample:
+            return None
+        # One bar per device pixel column at a pixel ratio of 2
+        return max(1, self.config.width // 2)
+
+    def invalidate(self) -> None:
+        """Drop all cached JSON, including the serialized series."""
+        self._series_cache.clear()
+        self._json_cache.clear()
+
+    def invalidate_view(self) -> None:
+        """Drop the assembled JSON but keep the serialized series."""
+        self._json_cache.clear()
+
+    def _cache_key(self) -> Tuple[int, ...]:
+        """
+        Data versions of the series.
+
+        Chart-level changes go through invalidate(); this catches series
+        whose data was replaced directly with set_data().
+        """
+        return tuple(s._version for s in self._series)
+
+    def _serialize(self, arrow: bool) -> str:
+        """
+        Serialize the config, reusing cached results until a change.
+
+        The series JSON, which carries all the data, is cached apart from
+        the chart-level settings, so a new size, title or marker only
+        re-serializes the small view part and splices the two objects.
+        """
+        key = self._cache_key()
+        cached = self._json_cache.get(arrow)
+        if cached is None or cached[0] != key:
+            view_json = dumps(self._view_config())
+            cached = (key, self._join(view_json, self._series_json(arrow)))
+            self._json_cache[arrow] = cached
+        return cached[1]
+
+    def _series_json(self, arrow: bool) -> str:
+        """Serialized series part, cached per data version and render settings."""
+        key = (
+            self._cache_key(),
+            self.config.theme,
+            self.config.precision,
+            self._target_bars(),
+        )
+        cached = self._series_cache.get(arrow)
+        if cached is None or cached[0] != key:
+            content_key = self._content_key(arrow)
+            series_json = _shared_series_json.get(content_key)
+            if series_json is None:
+                series_json = dumps(self._series_config(arrow))
+                _shared_series_json.put(content_key, series_json)
+            cached = (key, series_json)
+            self._series_cache[arrow] = cached
+        return cached[1]
+
+    def _content_key(self, arrow: bool) -> Tuple[Any, ...]:
+        """
+        Key describing everything the series JSON is built from.
+
+        Unlike the version-based key it is stable across chart instances,
+        so a chart rebuilt from the same data (a Streamlit rerun) finds the
+        JSON an earlier instance produced.
+        """
+        collect_series(self._series)
+        config = self.config
+        theme = config.theme
+        return (
+            self.ARROW_MIN_ROWS if arrow else None,
+            theme,
+            config.precision,
+            self._target_bars(),
+            tuple(
+                (s._id, s.series_type(), s.fingerprint(), dumps(s.to_js_options(theme)))
+                for s in self._series
+            ),
+        )
+
+    @staticmethod
+    def _join(view_json: str, series_json: str) -> str:
+        """Merge two serialized JSON objects into one."""
+        return f"{view_json[:-1]},{series_json[1:]}"
+
+    def to_json(self) -> str:
+        """Generate JSON configuration for the chart."""
+        return self._serialize(arrow=False)
+
+    def to_arrow_ipc(self) -> Dict[str, bytes]:
+        """
+        Serialize each series' data as an Arrow IPC stream.
+
+        Returns:
+            Mapping of series id to Arrow IPC stream bytes
+        """
+        collect_series(self._series)
+        precision = self.config.precision
+        return {s._id: s.to_arrow_ipc(precision) for s in self._series}
 
     def to_html(self) -> str:
         """Generate HTML for rendering the chart."""
-        config_json = self.to_json()
+        return self._render(self._serialize(arrow=True))
+
+    def to_html_streamed(self, ttl: float = 600.0) -> str:
+        """
+        Generate HTML that fetches large series from a local HTTP server.
+
+        Series with at least ARROW_MIN_ROWS rows are served as Arrow IPC
+        from 127.0.0.1 instead of being inlined, so the page is small and
+        the browser downloads the series concurrently. The server stops
+        once each series has been fetched, or after ``ttl`` seconds, so
+        the page only renders in full while it is being served, and only
+        in a browser on the same machine (not JupyterHub or Colab).
+
+        Args:
+            ttl: Seconds to keep serving the data
+
+        Returns:
+            HTML string
+        """
+        return self._streamed_html(ttl)[0]
+
+    def _streamed_html(
+        self, ttl: float, stop_when_served: bool = True
+    ) -> Tuple[str, DataServer]:
+        """Build the streamed page and start its server if it has payloads."""
+        server = DataServer(ttl, stop_when_served)
+        html = self._render(dumps(self._build_config(arrow=True, server=server)))
+        if len(server):
+            server.start()
+        else:
+            server.stop()
+        return html, server
+
+    def _streamlit_html(self) -> str:
+        """Streamlit re-sends the page on every rerun, so gzip the config."""
+        return self._render(self._serialize(arrow=True), compress=True)
+
+    def _render(self, config_json: str, compress: bool = False) -> str:
+        """
+        Fill the HTML template with a serialized config.
+
+        Args:
+            config_json: Chart configuration as JSON
+            compress: Inline the config gzipped and base64-encoded; the
+                page inflates it with DecompressionStream
+        """
         theme = self.config.theme
         chart_id = self.config.chart_id
+        title = self.config.title
+
+        config = config_json
+        if compress:
+            config = f'await gunzipJSON("{gzip_b64(config_json)}")'
+
+        return _HTML_TEMPLATE.substitute(
+            _theme_substitutions(theme),
+            chart_id=chart_id,
+            config=config,
+            library_url=LIGHTWEIGHT_CHARTS_URL,
+            arrow_url=ARROW_URL,
+            font_links=FONT_LINKS,
+            legend_top=32 if title else 8,
+            title_html=f"<div id='wrchart-title-{chart_id}'>{title}</div>" if title else "",
+        )
 
-        return f"""
-        <style>
-            @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap');
-            #wrchart-container-{chart_id} {{
-                font-family: 'Space Grotesk', -apple-system, BlinkMacSystemFont, sans-serif;
-                width: 100%;
-                position: relative;
-            }}
-            #wrchart-title-{chart_id} {{
-                font-size: 14px;
-                font-weight: 600;
-                color: {theme.colors.text_primary};
-                margin-bottom: 8px;
-                letter-spacing: -0.02em;
-            }}
-            #wrchart-{chart_id} {{ width: 100%; }}
-            #wrchart-legend-{chart_id} {{
-                position: absolute;
-                top: {32 if self.config.title else 8}px;
-                left: 12px;
-                z-index: 10;
-                font-family: 'JetBrains Mono', monospace;
-                font-size: 12px;
-                color: {theme.colors.text_primary};
-                background: {theme.colors.background}ee;
-                padding: 6px 10px;
-                border-radius: 4px;
-                pointer-events: none;
-                min-width: 200px;
-            }}
-            #wrchart-legend-{chart_id} .legend-date {{
-                font-weight: 600;
-                margin-bottom: 4px;
-                color: {theme.colors.text_secondary};
-            }}
-            #wrchart-legend-{chart_id} .legend-row {{
-                display: flex;
-                justify-content: space-between;
-                gap: 12px;
-            }}
-            #wrchart-legend-{chart_id} .legend-label {{ color: {theme.colors.text_secondary}; }}
-            #wrchart-legend-{chart_id} .legend-value {{ font-weight: 500; }}
-            #wrchart-legend-{chart_id} .legend-value.up {{ color: {theme.colors.candle_up}; }}
-            #wrchart-legend-{chart_id} .legend-value.down {{ color: {theme.colors.candle_down}; }}
-        </style>
-        <div id="wrchart-container-{chart_id}">
-            {"<div id='wrchart-title-" + chart_id + "'>" + self.config.title + "</div>" if self.config.title else ""}
-            <div id="wrchart-legend-{chart_id}"></div>
-            <div id="wrchart-{chart_id}"></div>
-        </div>
-        <script src="https://unpkg.com/lightweight-charts@4.2.1/dist/lightweight-charts.standalone.production.js"></script>
-        <script>
-        (function() {{
-            const config = {config_json};
-            const container = document.getElementById('wrchart-' + config.id);
-            const legendEl = document.getElementById('wrchart-legend-' + config.id);
-            const containerWidth = container.parentElement.offsetWidth || config.width;
-
-            const chart = LightweightCharts.createChart(container, {{
-                width: containerWidth,
-                height: config.height,
-                ...config.options,
-                timeScale: {{
-                    ...config.options.timeScale,
-                    timeVisible: true,
-                    secondsVisible: false,
-                }},
-            }});
-
-            const seriesMap = {{}};
-            let mainSeries = null;
-            let fallbackMainSeries = null;
-
-            config.series.forEach(seriesConfig => {{
-                let series;
-                switch(seriesConfig.type) {{
-                    case 'Candlestick':
-                        series = chart.addCandlestickSeries(seriesConfig.options);
-                        mainSeries = {{ series, type: 'candlestick', data: seriesConfig.data }};
-                        break;
-                    case 'Line':
-                        series = chart.addLineSeries(seriesConfig.options);
-                        if (!fallbackMainSeries) fallbackMainSeries = {{ series, type: 'line', data: seriesConfig.data }};
-                        break;
-                    case 'Area':
-                        series = chart.addAreaSeries(seriesConfig.options);
-                        if (!fallbackMainSeries) fallbackMainSeries = {{ series, type: 'area', data: seriesConfig.data }};
-                        break;
-                    case 'Histogram':
-                        series = chart.addHistogramSeries(seriesConfig.options);
-                        break;
-                    default:
-                        console.warn('Unknown series type:', seriesConfig.type);
-                        return;
-                }}
-                series.setData(seriesConfig.data);
-                seriesMap[seriesConfig.id] = series;
-            }});
-
-            if (!mainSeries) mainSeries = fallbackMainSeries;
-
-            if (config.markers.length > 0) {{
-                const candlestickSeries = config.series.find(s => s.type === 'Candlestick');
-                if (candlestickSeries) seriesMap[candlestickSeries.id].setMarkers(config.markers);
-            }}
-
-            const volumeSeries = config.series.find(s => s.options.priceScaleId === 'volume');
-            if (volumeSeries) {{
-                chart.priceScale('volume').applyOptions({{ scaleMargins: {{ top: 0.8, bottom: 0 }} }});
-            }}
-
-            if (config.priceLines && config.priceLines.length > 0 && mainSeries) {{
-                config.priceLines.forEach(lineConfig => mainSeries.series.createPriceLine(lineConfig));
-            }}
-
-            function formatTime(time) {{
-                if (typeof time === 'string') return time;
-                const date = new Date(time * 1000);
-                return date.toLocaleDateString('en-US', {{
-                    weekday: 'short', year: 'numeric', month: 'short', day: 'numeric',
-                    hour: '2-digit', minute: '2-digit'
-                }});
-            }}
-
-            function formatValue(value) {{
-                if (value === undefined || value === null) return '-';
-                if (Math.abs(value) >= 1000) {{
-                    return value.toLocaleString('en-US', {{ minimumFractionDigits: 2, maximumFractionDigits: 2 }});
-                }}
-                return value.toFixed(Math.abs(value) < 1 ? 4 : 2);
-            }}
-
-            chart.subscribeCrosshairMove((param) => {{
-                if (!param || !param.time || !mainSeries) {{
-                    legendEl.innerHTML = '';
-                    return;
-                }}
-
-                const data = param.seriesData.get(mainSeries.series);
-                if (!data) {{
-                    legendEl.innerHTML = '';
-                    return;
-                }}
-
-                const timeStr = formatTime(param.time);
-                let legendHtml = '<div class="legend-date">' + timeStr + '</div>';
-
-                if (mainSeries.type === 'candlestick' && data.open !== undefined) {{
-                    const change = data.close - data.open;
-                    const changePct = ((change / data.open) * 100).toFixed(2);
-                    const colorClass = change >= 0 ? 'up' : 'down';
-                    legendHtml += `
-                        <div class="legend-row"><span class="legend-label">O</span><span class="legend-value">${{formatValue(data.open)}}</span></div>
-                        <div class="legend-row"><span class="legend-label">H</span><span class="legend-value">${{formatValue(data.high)}}</span></div>
-                        <div class="legend-row"><span class="legend-label">L</span><span class="legend-value">${{formatValue(data.low)}}</span></div>
-                        <div class="legend-row"><span class="legend-label">C</span><span class="legend-value ${{colorClass}}">${{formatValue(data.close)}}</span></div>
-                        <div class="legend-row"><span class="legend-label">Chg</span><span class="legend-value ${{colorClass}}">${{change >= 0 ? '+' : ''}}${{changePct}}%</span></div>
-                    `;
-                }} else if (data.value !== undefined) {{
-                    legendHtml += `<div class="legend-row"><span class="legend-label">Value</span><span class="legend-value">${{formatValue(data.value)}}</span></div>`;
-                }}
-
-                legendEl.innerHTML = legendHtml;
-            }});
-
-            container.addEventListener('dblclick', () => chart.timeScale().fitContent());
-
-            const resizeObserver = new ResizeObserver(entries => {{
-                for (let entry of entries) {{
-                    const width = entry.contentRect.width;
-                    if (width > 0) chart.applyOptions({{ width: width }});
-                }}
-            }});
-            resizeObserver.observe(container.parentElement);
 
+# Parsed once at import; ``$$`` escapes the ``$`` in JS template literals.
+_HTML_TEMPLATE = Template("""
+${font_links}
+<style>
+    #wrchart-container-${chart_id} {
+        font-family: 'Space Grotesk', -apple-system, BlinkMacSystemFont, sans-serif;
+        width: 100%;
+        position: relative;
+    }
+    #wrchart-title-${chart_id} {
+        font-size: 14px;
+        font-weight: 600;
+        color: ${text_primary};
+        margin-bottom: 8px;
+        letter-spacing: -0.02em;
+    }
+    #wrchart-${chart_id} { width: 100%; }
+    .wrchart-error {
+        padding: 16px;
+        font-size: 13px;
+        color: ${text_secondary};
+    }
+</style>
+<div id="wrchart-container-${chart_id}">
+    ${title_html}
+    <div id="wrchart-legend-${chart_id}"></div>
+    <div id="wrchart-${chart_id}"></div>
+</div>
+<script>
+(async function() {""" + GUNZIP_JS + """
+    // Load the library once per page, however many charts it holds, and
+    // let it download while the config is decoded
+    function loadLibrary() {
+        if (typeof LightweightCharts !== 'undefined') return Promise.resolve();
+        window.wrchartLibrary = window.wrchartLibrary || new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = '${library_url}';
+            script.onload = resolve;
+            script.onerror = () => {
+                window.wrchartLibrary = null;
+                reject(new Error('Failed to load Lightweight Charts'));
+            };
+            document.head.appendChild(script);
+        });
+        return window.wrchartLibrary;
+    }
+    const library = loadLibrary();
+
+    const config = ${config};
+    const container = document.getElementById('wrchart-' + config.id);
+    const legendEl = document.getElementById('wrchart-legend-' + config.id);
+    const containerWidth = container.parentElement.offsetWidth || config.width;
+
+    // Put load failures in the chart area instead of leaving it blank
+    function showError(message, err) {
+        console.error(message, err);
+        const box = document.createElement('div');
+        box.className = 'wrchart-error';
+        box.style.height = config.height + 'px';
+        box.textContent = message + (err && err.message ? ': ' + err.message : '');
+        container.replaceChildren(box);
+    }
+
+    try {
+        await library;
+    } catch (err) {
+        showError('Could not load Lightweight Charts from ${library_url}', err);
+        return;
+    }
+    const chart = LightweightCharts.createChart(container, {
+        width: containerWidth,
+        height: config.height,
+        ...config.options,
+        timeScale: {
+            ...config.options.timeScale,
+            timeVisible: true,
+            secondsVisible: false,
+        },
+    });
+
+    // Large series arrive as base64 Arrow IPC; read each column as a
+    // typed array rather than materializing Arrow row objects
+    function fromArrow(arrow, bytes) {
+        const table = arrow.tableFromIPC(bytes);
+        const columns = {};
+        table.schema.fields.forEach(f => { columns[f.name] = table.getChild(f.name).toArray(); });
+        return columns;
+    }
+
+    function fromBase64(b64) {
+        const bin = atob(b64);
+        const bytes = new Uint8Array(bin.length);
+        for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+        return bytes;
+    }
+
+    // Streamed series are fetched from a local server, retrying with backoff
+    async function fetchBytes(url, retries = 3) {
+        for (let attempt = 0; ; attempt++) {
+            try {
+                const response = await fetch(url);
+                if (!response.ok) throw new Error(`$${response.status} $${url}`);
+                return new Uint8Array(await response.arrayBuffer());
+            } catch (err) {
+                if (attempt >= retries) throw err;
+                await new Promise(r => setTimeout(r, 250 * 2 ** attempt));
+            }
+        }
+    }
+
+    if (config.series.some(s => s.arrow || s.arrow_url)) {
+        let arrow;
+        try {
+            arrow = await import('${arrow_url}');
+        } catch (err) {
+            chart.remove();
+            showError('Could not load Apache Arrow from ${arrow_url}', err);
+            return;
+        }
+        try {
+            await Promise.all(config.series.map(async s => {
+                if (s.arrow_url) s.data = fromArrow(arrow, await fetchBytes(s.arrow_url));
+                else if (s.arrow) s.data = fromArrow(arrow, fromBase64(s.arrow));
+            }));
+        } catch (err) {
+            chart.remove();
+            showError('Could not read the chart data', err);
+            return;
+        }
+    }
+
+    // Series data arrives as columns; build row objects once here.
+    // NaN (Arrow) and null (JSON) both mark missing values.
+    function toRows(columns) {
+        const keys = Object.keys(columns);
+        // Fixed-shape literals for the common layouts build about twice
+        // as fast as adding the keys one at a time
+        if (keys.length === 5 && columns.time && columns.open && columns.high
+                && columns.low && columns.close) {
+            return candleRows(columns);
+        }
+        if (keys.length === 2 && columns.time && columns.value) {
+            return valueRows(columns);
+        }
+        const n = keys.length ? columns[keys[0]].length : 0;
+        const rows = new Array(n);
+        for (let i = 0; i < n; i++) {
+            const row = {};
+            for (let k = 0; k < keys.length; k++) {
+                const v = columns[keys[k]][i];
+                row[keys[k]] = v !== v ? null : v;
+            }
+            rows[i] = row;
+        }
+        return rows;
+    }
+
+    const orNull = v => v !== v ? null : v;
+
+    function candleRows({ time, open, high, low, close }) {
+        const n = time.length;
+        const rows = new Array(n);
+        for (let i = 0; i < n; i++) {
+            rows[i] = {
+                time: time[i], open: orNull(open[i]), high: orNull(high[i]),
+                low: orNull(low[i]), close: orNull(close[i]),
+            };
+        }
+        return rows;
+    }
+
+    function valueRows({ time, value }) {
+        const n = time.length;
+        const rows = new Array(n);
+        for (let i = 0; i < n; i++) rows[i] = { time: time[i], value: orNull(value[i]) };
+        return rows;
+    }
+
+    // Resolve a series' columns (shared time, volume colors) into rows
+    function rowsOf(seriesConfig) {
+        const columns = seriesConfig.data;
+        if (seriesConfig.time_ref) columns.time = config.sharedTime[seriesConfig.time_ref];
+        if (columns.up) {
+            // Volume bars carry a 0/1 direction flag; resolve it to colors
+            const [upColor, downColor] = seriesConfig.colors;
+            const { up, ...rest } = columns;
+            rest.color = Array.from(up, f => (f ? upColor : downColor));
+            return toRows(rest);
+        }
+        return toRows(columns);
+    }
+
+    // Series are created in payload order, which sets their z-order, but
+    // only the main series gets its data before the first paint; the rest
+    // is filled in once the browser is idle
+    const created = [];
+    let mainSeries = null;
+    let fallbackMainSeries = null;
+    let markerSeries = null;
+    let hasVolume = false;
+
+    config.series.forEach(seriesConfig => {
+        let options = seriesConfig.options;
+        if (options.priceScaleId === 'volume') hasVolume = true;
+        if (seriesConfig.data.up) {
+            const { upColor, downColor, ...rest } = options;
+            seriesConfig.colors = [upColor, downColor];
+            options = rest;
+        }
+        let series;
+        switch(seriesConfig.type) {
+            case 'Candlestick':
+                series = chart.addCandlestickSeries(options);
+                mainSeries = { series, type: 'candlestick', seriesConfig };
+                if (!markerSeries) markerSeries = series;
+                break;
+            case 'Line':
+                series = chart.addLineSeries(options);
+                if (!fallbackMainSeries) fallbackMainSeries = { series, type: 'line', seriesConfig };
+                break;
+            case 'Area':
+                series = chart.addAreaSeries(options);
+                if (!fallbackMainSeries) fallbackMainSeries = { series, type: 'area', seriesConfig };
+                break;
+            case 'Histogram':
+                series = chart.addHistogramSeries(options);
+                break;
+            default:
+                console.warn('Unknown series type:', seriesConfig.type);
+                return;
+        }
+        created.push({ series, seriesConfig });
+    });
+
+    if (!mainSeries) mainSeries = fallbackMainSeries;
+    if (mainSeries) {
+        mainSeries.data = rowsOf(mainSeries.seriesConfig);
+        mainSeries.series.setData(mainSeries.data);
+    }
+
+    const deferred = created.filter(c => !mainSeries || c.series !== mainSeries.series);
+    if (deferred.length > 0) {
+        const whenIdle = window.requestIdleCallback
+            ? f => window.requestIdleCallback(f, { timeout: 200 })
+            : f => setTimeout(f, 0);
+        whenIdle(() => {
+            deferred.forEach(({ series, seriesConfig }) => series.setData(rowsOf(seriesConfig)));
             chart.timeScale().fitContent();
-        }})();
-        </script>
-        """
+        });
+    }
+
+    // The library re-lays out every marker on each redraw; with many of
+    // them, hand it only those inside the visible time range
+    const MARKER_WINDOW_MIN = 200;
+    function showMarkers(series, markers) {
+        if (markers.some(m => typeof m.time !== 'number')) {
+            series.setMarkers(markers);
+            return;
+        }
+        const sorted = markers.slice().sort((a, b) => a.time - b.time);
+        if (sorted.length <= MARKER_WINDOW_MIN) {
+            series.setMarkers(sorted);
+            return;
+        }
+        // Index of the first marker at or after t (after t when inclusive)
+        const bisect = (t, inclusive) => {
+            let lo = 0, hi = sorted.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >> 1;
+                if (sorted[mid].time < t || (inclusive && sorted[mid].time === t)) lo = mid + 1;
+                else hi = mid;
+            }
+            return lo;
+        };
+        let shownFrom = -1, shownTo = -1;
+        const update = range => {
+            if (!range) return;
+            const from = bisect(range.from, false);
+            const to = bisect(range.to, true);
+            if (from === shownFrom && to === shownTo) return;
+            shownFrom = from;
+            shownTo = to;
+            series.setMarkers(sorted.slice(from, to));
+        };
+        chart.timeScale().subscribeVisibleTimeRangeChange(update);
+        update(chart.timeScale().getVisibleRange());
+    }
+
+    if (config.markers.length > 0 && markerSeries) {
+        showMarkers(markerSeries, config.markers);
+    }
+
+    if (hasVolume) {
+        chart.priceScale('volume').applyOptions({ scaleMargins: { top: 0.8, bottom: 0 } });
+    }
+
+    if (config.priceLines && config.priceLines.length > 0 && mainSeries) {
+        config.priceLines.forEach(lineConfig => mainSeries.series.createPriceLine(lineConfig));
+    }
+
+    // toLocale* builds a fresh Intl formatter on every call; build them once
+    const timeFormat = new Intl.DateTimeFormat('en-US', {
+        weekday: 'short', year: 'numeric', month: 'short', day: 'numeric',
+        hour: '2-digit', minute: '2-digit'
+    });
+    const thousandsFormat = new Intl.NumberFormat('en-US', {
+        minimumFractionDigits: 2, maximumFractionDigits: 2
+    });
+
+    function formatTime(time) {
+        if (typeof time === 'string') return time;
+        return timeFormat.format(new Date(time * 1000));
+    }
+
+    function formatValue(value) {
+        if (value === undefined || value === null) return '-';
+        if (Math.abs(value) >= 1000) {
+            return thousandsFormat.format(value);
+        }
+        return value.toFixed(Math.abs(value) < 1 ? 4 : 2);
+    }
+
+    // The legend is styled and built once, on the first crosshair move;
+    // later moves only update the text of its nodes
+    let lg = null;
+    function buildLegend() {
+        legendEl.style.cssText = "position: absolute; top: ${legend_top}px; left: 12px; z-index: 10; font: 12px 'JetBrains Mono', monospace; color: ${text_primary}; background: ${background}ee; padding: 6px 10px; border-radius: 4px; pointer-events: none; min-width: 200px;";
+        const sel = '#' + legendEl.id;
+        const style = document.createElement('style');
+        style.textContent =
+            `$${sel} .legend-date { font-weight: 600; margin-bottom: 4px; color: ${text_secondary}; }` +
+            `$${sel} .legend-row { display: flex; justify-content: space-between; gap: 12px; }` +
+            `$${sel} .legend-label { color: ${text_secondary}; }` +
+            `$${sel} .legend-value { font-weight: 500; }` +
+            `$${sel} .legend-value.up { color: ${candle_up}; }` +
+            `$${sel} .legend-value.down { color: ${candle_down}; }`;
+        document.head.appendChild(style);
+
+        const node = (tag, className, text) => {
+            const el = document.createElement(tag);
+            el.className = className;
+            if (text) el.textContent = text;
+            return el;
+        };
+        const row = (label) => {
+            const el = node('div', 'legend-row');
+            const value = node('span', 'legend-value');
+            el.append(node('span', 'legend-label', label), value);
+            legendEl.appendChild(el);
+            return { row: el, value };
+        };
+        const date = node('div', 'legend-date');
+        legendEl.appendChild(date);
+        lg = {
+            date, mode: null,
+            o: row('O'), h: row('H'), l: row('L'), c: row('C'), chg: row('Chg'),
+            value: row('Value'),
+        };
+    }
+
+    // mode: null (hidden), 'date', 'ohlc' or 'value'
+    function setLegendMode(mode) {
+        if (lg.mode === mode) return;
+        lg.mode = mode;
+        legendEl.style.display = mode ? '' : 'none';
+        const ohlc = mode === 'ohlc' ? '' : 'none';
+        for (const k of ['o', 'h', 'l', 'c', 'chg']) lg[k].row.style.display = ohlc;
+        lg.value.row.style.display = mode === 'value' ? '' : 'none';
+    }
+
+    // Mouse events can outpace the display; write the legend at most once
+    // per animation frame, using the latest crosshair position
+    let pendingParam = null;
+    let legendFrame = 0;
+    let lastLegendTime = null;
+    if (config.legend) {
+        chart.subscribeCrosshairMove((param) => {
+            pendingParam = param;
+            if (!legendFrame) legendFrame = requestAnimationFrame(flushLegend);
+        });
+    }
+
+    function flushLegend() {
+        legendFrame = 0;
+        const param = pendingParam;
+        if (!lg) buildLegend();
+        if (!param || !param.time || !mainSeries) {
+            lastLegendTime = null;
+            setLegendMode(null);
+            return;
+        }
+        if (param.time === lastLegendTime) return;
+
+        const data = param.seriesData.get(mainSeries.series);
+        if (!data) {
+            lastLegendTime = null;
+            setLegendMode(null);
+            return;
+        }
+        lastLegendTime = param.time;
+
+        lg.date.textContent = formatTime(param.time);
+
+        if (mainSeries.type === 'candlestick' && data.open !== undefined) {
+            // Change per bar is computed server-side; param.logical indexes
+            // it whenever the candles own the time scale (checked by value)
+            const pre = config.precomputed;
+            const i = param.logical;
+            const row = mainSeries.data[i];
+            let up, changePct;
+            if (pre && row && row.open === data.open && row.close === data.close
+                    && pre.signs[i] >= 0) {
+                up = pre.signs[i] === 1;
+                changePct = (pre.changePcts[i] / 100).toFixed(2);
+            } else {
+                const change = data.close - data.open;
+                up = change >= 0;
+                changePct = ((change / data.open) * 100).toFixed(2);
+            }
+            const colorClass = up ? 'legend-value up' : 'legend-value down';
+            lg.o.value.textContent = formatValue(data.open);
+            lg.h.value.textContent = formatValue(data.high);
+            lg.l.value.textContent = formatValue(data.low);
+            lg.c.value.textContent = formatValue(data.close);
+            lg.chg.value.textContent = (up ? '+' : '') + changePct + '%';
+            lg.c.value.className = lg.chg.value.className = colorClass;
+            setLegendMode('ohlc');
+        } else if (data.value !== undefined) {
+            lg.value.value.textContent = formatValue(data.value);
+            setLegendMode('value');
+        } else {
+            setLegendMode('date');
+        }
+    }
+
+    container.addEventListener('dblclick', () => chart.timeScale().fitContent());
+
+    // ResizeObserver already delivers at most once per frame; also skip
+    // the relayout when only the height changed
+    let lastWidth = 0;
+    const resizeObserver = new ResizeObserver(entries => {
+        const width = entries[entries.length - 1].contentRect.width;
+        if (width > 0 && width !== lastWidth) {
+            lastWidth = width;
+            chart.applyOptions({ width: width });
+        }
+    });
+    resizeObserver.observe(container.parentElement);
+
+    chart.timeScale().fitContent();
+})();
+</script>
+""")
@@ -5,12 +5,28 @@ Provides subplot-style visualization with different chart types
 arranged in a configurable grid.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
-import json
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import polars as pl
 
+from wrchart._sanitize import sanitize
 from wrchart.core.backends.base import Backend, BackendType, RenderConfig
+from wrchart.core.serialization import dumps
+from wrchart.core.series import _to_numpy
+from wrchart.core.themes import FONT_LINKS
+
+
+def _column_to_js(values: pl.Series) -> Union[np.ndarray, List[Any]]:
+    """
+    Convert a panel column for serialization.
+
+    Numeric columns become (usually zero-copy) NumPy arrays that the
+    encoder writes directly; other dtypes fall back to a Python list.
+    """
+    if values.dtype.is_numeric():
+        return sanitize(_to_numpy(values))
+    return values.to_list()
 
 
 class MultiPanelBackend(Backend):
@@ -150,8 +166,13 @@ class MultiPanelBackend(Backend):
 
         return int(x), int(y), int(panel_width), int(panel_height)
 
-    def to_json(self) -> str:
-        """Generate JSON configuration."""
+    def _build_config(self) -> Dict[str, Any]:
+        """
+        Build the dashboard configuration serialized by to_json().
+
+        Returns:
+            Configuration dict with one entry per panel
+        """
         panels_data = []
         for panel in self._panels:
             x, y, w, h = self._compute_panel_bounds(panel["row"], panel["col"])
@@ -164,18 +185,22 @@ class MultiPanelBackend(Backend):
                 "width": w,
                 "height": h,
                 "data": {
-                    "x": data[panel["time_col"]].to_list(),
-                    "y": data[panel["value_col"]].to_list(),
+                    "x": _column_to_js(data[panel["time_col"]]),
+                    "y": _column_to_js(data[panel["value_col"]]),
                 },
             })
 
-        return json.dumps({
+        return {
             "id": self.config.chart_id,
             "width": self.config.width,
             "height": self.config.height,
             "title": self.config.title,
             "panels": panels_data,
-        })
+        }
+
+    def to_json(self) -> str:
+        """Generate JSON configuration."""
+        return dumps(self._build_config())
 
     def to_html(self) -> str:
         """Generate HTML for multi-panel rendering."""
@@ -193,8 +218,8 @@ class MultiPanelBackend(Backend):
         for i, panel in enumerate(self._panels):
             x, y, w, h = self._compute_panel_bounds(panel["row"], panel["col"])
             data = panel["data"]
-            x_data = data[panel["time_col"]].to_list()
-            y_data = data[panel["value_col"]].to_list()
+            x_data = _column_to_js(data[panel["time_col"]])
+            y_data = _column_to_js(data[panel["value_col"]])
 
             panel_code.append(self._generate_panel_js(
                 panel_id=f"panel_{i}",
@@ -211,8 +236,8 @@ class MultiPanelBackend(Backend):
         panels_js = "\n".join(panel_code)
 
         return f"""
+        {FONT_LINKS}
         <style>
-            @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&display=swap');
             #multipanel-container-{chart_id} {{
                 font-family: 'Space Grotesk', -apple-system, BlinkMacSystemFont, sans-serif;
                 background: {bg_color};
@@ -257,15 +282,15 @@ class MultiPanelBackend(Backend):
         panel_type: str,
         title: Optional[str],
         x: int, y: int, w: int, h: int,
-        x_data: List,
-        y_data: List,
+        x_data: Union[np.ndarray, List],
+        y_data: Union[np.ndarray, List],
         text_color: str,
         grid_color: str,
         line_color: str,
     ) -> str:
         """Generate JavaScript for a single panel."""
-        x_json = json.dumps(x_data)
-        y_json = json.dumps(y_data)
+        x_json = dumps(x_data)
+        y_json = dumps(y_data)
 
         return f"""
             (function() {{
@@ -5,13 +5,34 @@ Handles millions of data points with dynamic Level of Detail (LOD)
 and efficient viewport culling.
 """
 
-from typing import Any, Dict, List, Optional, Tuple
-import json
+from typing import Any, Dict, List, Optional
+import base64
 
+import numpy as np
 import polars as pl
 
 from wrchart.core.backends.base import Backend, BackendType, RenderConfig
-from wrchart.transforms.decimation import lttb_downsample
+from wrchart.core.serialization import dumps
+
+
+# Vertex dtype -> (little-endian NumPy dtype, WebGL attribute type)
+_LOD_DTYPES = {
+    "float32": ("<f4", "FLOAT"),
+    "uint16": ("<u2", "UNSIGNED_SHORT"),
+}
+
+
+def _encode_lod(arr: np.ndarray, dtype: str) -> str:
+    """Quantize a normalized [0, 1] vertex array and base64-encode it."""
+    np_dtype, _ = _LOD_DTYPES[dtype]
+    if dtype == "uint16":
+        arr = np.rint(np.clip(arr, 0.0, 1.0) * 65535.0)
+    return base64.b64encode(arr.astype(np_dtype).tobytes()).decode("ascii")
+
+
+def _as_float64(series: pl.Series) -> np.ndarray:
+    """Convert a numeric or temporal column to a float64 array."""
+    return series.to_physical().cast(pl.Float64).to_numpy()
 
 
 class WebGLBackend(Backend):
@@ -40,7 +61,8 @@ class WebGLBackend(Backend):
         self._data: Optional[pl.DataFrame] = None
         self._time_col: str = "time"
         self._value_col: str = "value"
-        self._lod_data: List[List[Tuple[float, float]]] = []
+        self._lod_data: List[np.ndarray] = []
+        self._dtype: str = "float32"
 
     @property
     def backend_type(self) -> BackendType:
@@ -58,7 +80,20 @@ class WebGLBackend(Backend):
         close_col: Optional[str] = None,
         **options,
     ) -> "WebGLBackend":
-        """Add line data to the chart. WebGL backend only supports line series."""
+        """
+        Add line data to the chart. WebGL backend only supports line series.
+
+        Vertices are sent to the browser as ``float32`` by default. Pass
+        ``dtype="uint16"`` to quantize them to 16-bit normalized integers,
+        halving the payload and GPU buffer size at a resolution of 1/65535
+        of the visible range.
+        """
+        dtype = options.get("dtype", "float32")
+        if dtype not in _LOD_DTYPES:
+            raise ValueError(
+                f"Unknown dtype: {dtype}. Use one of {list(_LOD_DTYPES)}"
+            )
+        self._dtype = dtype
         self._data = data
         self._time_col = time_col
         self._value_col = value_col or close_col or "value"
@@ -70,6 +105,9 @@ class WebGLBackend(Backend):
         if self._data is None:
             return
 
+        # Imported here so the transforms package loads only when needed
+        from wrchart.transforms.decimation import lttb_downsample
+
         n_points = len(self._data)
         self._lod_data = []
 
@@ -84,14 +122,14 @@ class WebGLBackend(Backend):
                     target_points=target,
                 )
 
-            times = lod_df[self._time_col].to_list()
-            values = lod_df[self._value_col].to_list()
+            times = _as_float64(lod_df[self._time_col])
+            values = _as_float64(lod_df[self._value_col])
 
             if len(times) == 0:
                 continue
 
-            t_min, t_max = min(times), max(times)
-            v_min, v_max = min(values), max(values)
+            t_min, t_max = times.min(), times.max()
+            v_min, v_max = values.min(), values.max()
 
             v_range = v_max - v_min
             v_min -= v_range * 0.05
@@ -100,44 +138,44 @@ class WebGLBackend(Backend):
 
             t_range = t_max - t_min if t_max != t_min else 1
 
-            normalized = [
-                (
-                    (t - t_min) / t_range,
-                    (v - v_min) / v_range if v_range != 0 else 0.5
-                )
-                for t, v in zip(times, values)
-            ]
+            # Interleave into a flat [x0, y0, x1, y1, ...] vertex array
+            normalized = np.empty(2 * len(times), dtype=np.float64)
+            normalized[0::2] = (times - t_min) / t_range
+            normalized[1::2] = (values - v_min) / v_range if v_range != 0 else 0.5
 
             self._lod_data.append(normalized)
 
-    def to_json(self) -> str:
-        """Generate JSON configuration."""
-        lod_arrays = []
-        for lod_points in self._lod_data:
-            flat_data = []
-            for x, y in lod_points:
-                flat_data.extend([x, y])
-            lod_arrays.append(flat_data)
-
-        return json.dumps({
+    def _build_config(self) -> Dict[str, Any]:
+        """
+        Build the chart configuration shared by to_json() and to_html().
+
+        Returns:
+            Configuration dict with flattened [x0, y0, x1, y1, ...] LOD arrays
+        """
+        return {
             "id": self.config.chart_id,
             "width": self.config.width,
             "height": self.config.height,
-            "lod": lod_arrays,
-            "total_points": len(self._data) if self._data else 0,
-        })
+            "lod": self._lod_data,
+            "dtype": self._dtype,
+            "total_points": len(self._data) if self._data is not None else 0,
+        }
+
+    def to_json(self) -> str:
+        """Generate JSON configuration."""
+        return dumps(self._build_config())
 
     def to_html(self) -> str:
         """Generate HTML for WebGL rendering."""
-        lod_arrays = []
-        for lod_points in self._lod_data:
-            flat_data = []
-            for x, y in lod_points:
-                flat_data.extend([x, y])
-            lod_arrays.append(flat_data)
-
-        lod_json = json.dumps(lod_arrays)
-        total_points = len(self._data) if self._data is not None else 0
+        config = self._build_config()
+        # Ship each LOD level as base64 in the layout the vertex buffer
+        # uses, instead of a JSON number array
+        dtype = config["dtype"]
+        lod_json = dumps([_encode_lod(arr, dtype) for arr in config["lod"]])
+        array_type = "Uint16Array" if dtype == "uint16" else "Float32Array"
+        gl_type = _LOD_DTYPES[dtype][1]
+        gl_normalized = "true" if dtype == "uint16" else "false"
+        total_points = config["total_points"]
         colors = self.config.theme.colors
         chart_id = self.config.chart_id
 
@@ -232,7 +270,16 @@ class WebGLBackend(Backend):
             const uColor = gl.getUniformLocation(program, 'uColor');
 
             const lodArrays = {lod_json};
-            const lodLevels = lodArrays.map(arr => ({{ data: new Float32Array(arr), points: arr.length / 2 }}));
+            function decodeVertices(b64) {{
+                const bin = atob(b64);
+                const bytes = new Uint8Array(bin.length);
+                for (let i = 0; i < bin.length; i++) bytes[i] = bin.charCodeAt(i);
+                return new {array_type}(bytes.buffer);
+            }}
+            const lodLevels = lodArrays.map(b64 => {{
+                const data = decodeVertices(b64);
+                return {{ data: data, points: data.length / 2 }};
+            }});
             const visibleBuffer = gl.createBuffer();
 
             let viewX = 0, viewScale = 1;
@@ -255,12 +302,7 @@ class WebGLBackend(Backend):
                 const endIdx = Math.min(lodPoints - 1, Math.ceil(paddedEnd * lodPoints));
                 const count = endIdx - startIdx + 1;
                 if (count <= 0) return {{ data: null, count: 0 }};
-                const sliceData = new Float32Array(count * 2);
-                for (let i = 0; i < count; i++) {{
-                    sliceData[i * 2] = lodData[(startIdx + i) * 2];
-                    sliceData[i * 2 + 1] = lodData[(startIdx + i) * 2 + 1];
-                }}
-                return {{ data: sliceData, count: count }};
+                return {{ data: lodData.subarray(startIdx * 2, (endIdx + 1) * 2), count: count }};
             }}
 
             let lastFrameTime = performance.now(), frameCount = 0, fps = 0;
@@ -281,7 +323,7 @@ class WebGLBackend(Backend):
                     gl.bindBuffer(gl.ARRAY_BUFFER, visibleBuffer);
                     gl.bufferData(gl.ARRAY_BUFFER, visible.data, gl.DYNAMIC_DRAW);
                     gl.enableVertexAttribArray(aPosition);
-                    gl.vertexAttribPointer(aPosition, 2, gl.FLOAT, false, 0, 0);
+                    gl.vertexAttribPointer(aPosition, 2, gl.{gl_type}, {gl_normalized}, 0, 0);
                     gl.uniform2f(uScale, viewScale, 1.0);
                     gl.uniform2f(uOffset, -viewX, 0.0);
                     gl.uniform4f(uColor, {hl_r}, {hl_g}, {hl_b}, 1.0);
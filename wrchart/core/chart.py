@@ -6,12 +6,13 @@ backend based on data characteristics.
 """
 
 from typing import Any, Dict, List, Optional, Union
-import uuid
+import secrets
 
 import polars as pl
 import numpy as np
 
 from wrchart.core.schema import DataSchema
+from wrchart.core.series import PRECISIONS
 from wrchart.core.themes import Theme, WayyTheme, resolve_theme
 from wrchart.core.backends.base import Backend, BackendType, RenderConfig
 from wrchart.core.backends.lightweight import LightweightChartsBackend
@@ -54,6 +55,10 @@ class Chart:
         theme: Union[str, Theme, None] = None,
         title: Optional[str] = None,
         backend: str = "auto",
+        precision: str = "f32",
+        downsample: bool = False,
+        interactive_legend: bool = True,
+        pinch_zoom: bool = True,
     ):
         """
         Initialize a chart.
@@ -65,20 +70,41 @@ class Chart:
             theme: Theme name ("wayy", "dark", "light") or Theme instance
             title: Optional chart title
             backend: Backend selection ("auto", "lightweight", "webgl", "canvas", "multipanel")
+            precision: "f32" sends float value columns as float32, which
+                is more than a chart can display and half the payload;
+                "f64" keeps full precision. Time columns are never narrowed.
+                float32 keeps about 7 significant digits, so prices above
+                roughly 1e5 (indices, BTC) lose their cents; pass "f64"
+                for those.
+            downsample: With more than four bars per device pixel column
+                (width // 2 columns at a pixel ratio of 2), send
+                candlesticks and volume merged down to one bar per
+                column. Zooming in then shows the merged bars.
+            interactive_legend: Show the crosshair and the hover legend.
+                Without them the page does no work on mouse moves, which
+                suits dense charts that are only looked at.
+            pinch_zoom: Let touch pinch gestures scale the time axis
+
+        Raises:
+            ValueError: If precision is not "f32" or "f64"
         """
-        self._id = str(uuid.uuid4())[:8]
-        self.width = width
-        self.height = height
-        self.theme = resolve_theme(theme)
-        self.title = title
+        if precision not in PRECISIONS:
+            raise ValueError(
+                f"Unknown precision: {precision!r} (expected one of {PRECISIONS})"
+            )
+        self._id = secrets.token_hex(4)
 
-        # Create render config
+        # Create render config (shared with the backend)
         self._config = RenderConfig(
             width=width,
             height=height,
-            theme=self.theme,
+            theme=resolve_theme(theme),
             title=title,
             chart_id=self._id,
+            precision=precision,
+            downsample=downsample,
+            interactive_legend=interactive_legend,
+            pinch_zoom=pinch_zoom,
         )
 
         # Select and create backend
@@ -89,6 +115,50 @@ class Chart:
         if data is not None:
             self._auto_plot(data)
 
+    # -------------------------------------------------------------------------
+    # View Properties
+    # -------------------------------------------------------------------------
+
+    @property
+    def width(self) -> int:
+        """Chart width in pixels."""
+        return self._config.width
+
+    @width.setter
+    def width(self, value: int) -> None:
+        self._config.width = value
+        self._backend.invalidate_view()
+
+    @property
+    def height(self) -> int:
+        """Chart height in pixels."""
+        return self._config.height
+
+    @height.setter
+    def height(self, value: int) -> None:
+        self._config.height = value
+        self._backend.invalidate_view()
+
+    @property
+    def theme(self) -> Theme:
+        """Chart theme."""
+        return self._config.theme
+
+    @theme.setter
+    def theme(self, value: Union[str, Theme, None]) -> None:
+        self._config.theme = resolve_theme(value)
+        self._backend.invalidate_view()
+
+    @property
+    def title(self) -> Optional[str]:
+        """Chart title."""
+        return self._config.title
+
+    @title.setter
+    def title(self, value: Optional[str]) -> None:
+        self._config.title = value
+        self._backend.invalidate_view()
+
     def _create_backend(self) -> Backend:
         """Create the appropriate backend instance."""
         if self._backend_type == BackendType.LIGHTWEIGHT:
@@ -292,6 +362,7 @@ class Chart:
         close_col: Optional[str] = None,
         up_color: Optional[str] = None,
         down_color: Optional[str] = None,
+        lazy: bool = False,
     ) -> "Chart":
         """
         Add a volume histogram with up/down coloring.
@@ -304,6 +375,8 @@ class Chart:
             close_col: Close column for color determination
             up_color: Color for up bars
             down_color: Color for down bars
+            lazy: Defer computing the volume columns until the chart is
+                serialized, collecting all lazy series in one pass
 
         Returns:
             Self for chaining
@@ -323,6 +396,7 @@ class Chart:
                 close_col=close_c,
                 up_color=up_color,
                 down_color=down_color,
+                lazy=lazy,
             )
         return self
 
@@ -399,10 +473,31 @@ class Chart:
     # Output Methods
     # -------------------------------------------------------------------------
 
+    def config_dict(self) -> Dict[str, Any]:
+        """
+        Get the chart configuration as live Python objects.
+
+        Same content as to_json() without the serialization cost. Use it
+        for inspection; call to_json() only when you need the JSON string.
+
+        Returns:
+            Configuration dict
+        """
+        return self._backend.config_dict()
+
     def to_json(self) -> str:
         """Generate JSON configuration."""
         return self._backend.to_json()
 
+    def to_arrow_ipc(self) -> Dict[str, bytes]:
+        """
+        Serialize each series' data as an Arrow IPC stream.
+
+        Returns:
+            Mapping of series id to Arrow IPC stream bytes
+        """
+        return self._backend.to_arrow_ipc()
+
     def to_html(self) -> str:
         """Generate HTML for rendering."""
         return self._backend.to_html()
@@ -411,13 +506,24 @@ class Chart:
         """Jupyter notebook HTML representation."""
         return self._backend.to_html()
 
-    def show(self) -> None:
+    def show(self, stream: bool = False, ttl: float = 600.0) -> None:
         """
         Display the chart.
 
         In Jupyter, renders inline. Outside Jupyter, opens in browser.
+
+        Args:
+            stream: Serve large series as Arrow IPC from a short-lived
+                local HTTP server instead of embedding them in the page
+                (lightweight backend only). The server listens on
+                127.0.0.1, so the browser must run on the same machine
+                as Python; this rules out JupyterHub and Colab. In a
+                notebook the data is served for ``ttl`` seconds, so the
+                output can be reloaded until then. A script blocks until
+                the browser has fetched the data or ``ttl`` runs out.
+            ttl: Seconds to keep serving streamed data
         """
-        self._backend.show()
+        self._backend.show(stream=stream, ttl=ttl)
 
     def streamlit(self, height: Optional[int] = None) -> None:
         """
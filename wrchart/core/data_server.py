@@ -0,0 +1,131 @@
+"""
+Short-lived local HTTP server for chart data.
+
+Lets a rendered page fetch large series as Arrow IPC over HTTP instead
+of carrying them inline as base64, so the HTML stays small and the
+browser downloads and decodes the series concurrently.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Set
+import threading
+
+
+class DataServer:
+    """
+    Serve byte payloads from 127.0.0.1 on an ephemeral port.
+
+    The server stops by itself after ``ttl`` seconds and, unless
+    ``stop_when_served`` is False, as soon as every registered payload
+    has been fetched successfully. It only listens on 127.0.0.1, so the
+    page must be opened on the machine running Python.
+
+    Usage:
+        server = DataServer()
+        url = server.add("chart/abc/series_0.arrow", payload)
+        server.start()
+    """
+
+    def __init__(self, ttl: float = 600.0, stop_when_served: bool = True):
+        """
+        Args:
+            ttl: Seconds to keep serving before shutting down
+            stop_when_served: Shut down once each payload has been fetched;
+                pass False to keep serving reloads until ``ttl``
+        """
+        self.ttl = ttl
+        self.stop_when_served = stop_when_served
+        self._payloads: Dict[str, bytes] = {}
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._timer: Optional[threading.Timer] = None
+        self._started = False
+        self._stopped = threading.Event()
+
+    @property
+    def base_url(self) -> str:
+        """Root URL of the server."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add(self, path: str, payload: bytes) -> str:
+        """
+        Register a payload.
+
+        Args:
+            path: URL path without the leading slash
+            payload: Bytes to serve
+
+        Returns:
+            Absolute URL of the payload
+        """
+        path = "/" + path.lstrip("/")
+        with self._lock:
+            self._payloads[path] = payload
+            self._pending.add(path)
+        return self.base_url + path
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def start(self) -> "DataServer":
+        """Start serving in a background thread."""
+        self._started = True
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        self._timer = threading.Timer(self.ttl, self.stop)
+        self._timer.daemon = True
+        self._timer.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        if self._timer is not None:
+            self._timer.cancel()
+        # shutdown() blocks until serve_forever returns, so never call it
+        # from a request thread directly
+        threading.Thread(target=self._shutdown, daemon=True).start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the server has stopped; returns False on timeout."""
+        return self._stopped.wait(timeout)
+
+    def _shutdown(self) -> None:
+        if self._started:
+            self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _served(self, path: str) -> None:
+        with self._lock:
+            self._pending.discard(path)
+            done = not self._pending
+        if done and self.stop_when_served:
+            self.stop()
+
+    def _make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                payload = server._payloads.get(self.path)
+                if payload is None:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/vnd.apache.arrow.stream")
+                self.send_header("Content-Length", str(len(payload)))
+                # Pages load from file:// or a notebook origin
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                self.wfile.write(payload)
+                server._served(self.path)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return Handler
+
@@ -0,0 +1,67 @@
+"""
+Content fingerprints for chart data.
+
+Used to recognise unchanged data so serialized payloads can be reused
+within a process. Hashes the raw column buffers with xxHash (XXH3) when it is installed,
+falling back to BLAKE2b from the standard library otherwise.
+"""
+
+from typing import Iterable, Optional
+import hashlib
+
+import numpy as np
+import polars as pl
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - exercised only without xxhash
+    xxhash = None
+
+
+def _hash_buffer(buf: np.ndarray) -> int:
+    """Hash a contiguous NumPy buffer without copying it."""
+    view = memoryview(np.ascontiguousarray(buf)).cast("B")
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(view)
+    return int.from_bytes(hashlib.blake2b(view, digest_size=8).digest(), "little")
+
+
+def series_fingerprint(series: pl.Series) -> int:
+    """
+    Fingerprint the contents of a single Polars Series.
+
+    Numeric and temporal columns are hashed from their physical buffer.
+    Other dtypes (strings, categoricals, ...) are first reduced to
+    Polars' vectorized per-row hashes.
+
+    Args:
+        series: Column to fingerprint
+
+    Returns:
+        64-bit content hash
+    """
+    physical = series.to_physical()
+    if physical.dtype.is_numeric():
+        values = physical.to_numpy()
+    else:
+        values = series.hash().to_numpy()
+    return hash((str(series.dtype), len(series), series.null_count(), _hash_buffer(values)))
+
+
+def frame_fingerprint(
+    df: Optional[pl.DataFrame], columns: Optional[Iterable[str]] = None
+) -> int:
+    """
+    Fingerprint the contents of a DataFrame.
+
+    Args:
+        df: DataFrame to fingerprint (None hashes to a constant)
+        columns: Columns to include (default: all columns)
+
+    Returns:
+        64-bit content hash
+    """
+    if df is None:
+        return 0
+    names = list(columns) if columns is not None else df.columns
+    return hash(tuple((name, series_fingerprint(df[name])) for name in names))
@@ -0,0 +1,111 @@
+"""
+JSON serialization for chart payloads.
+
+Uses orjson when it is installed, which encodes NumPy arrays, scalars and
+dataclasses natively in C and writes NaN/Inf as null. Falls back to the standard
+library json module otherwise.
+"""
+
+from typing import Any
+import base64
+import dataclasses
+import gzip
+import json
+import math
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+# Browser-side inverse of gzip_b64(); await gunzipJSON(b64) in an async scope
+GUNZIP_JS = """
+    async function gunzipJSON(b64) {
+        const bytes = Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+        const stream = new Blob([bytes]).stream()
+            .pipeThrough(new DecompressionStream('gzip'));
+        return JSON.parse(await new Response(stream).text());
+    }
+"""
+
+
+def _float32_list(values: np.ndarray) -> list:
+    """
+    float32 values as Python floats that print as short as float32 allows.
+
+    tolist() widens to float64 and the JSON text then spells out the
+    widening error (100.12999725341797 for 100.13), which makes "f32"
+    payloads larger than "f64" ones. Parsing NumPy's shortest float32
+    repr gives the float64 nearest to it, which prints the same way.
+    """
+    out = [float(text) for text in values.ravel().astype(str)]
+    if not np.isfinite(values).all():
+        out = [v if math.isfinite(v) else None for v in out]
+    return np.array(out, dtype=object).reshape(values.shape).tolist()
+
+
+def _numpy_default(value: Any) -> Any:
+    """
+    Convert values the encoder cannot handle natively.
+
+    Non-finite floats become None so the output is always valid JSON.
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype == np.float32:
+            return _float32_list(value)
+        if value.dtype.kind == "f" and not np.isfinite(value).all():
+            return np.where(np.isfinite(value), value, None).tolist()
+        return value.tolist()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        # Shallow, unlike dataclasses.asdict(), so arrays are not deep-copied
+        return {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+    if isinstance(value, np.float32):
+        value = float(str(value))
+    elif isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and (value != value or math.isinf(value)):
+        return None
+    if isinstance(value, (int, float, str, bool)) or value is None:
+        return value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize a chart payload to a JSON string.
+
+    Args:
+        obj: Payload made of dicts, lists, dataclasses, scalars and NumPy
+            arrays
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_numpy_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    return json.dumps(obj, default=_numpy_default)
+
+
+def gzip_b64(text: str, level: int = 1) -> str:
+    """
+    Gzip a JSON string and base64-encode it for inlining in a page.
+
+    Used where the same HTML is re-sent often (Streamlit reruns), so a
+    smaller body matters more than the decode step; the page restores
+    the value with GUNZIP_JS.
+
+    Args:
+        text: JSON string
+        level: gzip compression level (1 = fastest)
+
+    Returns:
+        ASCII base64 string
+    """
+    return base64.b64encode(gzip.compress(text.encode(), level)).decode("ascii")
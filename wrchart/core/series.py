@@ -6,9 +6,116 @@ Each series type handles its own data format and rendering configuration.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
+import base64
+import copy
+import io
+
+import numpy as np
 import polars as pl
 
+from wrchart._sanitize import sanitize
+from wrchart.core.fingerprint import frame_fingerprint, series_fingerprint
+
+
+def _to_numpy(values: pl.Series) -> np.ndarray:
+    """
+    View a Polars Series as a NumPy array, copying only when unavoidable.
+
+    Null-free single-chunk numeric columns are returned as a read-only
+    view of the Polars buffer. Columns with nulls (which become NaN) or
+    several chunks fall back to a copy.
+    """
+    try:
+        return values.to_numpy(allow_copy=False)
+    except TypeError:
+        # Polars < 1.0 spells the flag zero_copy_only
+        try:
+            return values.to_numpy(zero_copy_only=True)
+        except (RuntimeError, ValueError):
+            pass
+    except (RuntimeError, ValueError):
+        pass
+    return values.to_numpy()
+
+
+def _time_to_js(time_col: pl.Series) -> Union[np.ndarray, List[str]]:
+    """
+    Convert a time column to the form Lightweight Charts reads.
+
+    Datetimes of any unit or time zone become Int64 Unix epoch seconds,
+    computed in Polars, so the payload carries integers rather than ISO
+    strings. Dates become "YYYY-MM-DD" business-day strings and numeric
+    columns are taken to hold epoch seconds already.
+    """
+    dtype = time_col.dtype
+    if dtype == pl.Datetime:
+        return _to_numpy(time_col.dt.epoch("s"))
+    if dtype.is_numeric():
+        return _to_numpy(time_col)
+    # Dates and anything else go out as strings
+    return time_col.cast(pl.Utf8).to_list()
+
+
+PRECISIONS = ("f32", "f64")
+
+
+def _narrow(columns: Dict[str, Any], precision: str) -> Dict[str, Any]:
+    """
+    Cast float64 value columns to float32 when precision is "f32".
+
+    The time column is left alone: epoch seconds need more than float32's
+    24-bit mantissa.
+    """
+    if precision != "f32":
+        return columns
+    return {
+        name: values.astype(np.float32)
+        if name != "time"
+        and isinstance(values, np.ndarray)
+        and values.dtype == np.float64
+        else values
+        for name, values in columns.items()
+    }
+
+
+def collect_series(series: Iterable["BaseSeries"]) -> None:
+    """
+    Collect the pending LazyFrame sources of several series in one pass.
+
+    Uses pl.collect_all(), so plans over the same source (for example a
+    candlestick and its volume bars) are optimized together and can share
+    a scan instead of each materializing on its own.
+
+    Args:
+        series: Series whose lazy data should be collected
+    """
+    pending = [s for s in series if s.is_lazy]
+    if not pending:
+        return
+    frames = pl.collect_all([s._data for s in pending])
+    for s, frame in zip(pending, frames):
+        s.data = frame
+
+
+@dataclass
+class SeriesConfig:
+    """
+    Serialized form of a series, as sent to the browser.
+
+    Uses __slots__ so per-series payloads carry no instance dict.
+    """
+
+    __slots__ = ("id", "type", "data", "options", "arrow", "arrow_url", "time_ref")
+
+    id: Optional[str]
+    type: str
+    data: Dict[str, Any]
+    options: Dict[str, Any]
+    arrow: Optional[str]  # base64 Arrow IPC stream replacing data
+    arrow_url: Optional[str]  # URL the page fetches the Arrow stream from
+    time_ref: Optional[str]  # key into the chart's shared time arrays
+
 
 @dataclass
 class SeriesOptions:
@@ -26,12 +133,37 @@ class BaseSeries(ABC):
 
     def __init__(
         self,
-        data: Optional[pl.DataFrame] = None,
+        data: Union[pl.DataFrame, pl.LazyFrame, None] = None,
         options: Optional[SeriesOptions] = None,
     ):
         self.data = data
         self.options = options or SeriesOptions()
         self._id: Optional[str] = None
+        self._fingerprint: Optional[int] = None
+        self._time_fingerprint: Optional[int] = None
+        # Bumped by set_data() so owners can tell the data changed
+        self._version = 0
+
+    @property
+    def data(self) -> Optional[pl.DataFrame]:
+        """
+        Series data.
+
+        A LazyFrame source is collected on first access and the result
+        replaces it, so the query runs at most once.
+        """
+        if isinstance(self._data, pl.LazyFrame):
+            self._data = self._data.collect()
+        return self._data
+
+    @data.setter
+    def data(self, value: Union[pl.DataFrame, pl.LazyFrame, None]) -> None:
+        self._data = value
+
+    @property
+    def is_lazy(self) -> bool:
+        """Whether the data is a LazyFrame that has not been collected yet."""
+        return isinstance(self._data, pl.LazyFrame)
 
     @abstractmethod
     def series_type(self) -> str:
@@ -39,8 +171,13 @@ class BaseSeries(ABC):
         pass
 
     @abstractmethod
-    def to_js_data(self) -> List[Dict[str, Any]]:
-        """Convert Polars data to JS-compatible format."""
+    def to_js_data(self) -> Dict[str, Any]:
+        """
+        Convert Polars data to a columnar JS-compatible format.
+
+        Returns a mapping of field name to column array (structure of
+        arrays). The renderer zips the columns back into row objects.
+        """
         pass
 
     @abstractmethod
@@ -48,38 +185,138 @@ class BaseSeries(ABC):
         """Get series options for Lightweight Charts."""
         pass
 
-    def set_data(self, data: pl.DataFrame) -> "BaseSeries":
+    def to_config(
+        self,
+        theme: Optional[Any] = None,
+        arrow: bool = False,
+        arrow_url: Optional[str] = None,
+        precision: str = "f64",
+    ) -> SeriesConfig:
+        """
+        Build the serializable payload for this series.
+
+        Args:
+            theme: Theme used to resolve default colors
+            arrow: Carry the data as a base64 Arrow IPC stream instead of
+                JSON arrays
+            arrow_url: Leave the data out entirely; the page fetches the
+                Arrow IPC stream from this URL (takes precedence over arrow)
+            precision: "f32" narrows float value columns to float32
+
+        Returns:
+            SeriesConfig with the series data and options
+        """
+        data: Dict[str, Any] = {}
+        encoded = None
+        if arrow_url is None:
+            if arrow:
+                ipc = self.to_arrow_ipc(precision)
+                encoded = base64.b64encode(ipc).decode("ascii")
+            else:
+                data = _narrow(self.to_js_data(), precision)
+        return SeriesConfig(
+            id=self._id,
+            type=self.series_type(),
+            data=data,
+            options=self.to_js_options(theme),
+            arrow=encoded,
+            arrow_url=arrow_url,
+            time_ref=None,
+        )
+
+    def to_arrow_ipc(self, precision: str = "f64") -> bytes:
+        """
+        Serialize the JS data columns as an uncompressed Arrow IPC stream.
+
+        64-bit integer columns are widened to float64 so the browser reads
+        them as plain numbers rather than BigInt.
+
+        Args:
+            precision: "f32" narrows float value columns to float32
+
+        Returns:
+            Arrow IPC stream bytes
+        """
+        columns = {}
+        for name, values in _narrow(self.to_js_data(), precision).items():
+            if (
+                isinstance(values, np.ndarray)
+                and values.dtype.kind in "iu"
+                and values.dtype.itemsize == 8
+            ):
+                values = values.astype(np.float64)
+            columns[name] = values
+
+        # Arrow JS does not read the newer string view layout
+        kwargs = {}
+        if hasattr(pl, "CompatLevel"):
+            kwargs["compat_level"] = pl.CompatLevel.oldest()
+
+        buf = io.BytesIO()
+        pl.DataFrame(columns).write_ipc_stream(buf, **kwargs)
+        return buf.getvalue()
+
+    def set_data(self, data: Union[pl.DataFrame, pl.LazyFrame]) -> "BaseSeries":
         """Set the data for this series."""
         self.data = data
+        self._fingerprint = None
+        self._time_fingerprint = None
+        self._version += 1
         return self
 
-    def _time_to_js(self, time_col: pl.Series) -> List[Any]:
-        """Convert time column to JS-compatible format."""
-        # Handle different time types
-        if time_col.dtype == pl.Datetime or str(time_col.dtype).startswith("Datetime"):
-            # Get time unit from dtype
-            dtype_str = str(time_col.dtype)
-            if "ns" in dtype_str:
-                # Nanoseconds to seconds
-                return (time_col.cast(pl.Int64) // 1_000_000_000).to_list()
-            elif "us" in dtype_str or "μs" in dtype_str:
-                # Microseconds to seconds
-                return (time_col.cast(pl.Int64) // 1_000_000).to_list()
-            elif "ms" in dtype_str:
-                # Milliseconds to seconds
-                return (time_col.cast(pl.Int64) // 1_000).to_list()
-            else:
-                # Default: assume microseconds (most common)
-                return (time_col.cast(pl.Int64) // 1_000_000).to_list()
-        elif time_col.dtype == pl.Date:
-            # Convert date to string format YYYY-MM-DD
-            return time_col.cast(pl.Utf8).to_list()
-        elif time_col.dtype in [pl.Int64, pl.Int32, pl.Float64]:
-            # Already numeric, assume Unix timestamp
-            return time_col.to_list()
-        else:
-            # Try to convert to string
-            return time_col.cast(pl.Utf8).to_list()
+    def downsampled(self, target_bars: int) -> "BaseSeries":
+        """
+        A copy of this series reduced to about ``target_bars`` rows.
+
+        Only series that can be merged without changing what they show
+        (OHLC bars, volume) are reduced; the base implementation returns
+        the series itself.
+
+        Args:
+            target_bars: Number of rows to keep
+
+        Returns:
+            This series, or a reduced copy sharing its id and options
+        """
+        return self
+
+    def _with_data(self, data: pl.DataFrame) -> "BaseSeries":
+        """Shallow copy of this series holding other data."""
+        clone = copy.copy(self)
+        return clone.set_data(data)
+
+    def fingerprint(self) -> int:
+        """
+        Content hash of the columns this series renders.
+
+        Computed once and reused until set_data() is called. Optional
+        columns the data does not have (which to_js_data skips) are left
+        out.
+        """
+        if self._fingerprint is None:
+            present = set(self.data.columns) if self.data is not None else set()
+            columns = [
+                value
+                for name, value in vars(self).items()
+                if name.endswith("_col") and value in present
+            ]
+            self._fingerprint = frame_fingerprint(self.data, columns)
+        return self._fingerprint
+
+    def time_fingerprint(self) -> int:
+        """
+        Content hash of the time column alone.
+
+        Lets the renderer spot series that share a time axis without
+        rehashing it on every serialization; reset by set_data().
+        """
+        if self._time_fingerprint is None:
+            self._time_fingerprint = series_fingerprint(self.data[self.time_col])
+        return self._time_fingerprint
+
+    def _values_to_js(self, values: pl.Series) -> np.ndarray:
+        """Convert a value column to an array with +/-Inf folded into NaN."""
+        return sanitize(_to_numpy(values))
 
 
 @dataclass
@@ -119,20 +356,55 @@ class CandlestickSeries(BaseSeries):
     def series_type(self) -> str:
         return "Candlestick"
 
-    def to_js_data(self) -> List[Dict[str, Any]]:
+    def to_js_data(self) -> Dict[str, Any]:
         if self.data is None:
-            return []
-
-        times = self._time_to_js(self.data[self.time_col])
-        opens = self.data[self.open_col].to_list()
-        highs = self.data[self.high_col].to_list()
-        lows = self.data[self.low_col].to_list()
-        closes = self.data[self.close_col].to_list()
+            return {}
+
+        return {
+            "time": _time_to_js(self.data[self.time_col]),
+            "open": self._values_to_js(self.data[self.open_col]),
+            "high": self._values_to_js(self.data[self.high_col]),
+            "low": self._values_to_js(self.data[self.low_col]),
+            "close": self._values_to_js(self.data[self.close_col]),
+        }
 
-        return [
-            {"time": t, "open": o, "high": h, "low": l, "close": c}
-            for t, o, h, l, c in zip(times, opens, highs, lows, closes)
-        ]
+    def downsampled(self, target_bars: int) -> "BaseSeries":
+        """Merge consecutive bars, keeping each run's open/high/low/close."""
+        if self.data is None or len(self.data) <= target_bars:
+            return self
+
+        from wrchart.transforms.decimation import ohlc_downsample
+
+        return self._with_data(ohlc_downsample(
+            self.data.select(
+                self.time_col, self.open_col, self.high_col, self.low_col,
+                self.close_col,
+            ),
+            self.time_col, self.open_col, self.high_col, self.low_col,
+            self.close_col, target_bars,
+        ))
+
+    def change_stats(self) -> Dict[str, np.ndarray]:
+        """
+        Per-bar change from open to close, as shown in the legend.
+
+        Returns:
+            Dict with "changePcts" (percent change times 100, as int32) and
+            "signs" (1 up, 0 down, -1 where the change is undefined)
+        """
+        if self.data is None:
+            return {}
+
+        open_ = _to_numpy(self.data[self.open_col]).astype(np.float64, copy=False)
+        close = _to_numpy(self.data[self.close_col]).astype(np.float64, copy=False)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = close - open_
+            pct = np.rint(change / open_ * 10000.0)
+        valid = np.isfinite(pct) & (np.abs(pct) < 2**31)
+        return {
+            "changePcts": np.where(valid, pct, 0.0).astype(np.int32),
+            "signs": np.where(valid, change >= 0, -1).astype(np.int8),
+        }
 
     def to_js_options(self, theme: Optional[Any] = None) -> Dict[str, Any]:
         opts = self.options
@@ -197,14 +469,14 @@ class LineSeries(BaseSeries):
     def series_type(self) -> str:
         return "Line"
 
-    def to_js_data(self) -> List[Dict[str, Any]]:
+    def to_js_data(self) -> Dict[str, Any]:
         if self.data is None:
-            return []
-
-        times = self._time_to_js(self.data[self.time_col])
-        values = self.data[self.value_col].to_list()
+            return {}
 
-        return [{"time": t, "value": v} for t, v in zip(times, values)]
+        return {
+            "time": _time_to_js(self.data[self.time_col]),
+            "value": self._values_to_js(self.data[self.value_col]),
+        }
 
     def to_js_options(self, theme: Optional[Any] = None) -> Dict[str, Any]:
         opts = self.options
@@ -258,14 +530,14 @@ class AreaSeries(BaseSeries):
     def series_type(self) -> str:
         return "Area"
 
-    def to_js_data(self) -> List[Dict[str, Any]]:
+    def to_js_data(self) -> Dict[str, Any]:
         if self.data is None:
-            return []
-
-        times = self._time_to_js(self.data[self.time_col])
-        values = self.data[self.value_col].to_list()
+            return {}
 
-        return [{"time": t, "value": v} for t, v in zip(times, values)]
+        return {
+            "time": _time_to_js(self.data[self.time_col]),
+            "value": self._values_to_js(self.data[self.value_col]),
+        }
 
     def to_js_options(self, theme: Optional[Any] = None) -> Dict[str, Any]:
         opts = self.options
@@ -296,10 +568,18 @@ class HistogramOptions(SeriesOptions):
 
     color: Optional[str] = None
     base: float = 0
+    up_color: Optional[str] = None
+    down_color: Optional[str] = None
 
 
 class HistogramSeries(BaseSeries):
-    """Histogram/bar chart series (used for volume, etc.)."""
+    """
+    Histogram/bar chart series (used for volume, etc.).
+
+    Per-bar colors come either from ``color_col`` (a string column) or from
+    ``up_col``, a 0/1 flag column that the browser maps to the options'
+    ``up_color``/``down_color``.
+    """
 
     def __init__(
         self,
@@ -308,30 +588,49 @@ class HistogramSeries(BaseSeries):
         value_col: str = "value",
         color_col: Optional[str] = None,
         options: Optional[HistogramOptions] = None,
+        up_col: Optional[str] = None,
     ):
         super().__init__(data, options or HistogramOptions())
         self.time_col = time_col
         self.value_col = value_col
         self.color_col = color_col
+        self.up_col = up_col
 
     def series_type(self) -> str:
         return "Histogram"
 
-    def to_js_data(self) -> List[Dict[str, Any]]:
-        if self.data is None:
-            return []
+    def downsampled(self, target_bars: int) -> "BaseSeries":
+        """
+        Sum volume bars over runs of consecutive bars.
+
+        Only volume bars (colored through ``up_col``) are reduced; each
+        run takes the direction of its last bar. Runs are cut the same
+        way as for the candlesticks the volume was built from.
+        """
+        if self.up_col is None or self.data is None or len(self.data) <= target_bars:
+            return self
+
+        from wrchart.transforms.decimation import _aggregate_runs
 
-        times = self._time_to_js(self.data[self.time_col])
-        values = self.data[self.value_col].to_list()
+        return self._with_data(_aggregate_runs(self.data, target_bars, [
+            pl.col(self.time_col).first(),
+            pl.col(self.value_col).sum(),
+            pl.col(self.up_col).last(),
+        ]))
 
+    def to_js_data(self) -> Dict[str, Any]:
+        if self.data is None:
+            return {}
+
+        columns = {
+            "time": _time_to_js(self.data[self.time_col]),
+            "value": self._values_to_js(self.data[self.value_col]),
+        }
         if self.color_col and self.color_col in self.data.columns:
-            colors = self.data[self.color_col].to_list()
-            return [
-                {"time": t, "value": v, "color": c}
-                for t, v, c in zip(times, values, colors)
-            ]
-        else:
-            return [{"time": t, "value": v} for t, v in zip(times, values)]
+            columns["color"] = self.data[self.color_col].to_list()
+        elif self.up_col and self.up_col in self.data.columns:
+            columns["up"] = _to_numpy(self.data[self.up_col].cast(pl.UInt8))
+        return columns
 
     def to_js_options(self, theme: Optional[Any] = None) -> Dict[str, Any]:
         opts = self.options
@@ -348,6 +647,10 @@ class HistogramSeries(BaseSeries):
                 theme.colors.volume_up if theme else "#e0e0e0"
             )
             result["base"] = opts.base
+            if opts.up_color is not None:
+                result["upColor"] = opts.up_color
+            if opts.down_color is not None:
+                result["downColor"] = opts.down_color
 
         return result
 
@@ -382,14 +685,14 @@ class ScatterSeries(BaseSeries):
         # Scatter is implemented as a line with no line, just markers
         return "Line"
 
-    def to_js_data(self) -> List[Dict[str, Any]]:
+    def to_js_data(self) -> Dict[str, Any]:
         if self.data is None:
-            return []
+            return {}
 
-        times = self._time_to_js(self.data[self.time_col])
-        values = self.data[self.value_col].to_list()
-
-        return [{"time": t, "value": v} for t, v in zip(times, values)]
+        return {
+            "time": _time_to_js(self.data[self.time_col]),
+            "value": self._values_to_js(self.data[self.value_col]),
+        }
 
     def to_js_options(self, theme: Optional[Any] = None) -> Dict[str, Any]:
         opts = self.options
@@ -9,10 +9,11 @@ Colors and styling based on:
 """
 
 from dataclasses import dataclass, field
+from functools import cache
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class ThemeColors:
     """Color palette for a theme."""
 
@@ -55,8 +56,19 @@ class ThemeColors:
     # Selection/highlight
     highlight: str = "#E53935"
 
+# Fetched with <link> tags rather than a CSS @import so the stylesheet
+# request does not hold up first paint; the chart draws with the fallback
+# stack and the web fonts swap in once loaded. Only the weights the
+# templates use are requested.
+FONT_LINKS = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com" crossorigin>'
+    '<link rel="stylesheet" href="https://fonts.googleapis.com/css2?'
+    "family=Space+Grotesk:wght@400;500;600&family=JetBrains+Mono:wght@400;500"
+    '&display=swap" media="print" onload="this.media=\'all\'">'
+)
+
 
-@dataclass
+@dataclass(frozen=True)
 class ThemeFonts:
     """Font configuration for a theme."""
 
@@ -67,7 +79,7 @@ class ThemeFonts:
     size_large: str = "14px"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ThemeLayout:
     """Layout configuration for a theme."""
 
@@ -86,9 +98,14 @@ class ThemeLayout:
     axis_border_visible: bool = True
 
 
-@dataclass
+@dataclass(frozen=True)
 class Theme:
-    """Complete theme configuration."""
+    """
+    Complete theme configuration.
+
+    Themes are immutable and hashable; use dataclasses.replace() to derive
+    a customized theme.
+    """
 
     name: str
     colors: ThemeColors = field(default_factory=ThemeColors)
@@ -287,10 +304,13 @@ _THEMES = {
 }
 
 
+@cache
 def get_theme(name: str) -> Theme:
     """
     Get a theme by name.
 
+    Themes are immutable, so lookups are cached per name.
+
     Args:
         name: Theme name ("wayy", "dark", "light")
 
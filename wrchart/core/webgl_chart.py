@@ -7,11 +7,11 @@ and virtual viewport rendering.
 
 from typing import Optional, List, Tuple
 import json
-import uuid
+import secrets
 
 import polars as pl
 
-from wrchart.core.themes import Theme, WayyTheme
+from wrchart.core.themes import FONT_LINKS, Theme, WayyTheme
 from wrchart.transforms.decimation import lttb_downsample
 
 
@@ -69,7 +69,7 @@ class WebGLChart:
         self.height = height
         self.theme = theme or WayyTheme
         self.title = title
-        self._id = str(uuid.uuid4())[:8]
+        self._id = secrets.token_hex(4)
 
         self._data: Optional[pl.DataFrame] = None
         self._time_col: str = "time"
@@ -407,7 +407,7 @@ class WebGLChart:
             <html>
             <head>
                 <title>{self.title or 'WebGL Chart'}</title>
-                <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;600&family=JetBrains+Mono:wght@400&display=swap" rel="stylesheet">
+                {FONT_LINKS}
             </head>
             <body style="margin: 0; padding: 20px; background: {self.theme.colors.background};">
                 {self._generate_html()}
@@ -433,7 +433,7 @@ class WebGLChart:
         <html>
         <head>
             <title>{self.title or 'WebGL Chart'}</title>
-            <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;600&family=JetBrains+Mono:wght@400&display=swap" rel="stylesheet">
+            {FONT_LINKS}
         </head>
         <body style="margin: 0; padding: 20px; background: {self.theme.colors.background};">
             {self._generate_html()}
@@ -9,7 +9,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 import json
-import uuid
+import secrets
 
 
 @dataclass
@@ -20,7 +20,7 @@ class BaseDrawing(ABC):
     Provides common properties and serialization methods.
     """
 
-    id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
+    id: str = field(default_factory=lambda: secrets.token_hex(4))
     visible: bool = True
     locked: bool = False
     z_index: int = 0
@@ -5,14 +5,16 @@ Provides efficient rendering of hundreds of paths with density-based coloring,
 percentile lines, and confidence intervals using WebGL acceleration.
 """
 
+from functools import cache
+from string import Template
 from typing import Any, Dict, List, Optional, Tuple, Union
-import json
-import uuid
+import secrets
 
 import numpy as np
 import polars as pl
 
-from wrchart.core.themes import Theme, DarkTheme, WayyTheme
+from wrchart.core.serialization import GUNZIP_JS, dumps, gzip_b64
+from wrchart.core.themes import FONT_LINKS, Theme, DarkTheme, WayyTheme
 from wrchart.forecast.colorscales import (
     Colorscale,
     VIRIDIS,
@@ -28,6 +30,24 @@ from wrchart.forecast.utils import (
 )
 
 
+
+@cache
+def _theme_colors(theme: str) -> Dict[str, str]:
+    """Page colors for a forecast chart theme name, built once per theme."""
+    if theme == "dark":
+        return {
+            "bg_color": "rgb(20, 20, 30)",
+            "text_color": "white",
+            "grid_color": "rgba(128, 128, 128, 0.2)",
+            "hist_color": "white",
+        }
+    return {
+        "bg_color": "#fafafa",
+        "text_color": "black",
+        "grid_color": "rgba(128, 128, 128, 0.3)",
+        "hist_color": "black",
+    }
+
 class ForecastChart:
     """
     Interactive chart for Monte Carlo forecast visualization.
@@ -77,7 +97,7 @@ class ForecastChart:
         self.height = height
         self.theme = theme
         self.title = title
-        self._id = str(uuid.uuid4())[:8]
+        self._id = secrets.token_hex(4)
 
         # Data
         self._historical_prices: Optional[np.ndarray] = None
@@ -346,295 +366,20 @@ class ForecastChart:
     def _generate_html(self) -> str:
         """Generate HTML/JS for rendering."""
         data = self._prepare_data()
-        data_json = json.dumps(data)
-
-        # Theme colors
-        if self.theme == "dark":
-            bg_color = "rgb(20, 20, 30)"
-            text_color = "white"
-            grid_color = "rgba(128, 128, 128, 0.2)"
-            hist_color = "white"
-        else:
-            bg_color = "#fafafa"
-            text_color = "black"
-            grid_color = "rgba(128, 128, 128, 0.3)"
-            hist_color = "black"
-
-        html = f"""
-        <style>
-            @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&display=swap');
-
-            #forecast-container-{self._id} {{
-                font-family: 'Space Grotesk', -apple-system, BlinkMacSystemFont, sans-serif;
-                background: {bg_color};
-                padding: 16px;
-                border-radius: 0;
-            }}
-            #forecast-title-{self._id} {{
-                font-size: 16px;
-                font-weight: 600;
-                color: {text_color};
-                margin-bottom: 12px;
-                letter-spacing: -0.02em;
-            }}
-            #forecast-canvas-{self._id} {{
-                display: block;
-            }}
-            .forecast-legend-{self._id} {{
-                display: flex;
-                align-items: center;
-                gap: 20px;
-                margin-top: 12px;
-                font-size: 11px;
-                color: {text_color};
-            }}
-            .forecast-legend-item {{
-                display: flex;
-                align-items: center;
-                gap: 6px;
-            }}
-            .forecast-legend-color {{
-                width: 20px;
-                height: 3px;
-            }}
-            .forecast-colorbar-{self._id} {{
-                display: flex;
-                align-items: center;
-                gap: 8px;
-                margin-top: 8px;
-            }}
-            .forecast-colorbar-gradient {{
-                width: 150px;
-                height: 12px;
-                border-radius: 0;
-            }}
-            .forecast-colorbar-label {{
-                font-size: 10px;
-                color: {text_color};
-                opacity: 0.7;
-            }}
-        </style>
-
-        <div id="forecast-container-{self._id}">
-            {"<div id='forecast-title-" + self._id + "'>" + (self.title or "Forecast with Path Density") + "</div>" if self.title else ""}
-            <canvas id="forecast-canvas-{self._id}" width="{self.width}" height="{self.height}"></canvas>
-            <div class="forecast-legend-{self._id}">
-                <div class="forecast-legend-item">
-                    <div class="forecast-legend-color" style="background: {hist_color};"></div>
-                    <span>Historical</span>
-                </div>
-                <div class="forecast-legend-item">
-                    <div class="forecast-legend-color" style="background: white; border: 1px solid red;"></div>
-                    <span>Weighted Forecast</span>
-                </div>
-                <div class="forecast-legend-item">
-                    <div class="forecast-legend-color" style="background: rgba(255, 100, 100, 1);"></div>
-                    <span>Median (50th)</span>
-                </div>
-                <div class="forecast-legend-item">
-                    <div class="forecast-legend-color" style="background: rgba(100, 100, 255, 0.8); border-style: dashed;"></div>
-                    <span>5th/95th Percentile</span>
-                </div>
-            </div>
-            <div class="forecast-colorbar-{self._id}">
-                <span class="forecast-colorbar-label">Low Probability</span>
-                <div class="forecast-colorbar-gradient" id="colorbar-{self._id}"></div>
-                <span class="forecast-colorbar-label">High Probability</span>
-            </div>
-        </div>
-
-        <script>
-        (function() {{
-            const data = {data_json};
-            const canvas = document.getElementById('forecast-canvas-{self._id}');
-            const ctx = canvas.getContext('2d');
-
-            // High DPI support
-            const dpr = window.devicePixelRatio || 1;
-            canvas.width = {self.width} * dpr;
-            canvas.height = {self.height} * dpr;
-            canvas.style.width = '{self.width}px';
-            canvas.style.height = '{self.height}px';
-            ctx.scale(dpr, dpr);
-
-            const width = {self.width};
-            const height = {self.height};
-            const padding = {{ top: 20, right: 80, bottom: 40, left: 60 }};
-            const chartWidth = width - padding.left - padding.right;
-            const chartHeight = height - padding.top - padding.bottom;
-
-            // Compute data ranges
-            const allValues = [...data.historical.y];
-            data.paths.forEach(p => allValues.push(...p.values));
-            if (data.weighted_forecast) allValues.push(...data.weighted_forecast);
-            Object.values(data.percentiles).forEach(p => allValues.push(...p));
-
-            const yMin = Math.min(...allValues) * 0.98;
-            const yMax = Math.max(...allValues) * 1.02;
-            const xMin = 0;
-            const xMax = data.forecast_x[data.forecast_x.length - 1];
-
-            // Scale functions
-            const scaleX = (x) => padding.left + (x - xMin) / (xMax - xMin) * chartWidth;
-            const scaleY = (y) => padding.top + chartHeight - (y - yMin) / (yMax - yMin) * chartHeight;
-
-            // Clear and set background
-            ctx.fillStyle = '{bg_color}';
-            ctx.fillRect(0, 0, width, height);
-
-            // Draw grid
-            ctx.strokeStyle = '{grid_color}';
-            ctx.lineWidth = 1;
-            const nGridLines = 6;
-            for (let i = 0; i <= nGridLines; i++) {{
-                const y = padding.top + (chartHeight / nGridLines) * i;
-                ctx.beginPath();
-                ctx.moveTo(padding.left, y);
-                ctx.lineTo(width - padding.right, y);
-                ctx.stroke();
-            }}
-
-            // Draw y-axis labels
-            ctx.fillStyle = '{text_color}';
-            ctx.font = '11px Space Grotesk, sans-serif';
-            ctx.textAlign = 'right';
-            for (let i = 0; i <= nGridLines; i++) {{
-                const y = padding.top + (chartHeight / nGridLines) * i;
-                const value = yMax - (yMax - yMin) * (i / nGridLines);
-                ctx.fillText(value.toFixed(2), padding.left - 8, y + 4);
-            }}
-
-            // Draw x-axis labels
-            ctx.textAlign = 'center';
-            const nXLabels = 6;
-            for (let i = 0; i <= nXLabels; i++) {{
-                const x = padding.left + (chartWidth / nXLabels) * i;
-                const xVal = xMin + (xMax - xMin) * (i / nXLabels);
-                ctx.fillText(Math.round(xVal).toString(), x, height - padding.bottom + 20);
-            }}
-
-            // Draw individual paths (low density first)
-            data.paths.forEach(path => {{
-                ctx.beginPath();
-                ctx.strokeStyle = path.color;
-                ctx.globalAlpha = path.opacity;
-                ctx.lineWidth = path.width;
-
-                for (let i = 0; i < path.values.length; i++) {{
-                    const x = scaleX(data.forecast_x[i]);
-                    const y = scaleY(path.values[i]);
-                    if (i === 0) ctx.moveTo(x, y);
-                    else ctx.lineTo(x, y);
-                }}
-                ctx.stroke();
-            }});
-
-            ctx.globalAlpha = 1;
-
-            // Draw percentile lines
-            const percentileStyles = {{
-                5: {{ color: 'rgba(100, 100, 255, 0.8)', width: 1, dash: [4, 4] }},
-                25: {{ color: 'rgba(100, 150, 255, 0.8)', width: 1.5, dash: [6, 3] }},
-                50: {{ color: 'rgba(255, 100, 100, 1.0)', width: 3, dash: [] }},
-                75: {{ color: 'rgba(100, 150, 255, 0.8)', width: 1.5, dash: [6, 3] }},
-                95: {{ color: 'rgba(100, 100, 255, 0.8)', width: 1, dash: [4, 4] }}
-            }};
-
-            Object.entries(data.percentiles).forEach(([p, values]) => {{
-                const style = percentileStyles[p];
-                ctx.beginPath();
-                ctx.strokeStyle = style.color;
-                ctx.lineWidth = style.width;
-                ctx.setLineDash(style.dash);
-
-                for (let i = 0; i < values.length; i++) {{
-                    const x = scaleX(data.forecast_x[i]);
-                    const y = scaleY(values[i]);
-                    if (i === 0) ctx.moveTo(x, y);
-                    else ctx.lineTo(x, y);
-                }}
-                ctx.stroke();
-                ctx.setLineDash([]);
-            }});
-
-            // Draw weighted forecast
-            if (data.weighted_forecast) {{
-                // White outline
-                ctx.beginPath();
-                ctx.strokeStyle = 'white';
-                ctx.lineWidth = 4;
-                for (let i = 0; i < data.weighted_forecast.length; i++) {{
-                    const x = scaleX(data.forecast_x[i]);
-                    const y = scaleY(data.weighted_forecast[i]);
-                    if (i === 0) ctx.moveTo(x, y);
-                    else ctx.lineTo(x, y);
-                }}
-                ctx.stroke();
-
-                // Red dashed inner line
-                ctx.beginPath();
-                ctx.strokeStyle = 'red';
-                ctx.lineWidth = 2;
-                ctx.setLineDash([6, 4]);
-                for (let i = 0; i < data.weighted_forecast.length; i++) {{
-                    const x = scaleX(data.forecast_x[i]);
-                    const y = scaleY(data.weighted_forecast[i]);
-                    if (i === 0) ctx.moveTo(x, y);
-                    else ctx.lineTo(x, y);
-                }}
-                ctx.stroke();
-                ctx.setLineDash([]);
-            }}
-
-            // Draw historical prices
-            ctx.beginPath();
-            ctx.strokeStyle = '{hist_color}';
-            ctx.lineWidth = 3;
-            for (let i = 0; i < data.historical.x.length; i++) {{
-                const x = scaleX(data.historical.x[i]);
-                const y = scaleY(data.historical.y[i]);
-                if (i === 0) ctx.moveTo(x, y);
-                else ctx.lineTo(x, y);
-            }}
-            ctx.stroke();
-
-            // Draw annotations
-            ctx.font = '10px Space Grotesk, sans-serif';
-            ctx.textAlign = 'left';
-            data.annotations.forEach(ann => {{
-                const x = padding.left + ann.x * chartWidth;
-                const y = padding.top + (1 - ann.y) * chartHeight;
-
-                // Background box
-                ctx.fillStyle = 'rgba(0, 0, 0, 0.7)';
-                const lines = ann.text.split('<br>');
-                const lineHeight = ann.font_size + 4;
-                const boxHeight = lines.length * lineHeight + 8;
-                const boxWidth = Math.max(...lines.map(l => ctx.measureText(l.replace(/<[^>]+>/g, '')).width)) + 16;
-                ctx.fillRect(x, y, boxWidth, boxHeight);
-
-                // Text
-                ctx.fillStyle = '{text_color}';
-                ctx.font = ann.font_size + 'px Space Grotesk, sans-serif';
-                lines.forEach((line, i) => {{
-                    const cleanLine = line.replace(/<[^>]+>/g, '');
-                    ctx.fillText(cleanLine, x + 8, y + 14 + i * lineHeight);
-                }});
-            }});
-
-            // Draw colorbar gradient
-            const colorbar = document.getElementById('colorbar-{self._id}');
-            if (colorbar) {{
-                const stops = data.colorscale.map(s => {{
-                    const [pos, rgb] = s;
-                    return `rgb(${{rgb[0]}}, ${{rgb[1]}}, ${{rgb[2]}}) ${{pos * 100}}%`;
-                }});
-                colorbar.style.background = `linear-gradient(to right, ${{stops.join(', ')}})`;
-            }}
-        }})();
-        </script>
-        """
-        return html
+        data_json = dumps(data)
+
+        return _HTML_TEMPLATE.substitute(
+            _theme_colors(self.theme),
+            id=self._id,
+            width=self.width,
+            height=self.height,
+            title_html=(
+                f"<div id='forecast-title-{self._id}'>{self.title}</div>"
+                if self.title
+                else ""
+            ),
+            data_json=data_json,
+        )
 
     def _repr_html_(self) -> str:
         """Jupyter notebook HTML representation."""
@@ -710,444 +455,503 @@ class ForecastChart:
         components.html(html, height=render_height, scrolling=False)
 
     def _generate_streamlit_html(self) -> str:
-        """Generate HTML optimized for Streamlit iframe rendering."""
+        """
+        Generate HTML optimized for Streamlit iframe rendering.
+
+        Streamlit re-sends the page on every rerun, so the data is inlined
+        gzipped and base64-encoded and inflated in the browser.
+        """
         data = self._prepare_data()
-        data_json = json.dumps(data)
-
-        # Theme colors
-        if self.theme == "dark":
-            bg_color = "rgb(20, 20, 30)"
-            text_color = "white"
-            grid_color = "rgba(128, 128, 128, 0.2)"
-            hist_color = "white"
-        else:
-            bg_color = "#fafafa"
-            text_color = "black"
-            grid_color = "rgba(128, 128, 128, 0.3)"
-            hist_color = "black"
+        data_json = f'await gunzipJSON("{gzip_b64(dumps(data))}")'
+
+        return _STREAMLIT_HTML_TEMPLATE.substitute(
+            _theme_colors(self.theme),
+            id=self._id,
+            width=self.width,
+            height=self.height,
+            title_html=(
+                f"<div id='forecast-title-{self._id}'>{self.title}</div>"
+                if self.title
+                else ""
+            ),
+            data_json=data_json,
+        )
 
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8">
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&display=swap');
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: 'Space Grotesk', -apple-system, BlinkMacSystemFont, sans-serif;
-            background: {bg_color};
-            padding: 8px;
-        }}
-        #forecast-container {{
-            width: 100%;
-        }}
-        #forecast-title {{
-            font-size: 16px;
-            font-weight: 600;
-            color: {text_color};
-            margin-bottom: 12px;
-            letter-spacing: -0.02em;
-        }}
-        #forecast-canvas {{
-            display: block;
-            max-width: 100%;
-        }}
-        .forecast-legend {{
-            display: flex;
-            align-items: center;
-            gap: 20px;
-            margin-top: 12px;
-            font-size: 11px;
-            color: {text_color};
-            flex-wrap: wrap;
-        }}
-        .forecast-legend-item {{
-            display: flex;
-            align-items: center;
-            gap: 6px;
-        }}
-        .forecast-legend-color {{
-            width: 20px;
-            height: 3px;
-        }}
-        .forecast-colorbar {{
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            margin-top: 8px;
-        }}
-        .forecast-colorbar-gradient {{
-            width: 150px;
-            height: 12px;
-            border-radius: 0;
-        }}
-        .forecast-colorbar-label {{
-            font-size: 10px;
-            color: {text_color};
-            opacity: 0.7;
-        }}
-        #forecast-tooltip {{
-            position: absolute;
-            background: rgba(0, 0, 0, 0.85);
-            color: white;
-            padding: 8px 12px;
-            border-radius: 4px;
-            font-size: 11px;
-            pointer-events: none;
-            display: none;
-            z-index: 100;
-            font-family: 'JetBrains Mono', monospace;
-        }}
-        #forecast-crosshair {{
-            position: absolute;
-            pointer-events: none;
-            display: none;
-        }}
-        #forecast-crosshair-v {{
-            position: absolute;
-            width: 1px;
-            background: rgba(128, 128, 128, 0.5);
-            top: 20px;
-        }}
-        #forecast-crosshair-h {{
-            position: absolute;
-            height: 1px;
-            background: rgba(128, 128, 128, 0.5);
-            left: 60px;
-        }}
-    </style>
-</head>
-<body>
-    <div id="forecast-container" style="position: relative;">
-        {"<div id='forecast-title'>" + (self.title or "Forecast with Path Density") + "</div>" if self.title else ""}
-        <div id="forecast-tooltip"></div>
-        <div id="forecast-crosshair">
-            <div id="forecast-crosshair-v"></div>
-            <div id="forecast-crosshair-h"></div>
+
+# Template pieces shared by the notebook and Streamlit renderings. Both
+# templates are assembled from them and parsed once at import; ``$$``
+# escapes the ``$`` in JS template literals.
+
+_CHART_CSS = """
+    #forecast-title-${id} {
+        font-size: 16px;
+        font-weight: 600;
+        color: ${text_color};
+        margin-bottom: 12px;
+        letter-spacing: -0.02em;
+    }
+    #forecast-canvas-${id} {
+        display: block;
+        max-width: 100%;
+    }
+    .forecast-legend-${id} {
+        display: flex;
+        align-items: center;
+        gap: 20px;
+        margin-top: 12px;
+        font-size: 11px;
+        color: ${text_color};
+        flex-wrap: wrap;
+    }
+    .forecast-legend-item {
+        display: flex;
+        align-items: center;
+        gap: 6px;
+    }
+    .forecast-legend-color {
+        width: 20px;
+        height: 3px;
+    }
+    .forecast-colorbar-${id} {
+        display: flex;
+        align-items: center;
+        gap: 8px;
+        margin-top: 8px;
+    }
+    .forecast-colorbar-gradient {
+        width: 150px;
+        height: 12px;
+        border-radius: 0;
+    }
+    .forecast-colorbar-label {
+        font-size: 10px;
+        color: ${text_color};
+        opacity: 0.7;
+    }
+"""
+
+_TOOLTIP_CSS = """
+    #forecast-tooltip-${id} {
+        position: absolute;
+        background: rgba(0, 0, 0, 0.85);
+        color: white;
+        padding: 8px 12px;
+        border-radius: 4px;
+        font-size: 11px;
+        pointer-events: none;
+        display: none;
+        z-index: 100;
+        font-family: 'JetBrains Mono', monospace;
+    }
+    #forecast-crosshair-${id} {
+        position: absolute;
+        pointer-events: none;
+        display: none;
+    }
+    #forecast-crosshair-v-${id} {
+        position: absolute;
+        width: 1px;
+        background: rgba(128, 128, 128, 0.5);
+        top: 20px;
+    }
+    #forecast-crosshair-h-${id} {
+        position: absolute;
+        height: 1px;
+        background: rgba(128, 128, 128, 0.5);
+        left: 60px;
+    }
+"""
+
+_LEGEND_HTML = """
+    <div class="forecast-legend-${id}">
+        <div class="forecast-legend-item">
+            <div class="forecast-legend-color" style="background: ${hist_color};"></div>
+            <span>Historical</span>
         </div>
-        <canvas id="forecast-canvas" width="{self.width}" height="{self.height}" style="cursor: crosshair;"></canvas>
-        <div class="forecast-legend">
-            <div class="forecast-legend-item">
-                <div class="forecast-legend-color" style="background: {hist_color};"></div>
-                <span>Historical</span>
-            </div>
-            <div class="forecast-legend-item">
-                <div class="forecast-legend-color" style="background: white; border: 1px solid red;"></div>
-                <span>Weighted Forecast</span>
-            </div>
-            <div class="forecast-legend-item">
-                <div class="forecast-legend-color" style="background: rgba(255, 100, 100, 1);"></div>
-                <span>Median (50th)</span>
-            </div>
-            <div class="forecast-legend-item">
-                <div class="forecast-legend-color" style="background: rgba(100, 100, 255, 0.8); border-style: dashed;"></div>
-                <span>5th/95th Percentile</span>
-            </div>
+        <div class="forecast-legend-item">
+            <div class="forecast-legend-color" style="background: white; border: 1px solid red;"></div>
+            <span>Weighted Forecast</span>
         </div>
-        <div class="forecast-colorbar">
-            <span class="forecast-colorbar-label">Low Probability</span>
-            <div class="forecast-colorbar-gradient" id="colorbar"></div>
-            <span class="forecast-colorbar-label">High Probability</span>
+        <div class="forecast-legend-item">
+            <div class="forecast-legend-color" style="background: rgba(255, 100, 100, 1);"></div>
+            <span>Median (50th)</span>
         </div>
+        <div class="forecast-legend-item">
+            <div class="forecast-legend-color" style="background: rgba(100, 100, 255, 0.8); border-style: dashed;"></div>
+            <span>5th/95th Percentile</span>
+        </div>
+    </div>
+    <div class="forecast-colorbar-${id}">
+        <span class="forecast-colorbar-label">Low Probability</span>
+        <div class="forecast-colorbar-gradient" id="colorbar-${id}"></div>
+        <span class="forecast-colorbar-label">High Probability</span>
     </div>
-    <script>
-    (function() {{
-        const data = {data_json};
-        const canvas = document.getElementById('forecast-canvas');
-        const ctx = canvas.getContext('2d');
-
-        // High DPI support
-        const dpr = window.devicePixelRatio || 1;
-        canvas.width = {self.width} * dpr;
-        canvas.height = {self.height} * dpr;
-        canvas.style.width = '{self.width}px';
-        canvas.style.height = '{self.height}px';
-        ctx.scale(dpr, dpr);
-
-        const width = {self.width};
-        const height = {self.height};
-        const padding = {{ top: 20, right: 80, bottom: 40, left: 60 }};
-        const chartWidth = width - padding.left - padding.right;
-        const chartHeight = height - padding.top - padding.bottom;
-
-        // Compute data ranges
-        const allValues = [...data.historical.y];
-        data.paths.forEach(p => allValues.push(...p.values));
-        if (data.weighted_forecast) allValues.push(...data.weighted_forecast);
-        Object.values(data.percentiles).forEach(p => allValues.push(...p));
-
-        const yMin = Math.min(...allValues) * 0.98;
-        const yMax = Math.max(...allValues) * 1.02;
-        const xMin = 0;
-        const xMax = data.forecast_x[data.forecast_x.length - 1];
-
-        // Scale functions
-        const scaleX = (x) => padding.left + (x - xMin) / (xMax - xMin) * chartWidth;
-        const scaleY = (y) => padding.top + chartHeight - (y - yMin) / (yMax - yMin) * chartHeight;
-
-        // Clear and set background
-        ctx.fillStyle = '{bg_color}';
-        ctx.fillRect(0, 0, width, height);
-
-        // Draw grid
-        ctx.strokeStyle = '{grid_color}';
-        ctx.lineWidth = 1;
-        const nGridLines = 6;
-        for (let i = 0; i <= nGridLines; i++) {{
-            const y = padding.top + (chartHeight / nGridLines) * i;
-            ctx.beginPath();
-            ctx.moveTo(padding.left, y);
-            ctx.lineTo(width - padding.right, y);
-            ctx.stroke();
-        }}
-
-        // Draw y-axis labels
-        ctx.fillStyle = '{text_color}';
-        ctx.font = '11px Space Grotesk, sans-serif';
-        ctx.textAlign = 'right';
-        for (let i = 0; i <= nGridLines; i++) {{
-            const y = padding.top + (chartHeight / nGridLines) * i;
-            const value = yMax - (yMax - yMin) * (i / nGridLines);
-            ctx.fillText(value.toFixed(2), padding.left - 8, y + 4);
-        }}
-
-        // Draw x-axis labels
-        ctx.textAlign = 'center';
-        const nXLabels = 6;
-        for (let i = 0; i <= nXLabels; i++) {{
-            const x = padding.left + (chartWidth / nXLabels) * i;
-            const xVal = xMin + (xMax - xMin) * (i / nXLabels);
-            ctx.fillText(Math.round(xVal).toString(), x, height - padding.bottom + 20);
-        }}
-
-        // Draw individual paths (low density first)
-        data.paths.forEach(path => {{
-            ctx.beginPath();
-            ctx.strokeStyle = path.color;
-            ctx.globalAlpha = path.opacity;
-            ctx.lineWidth = path.width;
-
-            for (let i = 0; i < path.values.length; i++) {{
-                const x = scaleX(data.forecast_x[i]);
-                const y = scaleY(path.values[i]);
-                if (i === 0) ctx.moveTo(x, y);
-                else ctx.lineTo(x, y);
-            }}
-            ctx.stroke();
-        }});
-
-        ctx.globalAlpha = 1;
-
-        // Draw percentile lines
-        const percentileStyles = {{
-            5: {{ color: 'rgba(100, 100, 255, 0.8)', width: 1, dash: [4, 4] }},
-            25: {{ color: 'rgba(100, 150, 255, 0.8)', width: 1.5, dash: [6, 3] }},
-            50: {{ color: 'rgba(255, 100, 100, 1.0)', width: 3, dash: [] }},
-            75: {{ color: 'rgba(100, 150, 255, 0.8)', width: 1.5, dash: [6, 3] }},
-            95: {{ color: 'rgba(100, 100, 255, 0.8)', width: 1, dash: [4, 4] }}
-        }};
-
-        Object.entries(data.percentiles).forEach(([p, values]) => {{
-            const style = percentileStyles[p];
-            ctx.beginPath();
-            ctx.strokeStyle = style.color;
-            ctx.lineWidth = style.width;
-            ctx.setLineDash(style.dash);
-
-            for (let i = 0; i < values.length; i++) {{
-                const x = scaleX(data.forecast_x[i]);
-                const y = scaleY(values[i]);
-                if (i === 0) ctx.moveTo(x, y);
-                else ctx.lineTo(x, y);
-            }}
-            ctx.stroke();
-            ctx.setLineDash([]);
-        }});
-
-        // Draw weighted forecast
-        if (data.weighted_forecast) {{
-            // White outline
-            ctx.beginPath();
-            ctx.strokeStyle = 'white';
-            ctx.lineWidth = 4;
-            for (let i = 0; i < data.weighted_forecast.length; i++) {{
-                const x = scaleX(data.forecast_x[i]);
-                const y = scaleY(data.weighted_forecast[i]);
-                if (i === 0) ctx.moveTo(x, y);
-                else ctx.lineTo(x, y);
-            }}
-            ctx.stroke();
-
-            // Red dashed inner line
-            ctx.beginPath();
-            ctx.strokeStyle = 'red';
-            ctx.lineWidth = 2;
-            ctx.setLineDash([6, 4]);
-            for (let i = 0; i < data.weighted_forecast.length; i++) {{
-                const x = scaleX(data.forecast_x[i]);
-                const y = scaleY(data.weighted_forecast[i]);
-                if (i === 0) ctx.moveTo(x, y);
-                else ctx.lineTo(x, y);
-            }}
-            ctx.stroke();
-            ctx.setLineDash([]);
-        }}
-
-        // Draw historical prices
+"""
+
+_TOOLTIP_HTML = """
+    <div id="forecast-tooltip-${id}"></div>
+    <div id="forecast-crosshair-${id}">
+        <div id="forecast-crosshair-v-${id}"></div>
+        <div id="forecast-crosshair-h-${id}"></div>
+    </div>
+"""
+
+_DRAW_JS = """
+    const data = ${data_json};
+    const canvas = document.getElementById('forecast-canvas-${id}');
+    const ctx = canvas.getContext('2d');
+
+    // High DPI support
+    const dpr = window.devicePixelRatio || 1;
+    canvas.width = ${width} * dpr;
+    canvas.height = ${height} * dpr;
+    canvas.style.width = '${width}px';
+    canvas.style.height = '${height}px';
+    ctx.scale(dpr, dpr);
+
+    const width = ${width};
+    const height = ${height};
+    const padding = { top: 20, right: 80, bottom: 40, left: 60 };
+    const chartWidth = width - padding.left - padding.right;
+    const chartHeight = height - padding.top - padding.bottom;
+
+    // Compute data ranges
+    const allValues = [...data.historical.y];
+    data.paths.forEach(p => allValues.push(...p.values));
+    if (data.weighted_forecast) allValues.push(...data.weighted_forecast);
+    Object.values(data.percentiles).forEach(p => allValues.push(...p));
+
+    const yMin = Math.min(...allValues) * 0.98;
+    const yMax = Math.max(...allValues) * 1.02;
+    const xMin = 0;
+    const xMax = data.forecast_x[data.forecast_x.length - 1];
+
+    // Scale functions
+    const scaleX = (x) => padding.left + (x - xMin) / (xMax - xMin) * chartWidth;
+    const scaleY = (y) => padding.top + chartHeight - (y - yMin) / (yMax - yMin) * chartHeight;
+
+    // Clear and set background
+    ctx.fillStyle = '${bg_color}';
+    ctx.fillRect(0, 0, width, height);
+
+    // Draw grid
+    ctx.strokeStyle = '${grid_color}';
+    ctx.lineWidth = 1;
+    const nGridLines = 6;
+    for (let i = 0; i <= nGridLines; i++) {
+        const y = padding.top + (chartHeight / nGridLines) * i;
         ctx.beginPath();
-        ctx.strokeStyle = '{hist_color}';
-        ctx.lineWidth = 3;
-        for (let i = 0; i < data.historical.x.length; i++) {{
-            const x = scaleX(data.historical.x[i]);
-            const y = scaleY(data.historical.y[i]);
+        ctx.moveTo(padding.left, y);
+        ctx.lineTo(width - padding.right, y);
+        ctx.stroke();
+    }
+
+    // Draw y-axis labels
+    ctx.fillStyle = '${text_color}';
+    ctx.font = '11px Space Grotesk, sans-serif';
+    ctx.textAlign = 'right';
+    for (let i = 0; i <= nGridLines; i++) {
+        const y = padding.top + (chartHeight / nGridLines) * i;
+        const value = yMax - (yMax - yMin) * (i / nGridLines);
+        ctx.fillText(value.toFixed(2), padding.left - 8, y + 4);
+    }
+
+    // Draw x-axis labels
+    ctx.textAlign = 'center';
+    const nXLabels = 6;
+    for (let i = 0; i <= nXLabels; i++) {
+        const x = padding.left + (chartWidth / nXLabels) * i;
+        const xVal = xMin + (xMax - xMin) * (i / nXLabels);
+        ctx.fillText(Math.round(xVal).toString(), x, height - padding.bottom + 20);
+    }
+
+    // Draw individual paths (low density first)
+    data.paths.forEach(path => {
+        ctx.beginPath();
+        ctx.strokeStyle = path.color;
+        ctx.globalAlpha = path.opacity;
+        ctx.lineWidth = path.width;
+
+        for (let i = 0; i < path.values.length; i++) {
+            const x = scaleX(data.forecast_x[i]);
+            const y = scaleY(path.values[i]);
             if (i === 0) ctx.moveTo(x, y);
             else ctx.lineTo(x, y);
-        }}
+        }
         ctx.stroke();
+    });
+
+    ctx.globalAlpha = 1;
 
-        // Draw annotations
-        ctx.font = '10px Space Grotesk, sans-serif';
-        ctx.textAlign = 'left';
-        data.annotations.forEach(ann => {{
-            const x = padding.left + ann.x * chartWidth;
-            const y = padding.top + (1 - ann.y) * chartHeight;
-
-            // Background box
-            ctx.fillStyle = 'rgba(0, 0, 0, 0.7)';
-            const lines = ann.text.split('<br>');
-            const lineHeight = ann.font_size + 4;
-            const boxHeight = lines.length * lineHeight + 8;
-            const boxWidth = Math.max(...lines.map(l => ctx.measureText(l.replace(/<[^>]+>/g, '')).width)) + 16;
-            ctx.fillRect(x, y, boxWidth, boxHeight);
-
-            // Text
-            ctx.fillStyle = '{text_color}';
-            ctx.font = ann.font_size + 'px Space Grotesk, sans-serif';
-            lines.forEach((line, i) => {{
-                const cleanLine = line.replace(/<[^>]+>/g, '');
-                ctx.fillText(cleanLine, x + 8, y + 14 + i * lineHeight);
-            }});
-        }});
-
-        // Draw colorbar gradient
-        const colorbar = document.getElementById('colorbar');
-        if (colorbar) {{
-            const stops = data.colorscale.map(s => {{
-                const [pos, rgb] = s;
-                return `rgb(${{rgb[0]}}, ${{rgb[1]}}, ${{rgb[2]}}) ${{pos * 100}}%`;
-            }});
-            colorbar.style.background = `linear-gradient(to right, ${{stops.join(', ')}})`;
-        }}
-
-        // Interactive tooltip
-        const tooltip = document.getElementById('forecast-tooltip');
-        const crosshair = document.getElementById('forecast-crosshair');
-        const crosshairV = document.getElementById('forecast-crosshair-v');
-        const crosshairH = document.getElementById('forecast-crosshair-h');
-
-        // Get value at x position
-        function getValuesAtX(xIdx) {{
-            const result = {{}};
-
-            // Historical
-            if (xIdx < data.historical.x.length) {{
-                result.historical = data.historical.y[xIdx];
-                result.type = 'historical';
-                result.idx = xIdx;
-            }} else {{
-                // Forecast region
-                const forecastIdx = xIdx - data.historical.x.length + 1;
-                result.type = 'forecast';
-                result.idx = forecastIdx;
-
-                if (data.weighted_forecast && forecastIdx < data.weighted_forecast.length) {{
-                    result.forecast = data.weighted_forecast[forecastIdx];
-                }}
-                if (data.percentiles['50'] && forecastIdx < data.percentiles['50'].length) {{
-                    result.median = data.percentiles['50'][forecastIdx];
-                }}
-                if (data.percentiles['5'] && forecastIdx < data.percentiles['5'].length) {{
-                    result.p5 = data.percentiles['5'][forecastIdx];
-                }}
-                if (data.percentiles['95'] && forecastIdx < data.percentiles['95'].length) {{
-                    result.p95 = data.percentiles['95'][forecastIdx];
-                }}
-            }}
-            return result;
-        }}
-
-        canvas.addEventListener('mousemove', (e) => {{
-            const rect = canvas.getBoundingClientRect();
-            const x = e.clientX - rect.left;
-            const y = e.clientY - rect.top;
-
-            // Check if in chart area
-            if (x < padding.left || x > width - padding.right ||
-                y < padding.top || y > height - padding.bottom) {{
-                tooltip.style.display = 'none';
-                crosshair.style.display = 'none';
-                return;
-            }}
-
-            // Calculate data index
-            const xRatio = (x - padding.left) / chartWidth;
-            const xVal = xMin + xRatio * (xMax - xMin);
-            const xIdx = Math.round(xVal);
-
-            // Calculate price at y
-            const yRatio = 1 - (y - padding.top) / chartHeight;
-            const price = yMin + yRatio * (yMax - yMin);
-
-            // Get values at this x
-            const values = getValuesAtX(xIdx);
-
-            // Build tooltip content
-            let html = '';
-            if (values.type === 'historical') {{
-                html = `<div style="color: #888;">Historical</div>`;
-                html += `<div>Bar: ${{values.idx}}</div>`;
-                html += `<div>Price: <b>$${{values.historical.toFixed(2)}}</b></div>`;
-            }} else {{
-                html = `<div style="color: #888;">Forecast Step ${{values.idx}}</div>`;
-                if (values.forecast !== undefined) {{
-                    html += `<div>Forecast: <b>$${{values.forecast.toFixed(2)}}</b></div>`;
-                }}
-                if (values.median !== undefined) {{
-                    html += `<div>Median: $${{values.median.toFixed(2)}}</div>`;
-                }}
-                if (values.p5 !== undefined && values.p95 !== undefined) {{
-                    html += `<div style="color: #888; font-size: 10px;">Range: $${{values.p5.toFixed(2)}} - $${{values.p95.toFixed(2)}}</div>`;
-                }}
-            }}
-            html += `<div style="color: #666; font-size: 10px; margin-top: 4px;">Cursor: $${{price.toFixed(2)}}</div>`;
-
-            tooltip.innerHTML = html;
-            tooltip.style.display = 'block';
-
-            // Position tooltip
-            let tooltipX = x + 15;
-            let tooltipY = y - 10;
-            if (tooltipX + 150 > width) tooltipX = x - 160;
-            if (tooltipY < 0) tooltipY = y + 20;
-            tooltip.style.left = tooltipX + 'px';
-            tooltip.style.top = tooltipY + 'px';
-
-            // Position crosshair
-            crosshair.style.display = 'block';
-            crosshairV.style.left = x + 'px';
-            crosshairV.style.height = chartHeight + 'px';
-            crosshairH.style.top = y + 'px';
-            crosshairH.style.width = chartWidth + 'px';
-        }});
-
-        canvas.addEventListener('mouseleave', () => {{
+    // Draw percentile lines
+    const percentileStyles = {
+        5: { color: 'rgba(100, 100, 255, 0.8)', width: 1, dash: [4, 4] },
+        25: { color: 'rgba(100, 150, 255, 0.8)', width: 1.5, dash: [6, 3] },
+        50: { color: 'rgba(255, 100, 100, 1.0)', width: 3, dash: [] },
+        75: { color: 'rgba(100, 150, 255, 0.8)', width: 1.5, dash: [6, 3] },
+        95: { color: 'rgba(100, 100, 255, 0.8)', width: 1, dash: [4, 4] }
+    };
+
+    Object.entries(data.percentiles).forEach(([p, values]) => {
+        const style = percentileStyles[p];
+        ctx.beginPath();
+        ctx.strokeStyle = style.color;
+        ctx.lineWidth = style.width;
+        ctx.setLineDash(style.dash);
+
+        for (let i = 0; i < values.length; i++) {
+            const x = scaleX(data.forecast_x[i]);
+            const y = scaleY(values[i]);
+            if (i === 0) ctx.moveTo(x, y);
+            else ctx.lineTo(x, y);
+        }
+        ctx.stroke();
+        ctx.setLineDash([]);
+    });
+
+    // Draw weighted forecast
+    if (data.weighted_forecast) {
+        // White outline
+        ctx.beginPath();
+        ctx.strokeStyle = 'white';
+        ctx.lineWidth = 4;
+        for (let i = 0; i < data.weighted_forecast.length; i++) {
+            const x = scaleX(data.forecast_x[i]);
+            const y = scaleY(data.weighted_forecast[i]);
+            if (i === 0) ctx.moveTo(x, y);
+            else ctx.lineTo(x, y);
+        }
+        ctx.stroke();
+
+        // Red dashed inner line
+        ctx.beginPath();
+        ctx.strokeStyle = 'red';
+        ctx.lineWidth = 2;
+        ctx.setLineDash([6, 4]);
+        for (let i = 0; i < data.weighted_forecast.length; i++) {
+            const x = scaleX(data.forecast_x[i]);
+            const y = scaleY(data.weighted_forecast[i]);
+            if (i === 0) ctx.moveTo(x, y);
+            else ctx.lineTo(x, y);
+        }
+        ctx.stroke();
+        ctx.setLineDash([]);
+    }
+
+    // Draw historical prices
+    ctx.beginPath();
+    ctx.strokeStyle = '${hist_color}';
+    ctx.lineWidth = 3;
+    for (let i = 0; i < data.historical.x.length; i++) {
+        const x = scaleX(data.historical.x[i]);
+        const y = scaleY(data.historical.y[i]);
+        if (i === 0) ctx.moveTo(x, y);
+        else ctx.lineTo(x, y);
+    }
+    ctx.stroke();
+
+    // Draw annotations
+    ctx.font = '10px Space Grotesk, sans-serif';
+    ctx.textAlign = 'left';
+    data.annotations.forEach(ann => {
+        const x = padding.left + ann.x * chartWidth;
+        const y = padding.top + (1 - ann.y) * chartHeight;
+
+        // Background box
+        ctx.fillStyle = 'rgba(0, 0, 0, 0.7)';
+        const lines = ann.text.split('<br>');
+        const lineHeight = ann.font_size + 4;
+        const boxHeight = lines.length * lineHeight + 8;
+        const boxWidth = Math.max(...lines.map(l => ctx.measureText(l.replace(/<[^>]+>/g, '')).width)) + 16;
+        ctx.fillRect(x, y, boxWidth, boxHeight);
+
+        // Text
+        ctx.fillStyle = '${text_color}';
+        ctx.font = ann.font_size + 'px Space Grotesk, sans-serif';
+        lines.forEach((line, i) => {
+            const cleanLine = line.replace(/<[^>]+>/g, '');
+            ctx.fillText(cleanLine, x + 8, y + 14 + i * lineHeight);
+        });
+    });
+
+    // Draw colorbar gradient
+    const colorbar = document.getElementById('colorbar-${id}');
+    if (colorbar) {
+        const stops = data.colorscale.map(s => {
+            const [pos, rgb] = s;
+            return `rgb($${rgb[0]}, $${rgb[1]}, $${rgb[2]}) $${pos * 100}%`;
+        });
+        colorbar.style.background = `linear-gradient(to right, $${stops.join(', ')})`;
+    }
+"""
+
+_TOOLTIP_JS = """
+    // Interactive tooltip
+    const tooltip = document.getElementById('forecast-tooltip-${id}');
+    const crosshair = document.getElementById('forecast-crosshair-${id}');
+    const crosshairV = document.getElementById('forecast-crosshair-v-${id}');
+    const crosshairH = document.getElementById('forecast-crosshair-h-${id}');
+
+    // Get value at x position
+    function getValuesAtX(xIdx) {
+        const result = {};
+
+        // Historical
+        if (xIdx < data.historical.x.length) {
+            result.historical = data.historical.y[xIdx];
+            result.type = 'historical';
+            result.idx = xIdx;
+        } else {
+            // Forecast region
+            const forecastIdx = xIdx - data.historical.x.length + 1;
+            result.type = 'forecast';
+            result.idx = forecastIdx;
+
+            if (data.weighted_forecast && forecastIdx < data.weighted_forecast.length) {
+                result.forecast = data.weighted_forecast[forecastIdx];
+            }
+            if (data.percentiles['50'] && forecastIdx < data.percentiles['50'].length) {
+                result.median = data.percentiles['50'][forecastIdx];
+            }
+            if (data.percentiles['5'] && forecastIdx < data.percentiles['5'].length) {
+                result.p5 = data.percentiles['5'][forecastIdx];
+            }
+            if (data.percentiles['95'] && forecastIdx < data.percentiles['95'].length) {
+                result.p95 = data.percentiles['95'][forecastIdx];
+            }
+        }
+        return result;
+    }
+
+    canvas.addEventListener('mousemove', (e) => {
+        const rect = canvas.getBoundingClientRect();
+        const x = e.clientX - rect.left;
+        const y = e.clientY - rect.top;
+
+        // Check if in chart area
+        if (x < padding.left || x > width - padding.right ||
+            y < padding.top || y > height - padding.bottom) {
             tooltip.style.display = 'none';
             crosshair.style.display = 'none';
-        }});
-    }})();
-    </script>
-</body>
-</html>
-        """
-        return html
+            return;
+        }
+
+        // Calculate data index
+        const xRatio = (x - padding.left) / chartWidth;
+        const xVal = xMin + xRatio * (xMax - xMin);
+        const xIdx = Math.round(xVal);
+
+        // Calculate price at y
+        const yRatio = 1 - (y - padding.top) / chartHeight;
+        const price = yMin + yRatio * (yMax - yMin);
+
+        // Get values at this x
+        const values = getValuesAtX(xIdx);
+
+        // Build tooltip content
+        let html = '';
+        if (values.type === 'historical') {
+            html = `<div style="color: #888;">Historical</div>`;
+            html += `<div>Bar: $${values.idx}</div>`;
+            html += `<div>Price: <b>$$$${values.historical.toFixed(2)}</b></div>`;
+        } else {
+            html = `<div style="color: #888;">Forecast Step $${values.idx}</div>`;
+            if (values.forecast !== undefined) {
+                html += `<div>Forecast: <b>$$$${values.forecast.toFixed(2)}</b></div>`;
+            }
+            if (values.median !== undefined) {
+                html += `<div>Median: $$$${values.median.toFixed(2)}</div>`;
+            }
+            if (values.p5 !== undefined && values.p95 !== undefined) {
+                html += `<div style="color: #888; font-size: 10px;">Range: $$$${values.p5.toFixed(2)} - $$$${values.p95.toFixed(2)}</div>`;
+            }
+        }
+        html += `<div style="color: #666; font-size: 10px; margin-top: 4px;">Cursor: $$$${price.toFixed(2)}</div>`;
+
+        tooltip.innerHTML = html;
+        tooltip.style.display = 'block';
+
+        // Position tooltip
+        let tooltipX = x + 15;
+        let tooltipY = y - 10;
+        if (tooltipX + 150 > width) tooltipX = x - 160;
+        if (tooltipY < 0) tooltipY = y + 20;
+        tooltip.style.left = tooltipX + 'px';
+        tooltip.style.top = tooltipY + 'px';
+
+        // Position crosshair
+        crosshair.style.display = 'block';
+        crosshairV.style.left = x + 'px';
+        crosshairV.style.height = chartHeight + 'px';
+        crosshairH.style.top = y + 'px';
+        crosshairH.style.width = chartWidth + 'px';
+    });
+
+    canvas.addEventListener('mouseleave', () => {
+        tooltip.style.display = 'none';
+        crosshair.style.display = 'none';
+    });
+"""
+
+_HTML_TEMPLATE = Template("".join([
+    "\n", FONT_LINKS, "\n<style>",
+    """
+    #forecast-container-${id} {
+        font-family: 'Space Grotesk', -apple-system, BlinkMacSystemFont, sans-serif;
+        background: ${bg_color};
+        padding: 16px;
+        border-radius: 0;
+    }
+""",
+    _CHART_CSS,
+    """</style>
+
+<div id="forecast-container-${id}">
+    ${title_html}
+    <canvas id="forecast-canvas-${id}" width="${width}" height="${height}"></canvas>
+""",
+    _LEGEND_HTML,
+    "</div>\n\n<script>\n(function() {",
+    _DRAW_JS,
+    "})();\n</script>\n",
+]))
+
+_STREAMLIT_HTML_TEMPLATE = Template("".join([
+    """
+<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+""",
+    FONT_LINKS,
+    """
+<style>
+    * { margin: 0; padding: 0; box-sizing: border-box; }
+    body {
+        font-family: 'Space Grotesk', -apple-system, BlinkMacSystemFont, sans-serif;
+        background: ${bg_color};
+        padding: 8px;
+    }
+    #forecast-container-${id} {
+        width: 100%;
+        position: relative;
+    }
+""",
+    _CHART_CSS,
+    _TOOLTIP_CSS,
+    """</style>
+</head>
+<body>
+<div id="forecast-container-${id}">
+    ${title_html}
+""",
+    _TOOLTIP_HTML,
+    """    <canvas id="forecast-canvas-${id}" width="${width}" height="${height}" style="cursor: crosshair;"></canvas>
+""",
+    _LEGEND_HTML,
+    "</div>\n<script>\n(async function() {",
+    GUNZIP_JS,
+    _DRAW_JS,
+    _TOOLTIP_JS,
+    "})();\n</script>\n</body>\n</html>\n",
+]))
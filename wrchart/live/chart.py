@@ -5,12 +5,15 @@ Uses lightweight-charts with websocket connection for live updates.
 """
 
 from typing import Optional, List, Dict, Any
-import json
-import uuid
+import secrets
 
 import polars as pl
 
-from wrchart.core.themes import Theme, WayyTheme
+from wrchart._sanitize import sanitize
+from wrchart.core.serialization import dumps
+from wrchart.core.series import _time_to_js, _to_numpy
+from wrchart.core.backends import lightweight
+from wrchart.core.themes import FONT_LINKS, Theme, WayyTheme
 
 
 class LiveChart:
@@ -49,32 +52,50 @@ class LiveChart:
         self.theme = theme or WayyTheme
         self.max_points = max_points
         self.initial_data = initial_data
-        self._id = str(uuid.uuid4())[:8]
+        self._id = secrets.token_hex(4)
 
     def _get_initial_data_json(self) -> str:
-        """Convert initial data to JSON."""
+        """
+        Convert initial data to JSON.
+
+        Data is sent as one array per field; the page zips the columns
+        into row objects before handing them to the series.
+        """
         if self.initial_data is None:
-            return "[]"
+            return "{}"
+
+        df = self.initial_data
+
+        def first(*names: str) -> Optional[str]:
+            return next((name for name in names if name in df.columns), None)
 
         if self.chart_type == "candlestick":
-            data = []
-            for row in self.initial_data.iter_rows(named=True):
-                data.append({
-                    "time": row.get("time") or row.get("timestamp"),
-                    "open": row.get("open"),
-                    "high": row.get("high"),
-                    "low": row.get("low"),
-                    "close": row.get("close"),
-                })
+            fields = {
+                "time": first("time", "timestamp"),
+                "open": first("open"),
+                "high": first("high"),
+                "low": first("low"),
+                "close": first("close"),
+            }
         else:
-            data = []
-            for row in self.initial_data.iter_rows(named=True):
-                data.append({
-                    "time": row.get("time") or row.get("timestamp"),
-                    "value": row.get("value") or row.get("close") or row.get("price"),
-                })
-
-        return json.dumps(data)
+            fields = {
+                "time": first("time", "timestamp"),
+                "value": first("value", "close", "price"),
+            }
+
+        columns = {}
+        for field_name, col in fields.items():
+            if col is None:
+                continue
+            values = df[col]
+            if field_name == "time":
+                columns["time"] = _time_to_js(values)
+            elif values.dtype.is_numeric():
+                columns[field_name] = sanitize(_to_numpy(values))
+            else:
+                columns[field_name] = values.to_list()
+
+        return dumps(columns)
 
     def _generate_html(self) -> str:
         """Generate HTML with live-updating chart."""
@@ -114,7 +135,7 @@ class LiveChart:
 
                 // Only update if we have valid data
                 if (point.time && point.close) {
-                    series.update(point);
+                    queuePoint(point);
                 }
             """
         elif self.chart_type == "area":
@@ -139,7 +160,7 @@ class LiveChart:
                     value: data.value || data.close || data.price,
                 };
                 if (point.time && point.value) {
-                    series.update(point);
+                    queuePoint(point);
                 }
             """
         else:  # line
@@ -162,7 +183,7 @@ class LiveChart:
                     value: data.value || data.close || data.price,
                 };
                 if (point.time && point.value) {
-                    series.update(point);
+                    queuePoint(point);
                 }
             """
 
@@ -171,8 +192,8 @@ class LiveChart:
 <html>
 <head>
     <title>{self.title}</title>
+    {FONT_LINKS}
     <style>
-        @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;600&family=JetBrains+Mono&display=swap');
         * {{ margin: 0; padding: 0; box-sizing: border-box; }}
         body {{
             background: {theme.colors.background};
@@ -235,7 +256,7 @@ class LiveChart:
         <span>Last: <span id="last-update">--</span></span>
     </div>
 
-    <script src="https://unpkg.com/lightweight-charts@4.2.1/dist/lightweight-charts.standalone.production.js"></script>
+    <script src="{lightweight.LIGHTWEIGHT_CHARTS_URL}"></script>
     <script>
         const wsUrl = '{self.ws_url}';
         const channel = '{self.channel}';
@@ -271,7 +292,15 @@ class LiveChart:
         const series = {series_create}({series_options});
 
         // Set initial data
-        const initialData = {initial_data};
+        const initialColumns = {initial_data};
+        const initialKeys = Object.keys(initialColumns);
+        const initialLength = initialKeys.length ? initialColumns[initialKeys[0]].length : 0;
+        const initialData = new Array(initialLength);
+        for (let i = 0; i < initialLength; i++) {{
+            const row = {{}};
+            for (const key of initialKeys) row[key] = initialColumns[key][i];
+            initialData[i] = row;
+        }}
         if (initialData.length > 0) {{
             series.setData(initialData);
         }}
@@ -288,6 +317,69 @@ class LiveChart:
         const countEl = document.getElementById('update-count');
         const lastEl = document.getElementById('last-update');
 
+        // Messages can arrive faster than the display refreshes; queue
+        // them and touch the chart and the DOM at most once per frame
+        let pendingPoints = [];
+        let pendingPrice = null;
+        let flushFrame = 0;
+
+        function queuePoint(point) {{
+            const last = pendingPoints[pendingPoints.length - 1];
+            if (last && last.time === point.time) {{
+                // Same bar: fold the ticks together as the bar would
+                if (last.high !== undefined) {{
+                    point.open = last.open;
+                    point.high = Math.max(last.high, point.high);
+                    point.low = Math.min(last.low, point.low);
+                }}
+                pendingPoints[pendingPoints.length - 1] = point;
+            }} else {{
+                pendingPoints.push(point);
+            }}
+        }}
+
+        function scheduleFlush() {{
+            if (!flushFrame) flushFrame = requestAnimationFrame(flush);
+        }}
+
+        function flush() {{
+            flushFrame = 0;
+            for (const point of pendingPoints) {{
+                series.update(point);
+                const last = dataPoints[dataPoints.length - 1];
+                if (last && last.time === point.time) dataPoints[dataPoints.length - 1] = point;
+                else dataPoints.push(point);
+            }}
+            pendingPoints = [];
+
+            // Keep the series itself to the rolling window; update() alone
+            // would grow it for as long as the page stays open
+            if (dataPoints.length > maxPoints) {{
+                dataPoints = dataPoints.slice(-maxPoints);
+                series.setData(dataPoints);
+            }}
+
+            // Update price display
+            const price = pendingPrice;
+            pendingPrice = null;
+            if (price) {{
+                priceEl.innerHTML = formatPrice(price);
+                lastPrice = price;
+
+                // Show change
+                if (firstPrice) {{
+                    const change = ((price - firstPrice) / firstPrice * 100).toFixed(2);
+                    const changeClass = change >= 0 ? 'up' : 'down';
+                    const sign = change >= 0 ? '+' : '';
+                    priceEl.innerHTML += `<span class="price-change ${{changeClass}}">${{sign}}${{change}}%</span>`;
+                }}
+            }}
+
+            // Update stats
+            countEl.textContent = updateCount;
+            lastEl.textContent = clockFormat.format(new Date());
+        }}
+
         // WebSocket connection
         let ws = null;
         let reconnectAttempts = 0;
@@ -314,35 +406,16 @@ class LiveChart:
                 if (msg.type === 'update' && msg.channel === channel) {{
                     const data = msg.data;
 
-                    // Update chart
+                    // Queue the chart update
                     {update_code}
 
-                    // Update price display
-                    const price = data.close || data.price || data.value;
-                    if (price) {{
-                        priceEl.innerHTML = formatPrice(price);
-                        if (firstPrice === null) firstPrice = price;
-                        lastPrice = price;
-
-                        // Show change
-                        if (firstPrice) {{
-                            const change = ((price - firstPrice) / firstPrice * 100).toFixed(2);
-                            const changeClass = change >= 0 ? 'up' : 'down';
-                            const sign = change >= 0 ? '+' : '';
-                            priceEl.innerHTML += `<span class="price-change ${{changeClass}}">${{sign}}${{change}}%</span>`;
-                        }}
+                    const latest = data.close || data.price || data.value;
+                    if (latest) {{
+                        pendingPrice = latest;
+                        if (firstPrice === null) firstPrice = latest;
                     }}
-
-                    // Update stats
                     updateCount++;
-                    countEl.textContent = updateCount;
-                    lastEl.textContent = new Date().toLocaleTimeString();
-
-                    // Rolling window
-                    dataPoints.push(point);
-                    if (dataPoints.length > maxPoints) {{
-                        dataPoints = dataPoints.slice(-maxPoints);
-                    }}
+                    scheduleFlush();
                 }}
             }};
 
@@ -364,15 +437,24 @@ class LiveChart:
             }};
         }}
 
+        // Shared formatters for the price display and update clock
+        const thousandsFormat = new Intl.NumberFormat('en-US', {{minimumFractionDigits: 2, maximumFractionDigits: 2}});
+        const clockFormat = new Intl.DateTimeFormat(undefined, {{timeStyle: 'medium'}});
+
         function formatPrice(price) {{
-            if (price >= 1000) return price.toLocaleString('en-US', {{minimumFractionDigits: 2, maximumFractionDigits: 2}});
+            if (price >= 1000) return thousandsFormat.format(price);
             if (price >= 1) return price.toFixed(2);
             return price.toFixed(6);
         }}
 
-        // Auto-resize
+        // Auto-resize, relaying out only when the width changed
+        let lastWidth = 0;
         const resizeObserver = new ResizeObserver(entries => {{
-            chart.applyOptions({{ width: entries[0].contentRect.width }});
+            const width = entries[0].contentRect.width;
+            if (width > 0 && width !== lastWidth) {{
+                lastWidth = width;
+                chart.applyOptions({{ width }});
+            }}
         }});
         resizeObserver.observe(document.getElementById('chart').parentElement);
 
@@ -5,10 +5,11 @@ Combines charts, tables, and metrics in a single live view.
 """
 
 from typing import Optional, List, Dict, Any, Union
-import json
-import uuid
+import secrets
 
-from wrchart.core.themes import Theme, WayyTheme
+from wrchart.core.serialization import dumps
+from wrchart.core.backends import lightweight
+from wrchart.core.themes import FONT_LINKS, Theme, WayyTheme
 from wrchart.live.chart import LiveChart
 from wrchart.live.table import LiveTable
 
@@ -43,7 +44,7 @@ class LiveDashboard:
         self.theme = theme or WayyTheme
         self.layout = layout
         self.columns = columns
-        self._id = str(uuid.uuid4())[:8]
+        self._id = secrets.token_hex(4)
         self.components: List[Dict[str, Any]] = []
 
     def add_chart(
@@ -106,7 +107,7 @@ class LiveDashboard:
     def _generate_html(self) -> str:
         """Generate complete dashboard HTML."""
         theme = self.theme
-        components_json = json.dumps(self.components)
+        components_json = dumps(self.components)
 
         # Calculate grid layout
         num_components = len(self.components)
@@ -117,8 +118,8 @@ class LiveDashboard:
 <html>
 <head>
     <title>{self.title}</title>
+    {FONT_LINKS}
     <style>
-        @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;600;700&family=JetBrains+Mono&display=swap');
         * {{ margin: 0; padding: 0; box-sizing: border-box; }}
         body {{
             background: {theme.colors.background};
@@ -277,7 +278,7 @@ class LiveDashboard:
 
     <div class="dashboard-grid" id="grid"></div>
 
-    <script src="https://unpkg.com/lightweight-charts@4.2.1/dist/lightweight-charts.standalone.production.js"></script>
+    <script src="{lightweight.LIGHTWEIGHT_CHARTS_URL}"></script>
     <script>
         const wsUrl = '{self.ws_url}';
         const components = {components_json};
@@ -358,9 +359,14 @@ class LiveDashboard:
 
                 charts[comp.channel] = {{ chart, series, priceEl: document.getElementById(`chart-price-${{idx}}`), type: comp.chart_type }};
 
-                // Resize observer
+                // Resize observer; height-only changes need no relayout
+                let lastWidth = 0;
                 new ResizeObserver(entries => {{
-                    chart.applyOptions({{ width: entries[0].contentRect.width }});
+                    const width = entries[0].contentRect.width;
+                    if (width > 0 && width !== lastWidth) {{
+                        lastWidth = width;
+                        chart.applyOptions({{ width }});
+                    }}
                 }}).observe(chartEl);
 
             }} else if (comp.type === 'table') {{
@@ -414,15 +420,18 @@ class LiveDashboard:
             }}
         }});
 
-        // Format functions
+        // Format functions (formatters are created once, not per value)
+        const thousandsFormat = new Intl.NumberFormat('en-US', {{minimumFractionDigits: 2, maximumFractionDigits: 2}});
+        const clockFormat = new Intl.DateTimeFormat(undefined, {{timeStyle: 'medium'}});
+
         function formatValue(value, format) {{
             if (value === null || value === undefined) return '--';
             switch (format) {{
                 case 'time':
-                    return new Date(value).toLocaleTimeString();
+                    return clockFormat.format(new Date(value));
                 case 'price':
                     const n = parseFloat(value);
-                    if (n >= 1000) return n.toLocaleString('en-US', {{minimumFractionDigits:2, maximumFractionDigits:2}});
+                    if (n >= 1000) return thousandsFormat.format(n);
                     return n >= 1 ? n.toFixed(2) : n.toFixed(6);
                 case 'percent':
                     return (parseFloat(value) * 100).toFixed(2) + '%';
@@ -8,10 +8,12 @@ import asyncio
 import json
 import logging
 from typing import Dict, Set, Callable, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 import weakref
 
+from wrchart.core.serialization import dumps
+
 try:
     import websockets
     from websockets.server import serve
@@ -34,7 +36,7 @@ class LiveMessage:
             self.timestamp = datetime.utcnow().isoformat()
 
     def to_json(self) -> str:
-        return json.dumps(asdict(self))
+        return dumps(self)
 
 
 class LiveServer:
@@ -124,7 +126,7 @@ class LiveServer:
             elif action == "unsubscribe" and channel:
                 self._unsubscribe_client(client, channel)
             elif action == "ping":
-                await client.send(json.dumps({"type": "pong"}))
+                await client.send(dumps({"type": "pong"}))
 
         except json.JSONDecodeError:
             logger.warning(f"Invalid JSON from client: {message[:100]}")
@@ -143,7 +145,7 @@ class LiveServer:
             self.stream_tasks[channel] = task
 
         # Send confirmation
-        await client.send(json.dumps({
+        await client.send(dumps({
             "type": "subscribed",
             "channel": channel
         }))
@@ -5,10 +5,10 @@ Connects to websocket for live updates with row highlighting.
 """
 
 from typing import Optional, List, Dict, Any
-import json
-import uuid
+import secrets
 
-from wrchart.core.themes import Theme, WayyTheme
+from wrchart.core.serialization import dumps
+from wrchart.core.themes import FONT_LINKS, Theme, WayyTheme
 
 
 class LiveTable:
@@ -48,7 +48,7 @@ class LiveTable:
         self.theme = theme or WayyTheme
         self.height = height
         self.highlight_duration = highlight_duration
-        self._id = str(uuid.uuid4())[:8]
+        self._id = secrets.token_hex(4)
 
         # Default columns if not specified
         self.columns = columns or [
@@ -61,15 +61,15 @@ class LiveTable:
     def _generate_html(self) -> str:
         """Generate HTML with live-updating table."""
         theme = self.theme
-        columns_json = json.dumps(self.columns)
+        columns_json = dumps(self.columns)
 
         html = f"""
 <!DOCTYPE html>
 <html>
 <head>
     <title>{self.title}</title>
+    {FONT_LINKS}
     <style>
-        @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;600&family=JetBrains+Mono&display=swap');
         * {{ margin: 0; padding: 0; box-sizing: border-box; }}
         body {{
             background: {theme.colors.background};
@@ -211,6 +211,15 @@ class LiveTable:
         const updateCountEl = document.getElementById('update-count');
         const lastEl = document.getElementById('last-update');
 
+        // Formatters are reused across cells and updates
+        const thousandsFormat = new Intl.NumberFormat('en-US', {{minimumFractionDigits: 2, maximumFractionDigits: 2}});
+        const numberFormat = new Intl.NumberFormat();
+        const clockFormat = new Intl.DateTimeFormat(undefined, {{timeStyle: 'medium'}});
+        const dateTimeFormat = new Intl.DateTimeFormat(undefined, {{
+            year: 'numeric', month: 'numeric', day: 'numeric',
+            hour: 'numeric', minute: 'numeric', second: 'numeric'
+        }});
+
         // Format value based on column config
         function formatValue(value, format) {{
             if (value === null || value === undefined) return '--';
@@ -219,22 +228,22 @@ class LiveTable:
                 case 'time':
                     if (typeof value === 'string') {{
                         const d = new Date(value);
-                        return d.toLocaleTimeString();
+                        return clockFormat.format(d);
                     }}
                     return value;
                 case 'datetime':
                     if (typeof value === 'string') {{
                         const d = new Date(value);
-                        return d.toLocaleString();
+                        return dateTimeFormat.format(d);
                     }}
                     return value;
                 case 'price':
                     const num = parseFloat(value);
-                    if (num >= 1000) return num.toLocaleString('en-US', {{minimumFractionDigits: 2, maximumFractionDigits: 2}});
+                    if (num >= 1000) return thousandsFormat.format(num);
                     if (num >= 1) return num.toFixed(2);
                     return num.toFixed(6);
                 case 'number':
-                    return parseFloat(value).toLocaleString();
+                    return numberFormat.format(parseFloat(value));
                 case 'percent':
                     return (parseFloat(value) * 100).toFixed(2) + '%';
                 default:
@@ -292,7 +301,7 @@ class LiveTable:
             rowCountEl.textContent = tableBody.children.length;
             updateCount++;
             updateCountEl.textContent = updateCount;
-            lastEl.textContent = new Date().toLocaleTimeString();
+            lastEl.textContent = clockFormat.format(new Date());
         }}
 
         // WebSocket
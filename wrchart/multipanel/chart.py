@@ -6,9 +6,9 @@ supporting different chart types in each panel.
 """
 
 from typing import Any, Dict, List, Optional, Tuple, Union
-import json
-import uuid
+import secrets
 
+from wrchart.core.themes import FONT_LINKS
 from wrchart.multipanel.panels import Panel
 
 
@@ -79,7 +79,7 @@ class MultiPanelChart:
         self.height = height
         self.title = title
         self.theme = theme
-        self._id = str(uuid.uuid4())[:8]
+        self._id = secrets.token_hex(4)
 
         # Default equal sizes
         self.row_heights = row_heights or [1 / rows] * rows
@@ -172,9 +172,8 @@ class MultiPanelChart:
         panels_code = "\n".join(panel_js)
 
         html = f"""
+        {FONT_LINKS}
         <style>
-            @import url('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700&display=swap');
-
             #multipanel-container-{self._id} {{
                 font-family: 'Space Grotesk', -apple-system, BlinkMacSystemFont, sans-serif;
                 background: {bg_color};
@@ -8,11 +8,12 @@ multi-panel layout.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple, Union
-import json
 
 import numpy as np
 import polars as pl
 
+from wrchart.core.serialization import dumps
+
 
 @dataclass
 class Panel(ABC):
@@ -99,10 +100,10 @@ class LinePanel(Panel):
         chart_width = width - pad_left - pad_right
         chart_height = height - pad_top - pad_bottom
 
-        x_data_json = json.dumps(self.x_data)
-        y_series_json = json.dumps(y_series)
-        colors_json = json.dumps(colors)
-        widths_json = json.dumps(widths)
+        x_data_json = dumps(self.x_data)
+        y_series_json = dumps(y_series)
+        colors_json = dumps(colors)
+        widths_json = dumps(widths)
 
         return f"""
             (function() {{
@@ -230,10 +231,10 @@ class BarPanel(Panel):
         chart_width = width - pad_left - pad_right
         chart_height = height - pad_top - pad_bottom
 
-        categories_json = json.dumps(self.categories)
-        value_groups_json = json.dumps(value_groups)
-        colors_json = json.dumps(colors)
-        labels_json = json.dumps(self.labels or [])
+        categories_json = dumps(self.categories)
+        value_groups_json = dumps(value_groups)
+        colors_json = dumps(colors)
+        labels_json = dumps(self.labels or [])
 
         return f"""
             (function() {{
@@ -352,9 +353,9 @@ class HeatmapPanel(Panel):
         chart_width = width - pad_left - pad_right
         chart_height = height - pad_top - pad_bottom
 
-        data_json = json.dumps(self.data)
-        x_labels_json = json.dumps(self.x_labels or [])
-        y_labels_json = json.dumps(self.y_labels or [])
+        data_json = dumps(self.data)
+        x_labels_json = dumps(self.x_labels or [])
+        y_labels_json = dumps(self.y_labels or [])
 
         # Colorscale
         colorscale_stops = {
@@ -363,7 +364,7 @@ class HeatmapPanel(Panel):
             "hot": [[0, [10, 10, 40]], [0.5, [200, 50, 50]], [1, [255, 255, 200]]],
         }
         stops = colorscale_stops.get(self.colorscale, colorscale_stops["viridis"])
-        stops_json = json.dumps(stops)
+        stops_json = dumps(stops)
 
         return f"""
             (function() {{
@@ -488,7 +489,7 @@ class GaugePanel(Panel):
             (self.max_value, "#F44336"),  # Red
         ]
 
-        thresholds_json = json.dumps(thresholds)
+        thresholds_json = dumps(thresholds)
         center_x = x + width // 2
         center_y = y + height // 2 + 20
         radius = min(width, height) * 0.35
@@ -612,8 +613,8 @@ class AreaPanel(Panel):
         chart_width = width - pad_left - pad_right
         chart_height = height - pad_top - pad_bottom
 
-        x_data_json = json.dumps(self.x_data)
-        y_data_json = json.dumps(self.y_data)
+        x_data_json = dumps(self.x_data)
+        y_data_json = dumps(self.y_data)
 
         return f"""
             (function() {{
@@ -4,20 +4,27 @@ Data transforms for non-standard chart types and data processing.
 All transforms work with Polars DataFrames for maximum performance.
 """
 
-from wrchart.transforms.decimation import lttb_downsample
+from wrchart.transforms.decimation import (
+    lttb_downsample,
+    minmax_lttb_downsample,
+    ohlc_downsample,
+)
 from wrchart.transforms.heikin_ashi import to_heikin_ashi
 from wrchart.transforms.renko import to_renko
 from wrchart.transforms.kagi import to_kagi
 from wrchart.transforms.pnf import to_point_and_figure
 from wrchart.transforms.line_break import to_line_break
-from wrchart.transforms.range_bar import to_range_bars
+from wrchart.transforms.range_bar import to_range_bars, to_range_bars_multi
 
 __all__ = [
     "lttb_downsample",
+    "minmax_lttb_downsample",
+    "ohlc_downsample",
     "to_heikin_ashi",
     "to_renko",
     "to_kagi",
     "to_point_and_figure",
     "to_line_break",
     "to_range_bars",
+    "to_range_bars_multi",
 ]
@@ -0,0 +1,628 @@
+"""
+Compiled kernels for the sequential chart transforms.
+
+Heikin-Ashi, Renko, Kagi, Point & Figure, Line Break, Range Bars and
+LTTB are all recurrences where each output depends on the previous one,
+so they cannot be vectorized with Polars expressions. These kernels run the loops
+over contiguous float64 arrays and are compiled with Numba when it is
+available (see ``wrchart._jit``).
+
+Kernels never touch the time column. Instead they return the source row
+index of each output row, and the Python wrappers gather the times with
+Polars so the original dtype is preserved.
+"""
+
+import numpy as np
+import polars as pl
+
+from wrchart._jit import njit, prange
+
+
+@njit(cache=True)
+def heikin_ashi_kernel(o, h, l, c):
+    """
+    Compute Heikin-Ashi candles.
+
+    Args:
+        o, h, l, c: Open, high, low and close prices
+
+    Returns:
+        Tuple of (open, high, low, close) arrays
+    """
+    n = c.shape[0]
+    ha_open = np.empty(n)
+    ha_high = np.empty(n)
+    ha_low = np.empty(n)
+    ha_close = np.empty(n)
+
+    for i in range(n):
+        ha_close[i] = (o[i] + h[i] + l[i] + c[i]) / 4
+        if i == 0:
+            ha_open[i] = (o[i] + ha_close[i]) / 2
+        else:
+            ha_open[i] = (ha_open[i - 1] + ha_close[i - 1]) / 2
+        ha_high[i] = max(h[i], ha_open[i], ha_close[i])
+        ha_low[i] = min(l[i], ha_open[i], ha_close[i])
+
+    return ha_open, ha_high, ha_low, ha_close
+
+
+@njit(cache=True)
+def renko_kernel(highs, lows, base_price, brick_size, max_bricks):
+    """
+    Build Renko bricks from intrabar highs and lows.
+
+    Args:
+        highs: High prices (or closes)
+        lows: Low prices (or closes)
+        base_price: Starting price, already rounded to the brick grid
+        brick_size: Size of each brick
+        max_bricks: Maximum number of bricks to emit
+
+    Returns:
+        Tuple of (index, open, high, low, close) arrays
+    """
+    idx = np.empty(max_bricks, dtype=np.int64)
+    b_open = np.empty(max_bricks)
+    b_high = np.empty(max_bricks)
+    b_low = np.empty(max_bricks)
+    b_close = np.empty(max_bricks)
+    count = 0
+    last_direction = 0
+
+    for i in range(highs.shape[0]):
+        if count >= max_bricks:
+            break
+
+        # Order depends on last direction to handle reversals correctly
+        high_first = last_direction >= 0
+        for k in range(2):
+            if count >= max_bricks:
+                break
+            if high_first == (k == 0):
+                price = highs[i]
+            else:
+                price = lows[i]
+
+            # Upward bricks; reversal from down needs 2x brick size
+            while price - base_price >= brick_size and count < max_bricks:
+                if last_direction == -1 and price - base_price < brick_size * 2:
+                    break
+                brick_close = base_price + brick_size
+                idx[count] = i
+                b_open[count] = base_price
+                b_high[count] = brick_close
+                b_low[count] = base_price
+                b_close[count] = brick_close
+                count += 1
+                base_price = brick_close
+                last_direction = 1
+
+            # Downward bricks; reversal from up needs 2x brick size
+            while base_price - price >= brick_size and count < max_bricks:
+                if last_direction == 1 and base_price - price < brick_size * 2:
+                    break
+                brick_close = base_price - brick_size
+                idx[count] = i
+                b_open[count] = base_price
+                b_high[count] = base_price
+                b_low[count] = brick_close
+                b_close[count] = brick_close
+                count += 1
+                base_price = brick_close
+                last_direction = -1
+
+    return (
+        idx[:count],
+        b_open[:count],
+        b_high[:count],
+        b_low[:count],
+        b_close[:count],
+    )
+
+
+@njit(cache=True)
+def kagi_kernel(closes, reversal_amount, use_percentage):
+    """
+    Build Kagi lines from closing prices.
+
+    Args:
+        closes: Close prices (at least two)
+        reversal_amount: Reversal threshold
+        use_percentage: Treat reversal_amount as a fraction of price
+
+    Returns:
+        Tuple of (index, open, high, low, close, is_yang) arrays
+    """
+    n = closes.shape[0]
+    idx = np.empty(n, dtype=np.int64)
+    k_open = np.empty(n)
+    k_high = np.empty(n)
+    k_low = np.empty(n)
+    k_close = np.empty(n)
+    is_yang = np.empty(n, dtype=np.bool_)
+    count = 0
+
+    current_price = closes[0]
+    trend = 0  # 1 = up, -1 = down
+    line_start = current_price
+    prev_high = current_price
+    prev_low = current_price
+    yang = True  # Start bullish
+
+    for i in range(1, n):
+        price = closes[i]
+
+        if use_percentage:
+            threshold = current_price * reversal_amount
+        else:
+            threshold = reversal_amount
+
+        if trend == 0:
+            if price - current_price >= threshold:
+                trend = 1
+                line_start = current_price
+                current_price = price
+            elif current_price - price >= threshold:
+                trend = -1
+                line_start = current_price
+                current_price = price
+        elif trend == 1:
+            if price > current_price:
+                current_price = price
+                if price > prev_high:
+                    yang = True
+            elif current_price - price >= threshold:
+                idx[count] = i - 1
+                k_open[count] = line_start
+                k_high[count] = current_price
+                k_low[count] = line_start
+                k_close[count] = current_price
+                is_yang[count] = yang
+                count += 1
+                prev_high = max(prev_high, current_price)
+                line_start = current_price
+                current_price = price
+                trend = -1
+                if price < prev_low:
+                    yang = False
+        else:
+            if price < current_price:
+                current_price = price
+                if price < prev_low:
+                    yang = False
+            elif price - current_price >= threshold:
+                idx[count] = i - 1
+                k_open[count] = line_start
+                k_high[count] = line_start
+                k_low[count] = current_price
+                k_close[count] = current_price
+                is_yang[count] = yang
+                count += 1
+                prev_low = min(prev_low, current_price)
+                line_start = current_price
+                current_price = price
+                trend = 1
+                if price > prev_high:
+                    yang = True
+
+    # Final line
+    if trend != 0:
+        idx[count] = n - 1
+        k_open[count] = line_start
+        k_close[count] = current_price
+        is_yang[count] = yang
+        if trend == 1:
+            k_high[count] = current_price
+            k_low[count] = line_start
+        else:
+            k_high[count] = line_start
+            k_low[count] = current_price
+        count += 1
+
+    return (
+        idx[:count],
+        k_open[:count],
+        k_high[:count],
+        k_low[:count],
+        k_close[:count],
+        is_yang[:count],
+    )
+
+
+@njit(cache=True)
+def round_to_box(price, box_size, round_down):
+    """Round price to nearest box boundary."""
+    if round_down:
+        return (price // box_size) * box_size
+    return ((price + box_size - 0.0001) // box_size) * box_size
+
+
+@njit(cache=True)
+def pnf_kernel(highs, lows, box_size, reversal_boxes):
+    """
+    Build Point & Figure columns from highs and lows.
+
+    Args:
+        highs: High prices
+        lows: Low prices
+        box_size: Size of each box
+        reversal_boxes: Number of boxes required for a reversal
+
+    Returns:
+        Tuple of (index, is_x, low, high, boxes) arrays
+    """
+    n = highs.shape[0]
+    reversal_amount = box_size * reversal_boxes
+    idx = np.empty(n, dtype=np.int64)
+    is_x = np.empty(n, dtype=np.bool_)
+    c_low = np.empty(n)
+    c_high = np.empty(n)
+    boxes = np.empty(n, dtype=np.int64)
+    count = 0
+
+    current_high = round_to_box(highs[0], box_size, False)
+    current_low = round_to_box(lows[0], box_size, False)
+    column_type = 0  # 1 = X, -1 = O, 0 = undetermined
+    start = 0
+
+    for i in range(1, n):
+        high = highs[i]
+        low = lows[i]
+
+        if column_type == 0:
+            if high - current_low >= box_size:
+                column_type = 1
+                current_high = round_to_box(high, box_size, False)
+            elif current_high - low >= box_size:
+                column_type = -1
+                current_low = round_to_box(low, box_size, True)
+            continue
+
+        if column_type == 1:
+            if high > current_high:
+                current_high = round_to_box(high, box_size, False)
+            elif current_high - low >= reversal_amount:
+                idx[count] = start
+                is_x[count] = True
+                c_low[count] = current_low
+                c_high[count] = current_high
+                boxes[count] = int((current_high - current_low) / box_size)
+                count += 1
+                start = i
+                current_low = round_to_box(low, box_size, True)
+                # New column starts one box below the previous high
+                current_high = current_high - box_size
+                column_type = -1
+        else:
+            if low < current_low:
+                current_low = round_to_box(low, box_size, True)
+            elif high - current_low >= reversal_amount:
+                idx[count] = start
+                is_x[count] = False
+                c_low[count] = current_low
+                c_high[count] = current_high
+                boxes[count] = int((current_high - current_low) / box_size)
+                count += 1
+                start = i
+                current_high = round_to_box(high, box_size, False)
+                # New column starts one box above the previous low
+                current_low = current_low + box_size
+                column_type = 1
+
+    # Final column
+    if column_type != 0:
+        idx[count] = start
+        is_x[count] = column_type == 1
+        c_low[count] = current_low
+        c_high[count] = current_high
+        boxes[count] = max(1, int((current_high - current_low) / box_size))
+        count += 1
+
+    return idx[:count], is_x[:count], c_low[:count], c_high[:count], boxes[:count]
+
+
+@njit(cache=True)
+def line_break_kernel(closes, num_lines):
+    """
+    Build N-Line Break lines from closing prices.
+
+    Args:
+        closes: Close prices (at least two)
+        num_lines: Number of previous lines to check for reversal
+
+    Returns:
+        Tuple of (index, open, high, low, close, direction) arrays
+    """
+    n = closes.shape[0]
+    idx = np.empty(n, dtype=np.int64)
+    l_open = np.empty(n)
+    l_high = np.empty(n)
+    l_low = np.empty(n)
+    l_close = np.empty(n)
+    direction = np.empty(n, dtype=np.int64)
+
+    # First line
+    idx[0] = 1
+    l_open[0] = closes[0]
+    l_close[0] = closes[1]
+    l_high[0] = max(closes[0], closes[1])
+    l_low[0] = min(closes[0], closes[1])
+    direction[0] = 1 if closes[1] >= closes[0] else -1
+    count = 1
+
+    for i in range(2, n):
+        close = closes[i]
+
+        # High/low of the last num_lines lines
+        start = count - num_lines if 0 < num_lines <= count else 0
+        recent_high = l_high[start]
+        recent_low = l_low[start]
+        for j in range(start + 1, count):
+            if l_high[j] > recent_high:
+                recent_high = l_high[j]
+            if l_low[j] < recent_low:
+                recent_low = l_low[j]
+
+        last = count - 1
+        new_direction = 0
+        if direction[last] == 1:
+            if close > l_high[last]:
+                new_direction = 1
+            elif close < recent_low:
+                new_direction = -1
+        else:
+            if close < l_low[last]:
+                new_direction = -1
+            elif close > recent_high:
+                new_direction = 1
+
+        if new_direction != 0:
+            idx[count] = i
+            l_open[count] = l_close[last]
+            l_close[count] = close
+            if new_direction == 1:
+                l_high[count] = close
+                l_low[count] = l_close[last]
+            else:
+                l_high[count] = l_close[last]
+                l_low[count] = close
+            direction[count] = new_direction
+            count += 1
+
+    return (
+        idx[:count],
+        l_open[:count],
+        l_high[:count],
+        l_low[:count],
+        l_close[:count],
+        direction[:count],
+    )
+
+
+@njit(cache=True)
+def range_bar_kernel(highs, lows, range_size, max_bars):
+    """
+    Build range bars from highs and lows.
+
+    Args:
+        highs: High prices
+        lows: Low prices
+        range_size: Fixed range for each bar
+        max_bars: Maximum number of bars to emit
+
+    Returns:
+        Tuple of (index, open, high, low, close) arrays
+    """
+    idx = np.empty(max_bars, dtype=np.int64)
+    b_open = np.empty(max_bars)
+    b_high = np.empty(max_bars)
+    b_low = np.empty(max_bars)
+    b_close = np.empty(max_bars)
+    count = 0
+
+    # Initialize with first candle's midpoint
+    open_price = (highs[0] + lows[0]) / 2
+    range_high = open_price
+    range_low = open_price
+    start = 0
+
+    for i in range(highs.shape[0]):
+        if count >= max_bars:
+            break
+
+        if highs[i] > range_high:
+            range_high = highs[i]
+        if lows[i] < range_low:
+            range_low = lows[i]
+
+        while count < max_bars:
+            if range_high - open_price >= range_size:
+                bar_close = open_price + range_size
+                b_high[count] = bar_close
+                b_low[count] = open_price
+                range_high = max(range_high, bar_close)
+                range_low = bar_close
+            elif open_price - range_low >= range_size:
+                bar_close = open_price - range_size
+                b_high[count] = open_price
+                b_low[count] = bar_close
+                range_low = min(range_low, bar_close)
+                range_high = bar_close
+            else:
+                break
+            idx[count] = start
+            b_open[count] = open_price
+            b_close[count] = bar_close
+            count += 1
+            open_price = bar_close
+            start = i
+
+    return (
+        idx[:count],
+        b_open[:count],
+        b_high[:count],
+        b_low[:count],
+        b_close[:count],
+    )
+
+
+@njit(cache=True, parallel=True)
+def range_bar_multi_kernel(highs, lows, offsets, range_size, max_bars):
+    """
+    Build range bars for several symbols stored back to back.
+
+    Symbol s owns rows offsets[s]:offsets[s + 1]. Symbols are independent,
+    so they are processed in parallel, each writing into its own block of
+    max_bars output slots.
+
+    Args:
+        highs: High prices, grouped by symbol
+        lows: Low prices, grouped by symbol
+        offsets: Start row of each symbol, followed by the total row count
+        range_size: Fixed range for each bar
+        max_bars: Maximum number of bars to emit per symbol
+
+    Returns:
+        Tuple of (count, index, open, high, low, close) arrays. Symbol s
+        has count[s] bars at the start of block s; indices refer to rows
+        of the whole input.
+    """
+    n_symbols = offsets.shape[0] - 1
+    counts = np.zeros(n_symbols, dtype=np.int64)
+    idx = np.empty(n_symbols * max_bars, dtype=np.int64)
+    b_open = np.empty(n_symbols * max_bars)
+    b_high = np.empty(n_symbols * max_bars)
+    b_low = np.empty(n_symbols * max_bars)
+    b_close = np.empty(n_symbols * max_bars)
+
+    for s in prange(n_symbols):
+        start = offsets[s]
+        stop = offsets[s + 1]
+        s_idx, s_open, s_high, s_low, s_close = range_bar_kernel(
+            highs[start:stop], lows[start:stop], range_size, max_bars
+        )
+        count = s_idx.shape[0]
+        block = s * max_bars
+        idx[block:block + count] = s_idx + start
+        b_open[block:block + count] = s_open
+        b_high[block:block + count] = s_high
+        b_low[block:block + count] = s_low
+        b_close[block:block + count] = s_close
+        counts[s] = count
+
+    return counts, idx, b_open, b_high, b_low, b_close
+
+
+@njit(cache=True)
+def lttb_kernel(times, values, target_points):
+    """
+    Select LTTB points.
+
+    Sequential, since each bucket's choice depends on the previous pick.
+
+    Args:
+        times: Time values
+        values: Data values
+        target_points: Number of points to select (less than len(times))
+
+    Returns:
+        Indices of the selected points
+    """
+    n = times.shape[0]
+    selected = np.empty(target_points, dtype=np.int64)
+
+    # Always keep first and last points
+    selected[0] = 0
+    selected[target_points - 1] = n - 1
+
+    # Bucket size
+    bucket_size = (n - 2) / (target_points - 2)
+
+    # Previous selected point
+    prev_idx = 0
+
+    for i in range(target_points - 2):
+        # Current bucket bounds
+        bucket_start = int((i + 1) * bucket_size) + 1
+        bucket_end = min(int((i + 2) * bucket_size) + 1, n - 1)
+
+        # Next bucket average (for triangle calculation)
+        next_bucket_start = bucket_end
+        next_bucket_end = min(int((i + 3) * bucket_size) + 1, n)
+
+        if next_bucket_start < next_bucket_end:
+            avg_time = times[next_bucket_start:next_bucket_end].mean()
+            avg_value = values[next_bucket_start:next_bucket_end].mean()
+        else:
+            avg_time = times[n - 1]
+            avg_value = values[n - 1]
+
+        # Find point in current bucket that forms largest triangle
+        max_area = -1.0
+        max_idx = bucket_start
+
+        prev_time = times[prev_idx]
+        prev_value = values[prev_idx]
+
+        for j in range(bucket_start, bucket_end):
+            # Triangle area calculation (simplified, no sqrt needed for comparison)
+            area = abs(
+                (prev_time - avg_time) * (values[j] - prev_value)
+                - (prev_time - times[j]) * (avg_value - prev_value)
+            )
+
+            if area > max_area:
+                max_area = area
+                max_idx = j
+
+        selected[i + 1] = max_idx
+        prev_idx = max_idx
+
+    return selected
+
+
+@njit(cache=True, parallel=True)
+def minmax_indices(values, n_buckets):
+    """
+    Return the indices of the min and max of each equal-width bucket.
+
+    Buckets are independent, so they are processed in parallel.
+    """
+    n = values.shape[0]
+    out = np.empty(2 * n_buckets, dtype=np.int64)
+    bucket_size = n / n_buckets
+
+    for b in prange(n_buckets):
+        start = int(b * bucket_size)
+        end = min(int((b + 1) * bucket_size), n)
+        min_idx = start
+        max_idx = start
+        for j in range(start + 1, end):
+            if values[j] < values[min_idx]:
+                min_idx = j
+            elif values[j] > values[max_idx]:
+                max_idx = j
+        # Keep time order within the bucket
+        out[2 * b] = min(min_idx, max_idx)
+        out[2 * b + 1] = max(min_idx, max_idx)
+
+    return out
+
+
+def as_float_array(series: pl.Series) -> np.ndarray:
+    """Convert a Polars Series to a contiguous float64 array for the kernels."""
+    return np.ascontiguousarray(series.cast(pl.Float64).to_numpy())
+
+
+def empty_ohlc(time_dtype: pl.DataType) -> pl.DataFrame:
+    """Zero-row OHLC frame with the dtypes the bar transforms produce."""
+    return pl.DataFrame(
+        schema={
+            "time": time_dtype,
+            "open": pl.Float64,
+            "high": pl.Float64,
+            "low": pl.Float64,
+            "close": pl.Float64,
+        }
+    )
@@ -2,12 +2,16 @@
 Data decimation algorithms for high-frequency data visualization.
 
 LTTB (Largest Triangle Three Buckets) preserves visual shape while
-dramatically reducing point count.
+dramatically reducing point count. MinMax-LTTB adds a parallel MinMax
+preselection pass in front of LTTB for very large series. OHLC
+downsampling merges runs of consecutive bars into one bar each.
 """
 
 import polars as pl
 import numpy as np
-from typing import Optional
+from typing import List, Optional, Tuple
+
+from wrchart.transforms._numba_kernels import lttb_kernel, minmax_indices
 
 
 def lttb_downsample(
@@ -56,13 +60,7 @@ def lttb_downsample(
     if n <= target_points:
         return df
 
-    # Extract numpy arrays for fast processing
-    times = df[time_col].to_numpy()
-    values = df[value_col].to_numpy()
-
-    # Handle datetime conversion
-    if df[time_col].dtype == pl.Datetime:
-        times = times.astype(np.int64)
+    times, values = _as_xy(df, time_col, value_col)
 
     # LTTB algorithm
     selected_indices = _lttb_indices(times, values, target_points)
@@ -71,77 +69,157 @@ def lttb_downsample(
     return df[selected_indices]
 
 
-def _lttb_indices(
-    times: np.ndarray, values: np.ndarray, target_points: int
-) -> np.ndarray:
+def minmax_lttb_downsample(
+    df: pl.DataFrame,
+    time_col: str = "time",
+    value_col: str = "value",
+    target_points: int = 1000,
+    minmax_ratio: int = 4,
+) -> pl.DataFrame:
     """
-    Core LTTB algorithm returning indices of selected points.
+    Downsample time series data using MinMax-LTTB.
+
+    A two-stage variant of LTTB for very large series. A parallel MinMax
+    pass first keeps the minimum and maximum of each bucket, reducing the
+    data to about ``target_points * minmax_ratio`` candidates. LTTB then
+    runs on those candidates only. The result is visually very close to
+    plain LTTB at a fraction of the cost.
 
     Args:
-        times: Array of time values
-        values: Array of data values
-        target_points: Number of points to select
+        df: Polars DataFrame with time and value columns
+        time_col: Name of the time column
+        value_col: Name of the value column
+        target_points: Desired number of output points
+        minmax_ratio: Candidates kept per output point in the MinMax pass
 
     Returns:
-        Array of indices to keep
+        Downsampled DataFrame with same columns
+
+    Example:
+        >>> import wrchart as wrc
+        >>> display_data = wrc.minmax_lttb_downsample(ticks, "time", "price", 2000)
     """
-    n = len(times)
+    n = len(df)
+    n_candidates = target_points * minmax_ratio
 
     if n <= target_points:
-        return np.arange(n)
+        return df
+    if n <= n_candidates:
+        return lttb_downsample(df, time_col, value_col, target_points)
+
+    times, values = _as_xy(df, time_col, value_col)
+
+    # MinMax preselection on the interior, always keeping the endpoints
+    interior = minmax_indices(values[1:-1], n_candidates // 2) + 1
+    candidates = np.unique(np.concatenate(([0], interior, [n - 1])))
+
+    selected = _lttb_indices(times[candidates], values[candidates], target_points)
+
+    return df[candidates[selected]]
+
 
-    # Always keep first and last points
-    selected = [0]
+def ohlc_downsample(
+    df: pl.DataFrame,
+    time_col: str = "time",
+    open_col: str = "open",
+    high_col: str = "high",
+    low_col: str = "low",
+    close_col: str = "close",
+    target_bars: int = 1000,
+    volume_col: Optional[str] = None,
+) -> pl.DataFrame:
+    """
+    Downsample OHLC bars by merging consecutive bars.
 
-    # Bucket size
-    bucket_size = (n - 2) / (target_points - 2)
+    The rows are split into ``target_bars`` runs of (nearly) equal length.
+    Each run becomes one bar with the first time and open, the highest
+    high, the lowest low and the last close, so every price the original
+    bars reached is still covered. Volume is summed; any other column
+    keeps its last value.
 
-    # Previous selected point
-    prev_idx = 0
+    Args:
+        df: Polars DataFrame with OHLC data, sorted by time
+        time_col: Name of the time column
+        open_col: Name of the open column
+        high_col: Name of the high column
+        low_col: Name of the low column
+        close_col: Name of the close column
+        target_bars: Number of output bars
+        volume_col: Name of the volume column (optional)
 
-    for i in range(target_points - 2):
-        # Current bucket bounds
-        bucket_start = int((i + 1) * bucket_size) + 1
-        bucket_end = int((i + 2) * bucket_size) + 1
-        bucket_end = min(bucket_end, n - 1)
+    Returns:
+        Downsampled DataFrame with same columns
 
-        # Next bucket average (for triangle calculation)
-        next_bucket_start = bucket_end
-        next_bucket_end = int((i + 3) * bucket_size) + 1
-        next_bucket_end = min(next_bucket_end, n)
+    Example:
+        >>> import wrchart as wrc
+        >>> display_data = wrc.ohlc_downsample(minute_bars, target_bars=800)
+    """
+    if len(df) <= target_bars:
+        return df
+
+    aggs = {
+        time_col: pl.col(time_col).first(),
+        open_col: pl.col(open_col).first(),
+        high_col: pl.col(high_col).max(),
+        low_col: pl.col(low_col).min(),
+        close_col: pl.col(close_col).last(),
+    }
+    if volume_col is not None:
+        aggs[volume_col] = pl.col(volume_col).sum()
+    return _aggregate_runs(df, target_bars, [
+        aggs.get(name, pl.col(name).last()) for name in df.columns
+    ])
+
+
+def _aggregate_runs(
+    df: pl.DataFrame, n_runs: int, exprs: List[pl.Expr]
+) -> pl.DataFrame:
+    """
+    Aggregate consecutive rows into ``n_runs`` groups of (nearly) equal size.
+
+    The grouping depends only on the row count, so frames of the same
+    length (such as candles and their volume bars) are cut identically.
+    """
+    n = len(df)
+    run = pl.Series("_run", np.arange(n, dtype=np.int64) * n_runs // n)
+    return (
+        df.with_columns(run)
+        .group_by("_run", maintain_order=True)
+        .agg(exprs)
+        .drop("_run")
+    )
 
-        if next_bucket_start < next_bucket_end:
-            avg_time = np.mean(times[next_bucket_start:next_bucket_end])
-            avg_value = np.mean(values[next_bucket_start:next_bucket_end])
-        else:
-            avg_time = times[-1]
-            avg_value = values[-1]
 
-        # Find point in current bucket that forms largest triangle
-        max_area = -1
-        max_idx = bucket_start
+def _as_xy(
+    df: pl.DataFrame, time_col: str, value_col: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Extract contiguous float64 time and value arrays for the kernels."""
+    # Temporal columns are compared on their integer representation
+    times = df[time_col].to_physical().cast(pl.Float64).to_numpy()
+    values = df[value_col].cast(pl.Float64).to_numpy()
+    return np.ascontiguousarray(times), np.ascontiguousarray(values)
 
-        prev_time = times[prev_idx]
-        prev_value = values[prev_idx]
 
-        for j in range(bucket_start, bucket_end):
-            # Triangle area calculation (simplified, no sqrt needed for comparison)
-            area = abs(
-                (prev_time - avg_time) * (values[j] - prev_value)
-                - (prev_time - times[j]) * (avg_value - prev_value)
-            )
+def _lttb_indices(
+    times: np.ndarray, values: np.ndarray, target_points: int
+) -> np.ndarray:
+    """
+    Core LTTB algorithm returning indices of selected points.
 
-            if area > max_area:
-                max_area = area
-                max_idx = j
+    Args:
+        times: Array of time values
+        values: Array of data values
+        target_points: Number of points to select
 
-        selected.append(max_idx)
-        prev_idx = max_idx
+    Returns:
+        Array of indices to keep
+    """
+    n = len(times)
 
-    # Always include last point
-    selected.append(n - 1)
+    if n <= target_points:
+        return np.arange(n)
 
-    return np.array(selected)
+    return lttb_kernel(times, values, int(target_points))
 
 
 def adaptive_downsample(
@@ -5,8 +5,10 @@ Kagi charts focus on significant price movements, changing direction
 only when price reverses by a specified amount.
 """
 
+import numpy as np
 import polars as pl
-from typing import Optional, List, Dict, Any
+
+from wrchart.transforms._numba_kernels import as_float_array, kagi_kernel
 
 
 def to_kagi(
@@ -47,8 +49,8 @@ def to_kagi(
         >>> # Reverse on 4% movement
         >>> kagi = wrc.to_kagi(price_data, reversal_amount=0.04, use_percentage=True)
     """
-    closes = df[close_col].to_list()
-    times = df[time_col].to_list()
+    times = df[time_col]
+    closes = as_float_array(df[close_col])
 
     if len(closes) < 2:
         return pl.DataFrame(
@@ -62,119 +64,30 @@ def to_kagi(
             }
         )
 
-    lines: List[Dict[str, Any]] = []
-
-    # Initialize
-    current_price = closes[0]
-    trend = 0  # 1 = up, -1 = down
-    line_start = current_price
-    prev_high = current_price
-    prev_low = current_price
-    line_type = "yang"  # Start bullish
-
-    for i in range(1, len(closes)):
-        price = closes[i]
-
-        # Calculate reversal threshold
-        if use_percentage:
-            threshold = current_price * reversal_amount
-        else:
-            threshold = reversal_amount
-
-        if trend == 0:
-            # Determine initial trend
-            if price - current_price >= threshold:
-                trend = 1
-                line_start = current_price
-                current_price = price
-            elif current_price - price >= threshold:
-                trend = -1
-                line_start = current_price
-                current_price = price
-        elif trend == 1:  # Uptrend
-            if price > current_price:
-                # Continue up
-                current_price = price
-                if price > prev_high:
-                    line_type = "yang"  # Break above previous high
-            elif current_price - price >= threshold:
-                # Reversal down
-                lines.append(
-                    {
-                        "time": times[i - 1],
-                        "open": line_start,
-                        "high": current_price,
-                        "low": line_start,
-                        "close": current_price,
-                        "line_type": line_type,
-                    }
-                )
-                prev_high = max(prev_high, current_price)
-                line_start = current_price
-                current_price = price
-                trend = -1
-                if price < prev_low:
-                    line_type = "yin"  # Break below previous low
-        else:  # Downtrend
-            if price < current_price:
-                # Continue down
-                current_price = price
-                if price < prev_low:
-                    line_type = "yin"  # Break below previous low
-            elif price - current_price >= threshold:
-                # Reversal up
-                lines.append(
-                    {
-                        "time": times[i - 1],
-                        "open": line_start,
-                        "high": line_start,
-                        "low": current_price,
-                        "close": current_price,
-                        "line_type": line_type,
-                    }
-                )
-                prev_low = min(prev_low, current_price)
-                line_start = current_price
-                current_price = price
-                trend = 1
-                if price > prev_high:
-                    line_type = "yang"  # Break above previous high
-
-    # Add final line
-    if trend == 1:
-        lines.append(
-            {
-                "time": times[-1],
-                "open": line_start,
-                "high": current_price,
-                "low": line_start,
-                "close": current_price,
-                "line_type": line_type,
-            }
-        )
-    elif trend == -1:
-        lines.append(
-            {
-                "time": times[-1],
-                "open": line_start,
-                "high": line_start,
-                "low": current_price,
-                "close": current_price,
-                "line_type": line_type,
-            }
-        )
+    idx, opens, highs, lows, line_closes, is_yang = kagi_kernel(
+        closes, float(reversal_amount), bool(use_percentage)
+    )
 
-    if not lines:
+    if len(idx) == 0:
         # No significant movement
         return pl.DataFrame(
             {
-                "time": [times[-1]],
+                "time": times[-1:],
                 "open": [closes[0]],
-                "high": [max(closes)],
-                "low": [min(closes)],
+                "high": [closes.max()],
+                "low": [closes.min()],
                 "close": [closes[-1]],
                 "line_type": ["yang"],
             }
         )
 
-    return pl.DataFrame(lines)
+    return pl.DataFrame(
+        {
+            "time": times.gather(idx),
+            "open": opens,
+            "high": highs,
+            "low": lows,
+            "close": line_closes,
+            "line_type": np.where(is_yang, "yang", "yin"),
+        }
+    )
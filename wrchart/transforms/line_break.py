@@ -6,7 +6,8 @@ ignoring time.
 """
 
 import polars as pl
-from typing import List, Dict, Any
+
+from wrchart.transforms._numba_kernels import as_float_array, line_break_kernel
 
 
 def to_line_break(
@@ -45,8 +46,8 @@ def to_line_break(
         >>> # 2-line break (more sensitive)
         >>> lb = wrc.to_line_break(price_data, num_lines=2)
     """
-    closes = df[close_col].to_list()
-    times = df[time_col].to_list()
+    times = df[time_col]
+    closes = as_float_array(df[close_col])
 
     if len(closes) < 2:
         return pl.DataFrame(
@@ -60,82 +61,17 @@ def to_line_break(
             }
         )
 
-    lines: List[Dict[str, Any]] = []
-
-    # First line
-    first_open = closes[0]
-    first_close = closes[1] if len(closes) > 1 else closes[0]
-    first_direction = 1 if first_close >= first_open else -1
+    idx, opens, highs, lows, line_closes, direction = line_break_kernel(
+        closes, int(num_lines)
+    )
 
-    lines.append(
+    return pl.DataFrame(
         {
-            "time": times[1] if len(times) > 1 else times[0],
-            "open": first_open,
-            "high": max(first_open, first_close),
-            "low": min(first_open, first_close),
-            "close": first_close,
-            "direction": first_direction,
+            "time": times.gather(idx),
+            "open": opens,
+            "high": highs,
+            "low": lows,
+            "close": line_closes,
+            "direction": direction,
         }
     )
-
-    for i in range(2, len(closes)):
-        close = closes[i]
-        time = times[i]
-
-        # Get the high/low of the last num_lines lines
-        lookback = lines[-num_lines:] if len(lines) >= num_lines else lines
-        recent_high = max(line["high"] for line in lookback)
-        recent_low = min(line["low"] for line in lookback)
-
-        last_line = lines[-1]
-        current_direction = last_line["direction"]
-
-        new_line = None
-
-        if current_direction == 1:  # Currently in uptrend
-            if close > last_line["high"]:
-                # Continue up - new white line
-                new_line = {
-                    "time": time,
-                    "open": last_line["close"],
-                    "high": close,
-                    "low": last_line["close"],
-                    "close": close,
-                    "direction": 1,
-                }
-            elif close < recent_low:
-                # Reversal down - new black line
-                new_line = {
-                    "time": time,
-                    "open": last_line["close"],
-                    "high": last_line["close"],
-                    "low": close,
-                    "close": close,
-                    "direction": -1,
-                }
-        else:  # Currently in downtrend
-            if close < last_line["low"]:
-                # Continue down - new black line
-                new_line = {
-                    "time": time,
-                    "open": last_line["close"],
-                    "high": last_line["close"],
-                    "low": close,
-                    "close": close,
-                    "direction": -1,
-                }
-            elif close > recent_high:
-                # Reversal up - new white line
-                new_line = {
-                    "time": time,
-                    "open": last_line["close"],
-                    "high": close,
-                    "low": last_line["close"],
-                    "close": close,
-                    "direction": 1,
-                }
-
-        if new_line:
-            lines.append(new_line)
-
-    return pl.DataFrame(lines)
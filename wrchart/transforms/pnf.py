@@ -5,8 +5,10 @@ P&F charts use X's and O's to show price movements,
 ignoring time completely.
 """
 
+import numpy as np
 import polars as pl
-from typing import List, Dict, Any
+
+from wrchart.transforms._numba_kernels import as_float_array, pnf_kernel, round_to_box
 
 
 def to_point_and_figure(
@@ -56,9 +58,8 @@ def to_point_and_figure(
         >>> # $1 box size, 3-box reversal
         >>> pnf = wrc.to_point_and_figure(ohlc_data, box_size=1.0, reversal_boxes=3)
     """
-    highs = df[high_col].to_list()
-    lows = df[low_col].to_list()
-    times = df[time_col].to_list()
+    highs = as_float_array(df[high_col])
+    lows = as_float_array(df[low_col])
 
     if len(highs) == 0:
         return pl.DataFrame(
@@ -72,112 +73,35 @@ def to_point_and_figure(
             }
         )
 
-    reversal_amount = box_size * reversal_boxes
-
-    columns: List[Dict[str, Any]] = []
-    column_index = 0
-
-    # Initialize with first data point
-    current_high = _round_to_box(highs[0], box_size)
-    current_low = _round_to_box(lows[0], box_size)
-    column_type = None  # Will be determined by first movement
-    column_start_time = times[0]
-
-    for i in range(1, len(highs)):
-        high = highs[i]
-        low = lows[i]
-        time = times[i]
-
-        if column_type is None:
-            # Determine initial direction
-            if high - current_low >= box_size:
-                column_type = "X"
-                current_high = _round_to_box(high, box_size)
-            elif current_high - low >= box_size:
-                column_type = "O"
-                current_low = _round_to_box(low, box_size, round_down=True)
-            continue
-
-        if column_type == "X":
-            # In an X column (rising)
-            if high > current_high:
-                # Continue rising
-                current_high = _round_to_box(high, box_size)
-            elif current_high - low >= reversal_amount:
-                # Reversal to O column
-                columns.append(
-                    {
-                        "time": column_start_time,
-                        "column_index": column_index,
-                        "column_type": "X",
-                        "low": current_low,
-                        "high": current_high,
-                        "boxes": int((current_high - current_low) / box_size),
-                    }
-                )
-                column_index += 1
-                column_start_time = time
-                current_low = _round_to_box(low, box_size, round_down=True)
-                # New column starts one box below the previous high
-                current_high = current_high - box_size
-                column_type = "O"
-
-        else:  # column_type == 'O'
-            # In an O column (falling)
-            if low < current_low:
-                # Continue falling
-                current_low = _round_to_box(low, box_size, round_down=True)
-            elif high - current_low >= reversal_amount:
-                # Reversal to X column
-                columns.append(
-                    {
-                        "time": column_start_time,
-                        "column_index": column_index,
-                        "column_type": "O",
-                        "low": current_low,
-                        "high": current_high,
-                        "boxes": int((current_high - current_low) / box_size),
-                    }
-                )
-                column_index += 1
-                column_start_time = time
-                current_high = _round_to_box(high, box_size)
-                # New column starts one box above the previous low
-                current_low = current_low + box_size
-                column_type = "X"
-
-    # Add final column
-    if column_type is not None:
-        columns.append(
-            {
-                "time": column_start_time,
-                "column_index": column_index,
-                "column_type": column_type,
-                "low": current_low,
-                "high": current_high,
-                "boxes": max(1, int((current_high - current_low) / box_size)),
-            }
-        )
+    idx, is_x, col_lows, col_highs, boxes = pnf_kernel(
+        highs, lows, float(box_size), int(reversal_boxes)
+    )
 
-    if not columns:
+    if len(idx) == 0:
         # Not enough movement for any columns
         return pl.DataFrame(
             {
-                "time": [times[0]],
+                "time": df[time_col][:1],
                 "column_index": [0],
                 "column_type": ["X"],
-                "low": [_round_to_box(min(lows), box_size, round_down=True)],
-                "high": [_round_to_box(max(highs), box_size)],
+                "low": [_round_to_box(lows.min(), box_size, round_down=True)],
+                "high": [_round_to_box(highs.max(), box_size)],
                 "boxes": [1],
             }
         )
 
-    return pl.DataFrame(columns)
+    return pl.DataFrame(
+        {
+            "time": df[time_col].gather(idx),
+            "column_index": np.arange(len(idx)),
+            "column_type": np.where(is_x, "X", "O"),
+            "low": col_lows,
+            "high": col_highs,
+            "boxes": boxes,
+        }
+    )
 
 
 def _round_to_box(price: float, box_size: float, round_down: bool = False) -> float:
     """Round price to nearest box boundary."""
-    if round_down:
-        return (price // box_size) * box_size
-    else:
-        return ((price + box_size - 0.0001) // box_size) * box_size
+    return round_to_box(float(price), float(box_size), round_down)
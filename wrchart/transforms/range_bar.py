@@ -5,8 +5,15 @@ Range bars create new bars based on price range, not time.
 Each bar has the same high-low range.
 """
 
+import numpy as np
 import polars as pl
-from typing import List, Dict, Any
+
+from wrchart.transforms._numba_kernels import (
+    as_float_array,
+    empty_ohlc,
+    range_bar_kernel,
+    range_bar_multi_kernel,
+)
 
 
 def to_range_bars(
@@ -47,79 +54,94 @@ def to_range_bars(
         >>> # $2 range bars
         >>> rb = wrc.to_range_bars(ohlc_data, range_size=2.0)
     """
-    highs = df[high_col].to_list()
-    lows = df[low_col].to_list()
-    times = df[time_col].to_list()
+    highs = as_float_array(df[high_col])
+    lows = as_float_array(df[low_col])
 
     if len(highs) == 0:
-        return pl.DataFrame(
-            {"time": [], "open": [], "high": [], "low": [], "close": []}
-        )
+        return empty_ohlc(df[time_col].dtype)
 
-    bars: List[Dict[str, Any]] = []
     max_bars = 500  # Safety limit
+    idx, opens, highs_out, lows_out, closes = range_bar_kernel(
+        highs, lows, float(range_size), max_bars
+    )
+
+    return pl.DataFrame(
+        {
+            "time": df[time_col].gather(idx),
+            "open": opens,
+            "high": highs_out,
+            "low": lows_out,
+            "close": closes,
+        }
+    )
+
+
+def to_range_bars_multi(
+    df: pl.DataFrame,
+    range_size: float,
+    symbol_col: str = "symbol",
+    time_col: str = "time",
+    high_col: str = "high",
+    low_col: str = "low",
+) -> pl.DataFrame:
+    """
+    Convert OHLC data for several symbols to Range Bars.
+
+    Equivalent to calling to_range_bars on each symbol's rows, but the
+    symbols are processed in parallel in one compiled call. Rows keep
+    their order within each symbol.
+
+    Args:
+        df: Polars DataFrame with OHLC data for one or more symbols
+        range_size: Fixed range for each bar
+        symbol_col: Name of the column identifying the symbol
+        time_col: Name of time column
+        high_col: Name of high price column
+        low_col: Name of low price column
 
-    # Initialize with first candle's midpoint
-    open_price = (highs[0] + lows[0]) / 2
-    range_high = open_price
-    range_low = open_price
-    bar_start_time = times[0]
-
-    for i in range(len(highs)):
-        if len(bars) >= max_bars:
-            break
-
-        high = highs[i]
-        low = lows[i]
-        time = times[i]
-
-        # Update range tracking
-        if high > range_high:
-            range_high = high
-        if low < range_low:
-            range_low = low
-
-        # Keep creating bars while conditions are met
-        bars_created = True
-        while bars_created and len(bars) < max_bars:
-            bars_created = False
-
-            # Check for up bar: high moved enough from open
-            if range_high - open_price >= range_size:
-                bar_close = open_price + range_size
-                bars.append({
-                    "time": bar_start_time,
-                    "open": open_price,
-                    "high": bar_close,
-                    "low": open_price,
-                    "close": bar_close,
-                })
-                open_price = bar_close
-                range_high = max(range_high, bar_close)
-                range_low = bar_close
-                bar_start_time = time
-                bars_created = True
-
-            # Check for down bar: low moved enough from open
-            elif open_price - range_low >= range_size:
-                bar_close = open_price - range_size
-                bars.append({
-                    "time": bar_start_time,
-                    "open": open_price,
-                    "high": open_price,
-                    "low": bar_close,
-                    "close": bar_close,
-                })
-                open_price = bar_close
-                range_low = min(range_low, bar_close)
-                range_high = bar_close
-                bar_start_time = time
-                bars_created = True
-
-    if not bars:
-        # Not enough movement, return empty with proper schema
-        return pl.DataFrame(
-            {"time": [], "open": [], "high": [], "low": [], "close": []}
-        ).cast({"time": df[time_col].dtype})
-
-    return pl.DataFrame(bars)
+    Returns:
+        DataFrame with Range Bar data (symbol, time, open, high, low,
+        close), grouped by symbol in order of first appearance
+
+    Example:
+        >>> import wrchart as wrc
+        >>> rb = wrc.to_range_bars_multi(quotes, range_size=2.0, symbol_col="ticker")
+    """
+    if len(df) == 0:
+        empty = empty_ohlc(df[time_col].dtype)
+        return df[symbol_col].clear().to_frame().hstack(empty)
+
+    # Source rows of each symbol, in order; the kernel sees the prices
+    # regrouped so that every symbol is one contiguous block
+    groups = (
+        df.select(symbol_col)
+        .with_columns(pl.Series("_row", np.arange(len(df))))
+        .group_by(symbol_col, maintain_order=True)
+        .agg(pl.col("_row"))
+        .get_column("_row")
+    )
+    rows = groups.explode().to_numpy()
+    offsets = np.zeros(len(groups) + 1, dtype=np.int64)
+    np.cumsum(groups.list.len().to_numpy(), out=offsets[1:])
+
+    max_bars = 500  # Safety limit per symbol, as in to_range_bars
+    counts, idx, opens, highs_out, lows_out, closes = range_bar_multi_kernel(
+        as_float_array(df[high_col])[rows],
+        as_float_array(df[low_col])[rows],
+        offsets,
+        float(range_size),
+        max_bars,
+    )
+    keep = (np.arange(max_bars) < counts[:, None]).ravel()
+    idx = rows[idx[keep]]
+
+    return pl.DataFrame(
+        {
+            symbol_col: df[symbol_col].gather(idx),
+            "time": df[time_col].gather(idx),
+            "open": opens[keep],
+            "high": highs_out[keep],
+            "low": lows_out[keep],
+            "close": closes[keep],
+        }
+    )
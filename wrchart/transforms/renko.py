@@ -8,6 +8,8 @@ Each brick represents a fixed price movement.
 import polars as pl
 from typing import Optional
 
+from wrchart.transforms._numba_kernels import as_float_array, empty_ohlc, renko_kernel
+
 
 def to_renko(
     df: pl.DataFrame,
@@ -55,99 +57,33 @@ def to_renko(
     if use_atr and high_col and low_col:
         brick_size = _calculate_atr_brick_size(df, high_col, low_col, close_col, atr_period)
 
-    times = df[time_col].to_list()
-
     # Use high/low if available, otherwise fall back to close
     use_hl = high_col in df.columns and low_col in df.columns
     if use_hl:
-        highs = df[high_col].to_list()
-        lows = df[low_col].to_list()
+        highs = as_float_array(df[high_col])
+        lows = as_float_array(df[low_col])
     else:
-        closes = df[close_col].to_list()
-        highs = closes
-        lows = closes
+        highs = lows = as_float_array(df[close_col])
 
-    if len(times) == 0:
-        return pl.DataFrame(
-            {"time": [], "open": [], "high": [], "low": [], "close": []}
-        )
+    if len(highs) == 0:
+        return empty_ohlc(df[time_col].dtype)
 
-    # Initialize with first price
+    # Initialize with first price, rounded to nearest brick
     first_price = (highs[0] + lows[0]) / 2 if use_hl else highs[0]
-    # Round to nearest brick
     base_price = round(first_price / brick_size) * brick_size
 
-    bricks = []
-    brick_times = []
-    last_direction = 0  # 1 for up, -1 for down, 0 for initial
     max_bricks = 500  # Safety limit
-
-    for i in range(len(times)):
-        if len(bricks) >= max_bricks:
-            break
-
-        # Process both high and low to catch intraday moves
-        # Order depends on last direction to handle reversals correctly
-        if last_direction >= 0:
-            prices_to_check = [highs[i], lows[i]]
-        else:
-            prices_to_check = [lows[i], highs[i]]
-
-        for price in prices_to_check:
-            if len(bricks) >= max_bricks:
-                break
-
-            # Check for upward bricks
-            while price - base_price >= brick_size and len(bricks) < max_bricks:
-                # Reversal check: need 2x brick size for reversal from down
-                if last_direction == -1 and price - base_price < brick_size * 2:
-                    break
-
-                brick_open = base_price
-                brick_close = base_price + brick_size
-
-                bricks.append({
-                    "open": brick_open,
-                    "close": brick_close,
-                    "high": brick_close,
-                    "low": brick_open,
-                })
-                brick_times.append(times[i])
-                base_price = brick_close
-                last_direction = 1
-
-            # Check for downward bricks
-            while base_price - price >= brick_size and len(bricks) < max_bricks:
-                # Reversal check: need 2x brick size for reversal from up
-                if last_direction == 1 and base_price - price < brick_size * 2:
-                    break
-
-                brick_open = base_price
-                brick_close = base_price - brick_size
-
-                bricks.append({
-                    "open": brick_open,
-                    "close": brick_close,
-                    "high": brick_open,
-                    "low": brick_close,
-                })
-                brick_times.append(times[i])
-                base_price = brick_close
-                last_direction = -1
-
-    if not bricks:
-        # No bricks formed, return empty DataFrame with proper schema
-        return pl.DataFrame(
-            {"time": [], "open": [], "high": [], "low": [], "close": []}
-        ).cast({"time": df[time_col].dtype})
+    idx, opens, highs_out, lows_out, closes = renko_kernel(
+        highs, lows, float(base_price), float(brick_size), max_bricks
+    )
 
     return pl.DataFrame(
         {
-            "time": brick_times,
-            "open": [b["open"] for b in bricks],
-            "high": [b["high"] for b in bricks],
-            "low": [b["low"] for b in bricks],
-            "close": [b["close"] for b in bricks],
+            "time": df[time_col].gather(idx),
+            "open": opens,
+            "high": highs_out,
+            "low": lows_out,
+            "close": closes,
         }
     )
 
@@ -159,17 +95,24 @@ def _calculate_atr_brick_size(
     close_col: str,
     period: int,
 ) -> float:
-    """Calculate ATR-based brick size."""
+    """Calculate the brick size as the latest ATR (Wilder's smoothing)."""
+    if df.height == 0:
+        return 1.0
+
+    high = pl.col(high_col)
+    low = pl.col(low_col)
+    prev_close = pl.col(close_col).shift(1)
+
     # True Range = max(High - Low, |High - Prev Close|, |Low - Prev Close|)
-    tr = df.select(
-        [
-            pl.col(high_col) - pl.col(low_col),
-            (pl.col(high_col) - pl.col(close_col).shift(1)).abs(),
-            (pl.col(low_col) - pl.col(close_col).shift(1)).abs(),
-        ]
-    ).select(pl.max_horizontal(pl.all()))
-
-    # ATR = rolling mean of TR
-    atr = tr.to_series().rolling_mean(period).mean()
+    tr = pl.max_horizontal(
+        high - low, (high - prev_close).abs(), (low - prev_close).abs()
+    )
+    atr = (
+        df.lazy()
+        .select(tr.ewm_mean(alpha=1.0 / period, adjust=False).alias("atr"))
+        .tail(1)
+        .collect()
+        .item()
+    )
 
     return atr if atr and atr > 0 else 1.0